@@ -5,70 +5,737 @@ This module automates the application submission process.
 """
 
 import os
+import json
 import time
+import mimetypes
+import math
+import random
+import shutil
+import threading
+import atexit
 import multiprocessing
-from typing import Dict, Any, Optional
+import multiprocessing.util
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional, List, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 from pathlib import Path
 
 from loguru import logger
-from playwright.sync_api import sync_playwright, Page, Browser
+# Only the exception types are needed at import time; the browser itself is started lazily in _worker_init
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PwTimeout
 
 # Get settings
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from config import Settings
-from browser.wttj_scraper import WTTJScraper
+from browser import wttj_selectors
 
+# Playwright is only imported for annotations here; worker processes import it when they start a browser
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Locator, Page
 
-def _handle_job_search_404(page: Page, job_url: str) -> bool:
+# Budget for elements that are expected to be on the page once it has loaded
+PRIMARY_WAIT_MS = 5000
+# Budget for the client-rendered logged-in (or login failure) elements to show up
+LOGIN_INDICATOR_WAIT_MS = 3000
+# Budget for a dismissed popup or banner to go away
+POPUP_DISMISS_WAIT_MS = 2000
+
+
+class ScreenshotRecorder:
+    """
+    Keeps the screenshots of a submission attempt in memory.
+    Nothing touches the disk until flush() is called, so successful
+    submissions don't pay for writing evidence nobody looks at.
+    """
+
+    def __init__(self, page: "Page", screenshot_dir: Path, enabled: bool = True, max_screenshots: int = 20):
+        """
+        Initialize the recorder.
+
+        Args:
+            page: Page to capture
+            screenshot_dir: Directory screenshots are written to on flush
+            enabled: When False, capture() does nothing
+            max_screenshots: Number of most recent screenshots kept in memory
+        """
+        self.page = page
+        self.screenshot_dir = Path(screenshot_dir)
+        self.enabled = enabled
+        self._buffer = deque(maxlen=max_screenshots)
+
+    def capture(self, name: str) -> None:
+        """Capture a screenshot of the page into the in-memory buffer."""
+        if not self.enabled:
+            return
+        try:
+            self._buffer.append((name, self.page.screenshot()))
+        except PlaywrightError as e:
+            logger.warning(f"Could not capture screenshot {name}: {str(e)}")
+
+    def flush(self, last_only: bool = False) -> List[str]:
+        """
+        Write the buffered screenshots to disk and return their paths.
+
+        Args:
+            last_only: Only write the most recent screenshot and drop the others
+        """
+        if not self._buffer:
+            return []
+
+        screenshots = [self._buffer[-1]] if last_only else list(self._buffer)
+        self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for name, data in screenshots:
+            path = self.screenshot_dir / f"{name}.png"
+            path.write_bytes(data)
+            paths.append(os.fspath(path))
+        self._buffer.clear()
+
+        logger.info(f"Saved {len(paths)} screenshots to {self.screenshot_dir}")
+        return paths
+
+
+# Returns the first selector with a visible match; :has-text() is emulated by the shared
+# selector helpers (see wttj_selectors.SELECTOR_HELPERS_JS).
+FIRST_VISIBLE_JS = """(selectors) => {""" + wttj_selectors.SELECTOR_HELPERS_JS + """
+    for (const selector of selectors) {
+        if (matchSelector(selector).some(isVisible)) {
+            return selector;
+        }
+    }
+    return null;
+}"""
+
+
+def _log_traceback(config: Optional[Settings]) -> None:
+    """Log the traceback of the exception being handled; only in debug mode since formatting it is costly."""
+    if config is not None and config.log_level == "DEBUG":
+        # Let loguru render the exception being handled instead of formatting it ourselves
+        logger.opt(exception=True).debug("Traceback of the error above")
+
+
+def _debug_visuals(config: Settings) -> bool:
+    """Whether to highlight clicked elements and screenshot them, which is only useful for debugging."""
+    return config.development_mode or config.capture_debug_visuals
+
+
+def _first_visible(page: "Page", selectors: List[str]) -> Optional[str]:
+    """
+    Return the first selector that matches a visible element, or None.
+    All selectors are checked in one page.evaluate call instead of one
+    is_visible round-trip per selector.
+    """
+    try:
+        return page.evaluate(FIRST_VISIBLE_JS, selectors)
+    except PlaywrightError as e:
+        logger.warning(f"Error probing selectors {selectors}: {str(e)}")
+        return None
+
+
+# Fills [name, selectors, value] fields in one go and returns the selector used for each name.
+# React tracks the value property, so it is set through the native setter and followed by
+# input/change events for the change to reach the component state.
+FILL_FORM_JS = """(fields) => {""" + wttj_selectors.SELECTOR_HELPERS_JS + """
+    const filled = {};
+    for (const [name, selectors, value] of fields) {
+        filled[name] = null;
+        for (const selector of selectors) {
+            const el = matchSelector(selector).find(isVisible);
+            if (!el) {
+                continue;
+            }
+            const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+            filled[name] = selector;
+            break;
+        }
+    }
+    return filled;
+}"""
+
+
+# Fills each visible, still empty field matching a [selector, value] pair and returns the
+# selectors that were used. Values go through the native setter like in FILL_FORM_JS.
+FILL_TEXT_FIELDS_JS = """(fields) => {""" + wttj_selectors.SELECTOR_HELPERS_JS + """
+    const filled = [];
+    for (const [selector, value] of fields) {
+        const el = matchSelector(selector)[0];
+        if (!el || el.value || !isVisible(el)) {
+            continue;
+        }
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        filled.push(selector);
+    }
+    return filled;
+}"""
+
+
+def _fill_form(page: "Page", fields: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    """
+    Fill several form fields with a single page.evaluate call.
+    Fields the script could not fill fall back to page.fill.
+
+    Args:
+        page: Page holding the form
+        fields: Mapping of field name to {'selectors': [...], 'value': ...}
+
+    Returns:
+        Name of the first field that could not be found, or None if all were filled
+    """
+    try:
+        filled = page.evaluate(FILL_FORM_JS, [[name, field['selectors'], field['value']] for name, field in fields.items()])
+    except PlaywrightError as e:
+        logger.warning(f"Error filling form in page: {str(e)}")
+        filled = {}
+
+    for field_name, field_data in fields.items():
+        selector = filled.get(field_name)
+        if not selector:
+            selector = _first_visible(page, field_data['selectors'])
+            if not selector:
+                return field_name
+            page.fill(selector, field_data['value'])
+        logger.info(f"Filled {field_name} using selector: {selector}")
+
+    return None
+
+
+def _first_match(page: "Page", union_selector: str) -> Optional["Locator"]:
+    """
+    Return a locator for the first element matching a comma-joined selector, or None.
+    The browser evaluates the whole union in one query instead of one probe per selector.
+    """
+    locator = page.locator(union_selector).first
+    try:
+        return locator if locator.count() else None
+    except PlaywrightError as e:
+        logger.warning(f"Error probing {union_selector}: {str(e)}")
+        return None
+
+
+def _wait_for_page(page: "Page", selector: Optional[str] = None, timeout: int = 15000,
+                   state: str = "visible") -> bool:
+    """
+    Wait for the DOM to be parsed, then for an element showing the page is usable.
+
+    Args:
+        page: Page to wait on
+        selector: CSS selector to wait for, or None to only wait for DOMContentLoaded
+        timeout: Timeout in milliseconds for each wait
+        state: Element state to wait for, as accepted by page.wait_for_selector
+
+    Returns:
+        True if the page became ready before the timeout
+    """
+    try:
+        page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        if selector:
+            page.wait_for_selector(selector, timeout=timeout, state=state)
+        return True
+    except PlaywrightError as e:
+        logger.warning(f"Timeout waiting for {selector or 'page load'}: {str(e)}")
+        return False
+
+
+def _wait_until_hidden(page: "Page", selector: str, timeout: int = POPUP_DISMISS_WAIT_MS) -> None:
+    """Wait for a dismissed popup or banner to disappear instead of sleeping a fixed time."""
+    try:
+        # The visible=true filter makes the wait end once no visible match is left
+        page.locator(f"{selector} >> visible=true").first.wait_for(state="hidden", timeout=timeout)
+    except PlaywrightError as e:
+        logger.debug(f"{selector} still visible after dismissing it: {str(e)}")
+
+
+def with_retry(fn, attempts: int = 3, base: float = 0.5, cap: float = 8.0, budget: float = 30.0):
+    """
+    Call fn, retrying with exponential backoff and jitter when it raises.
+
+    Args:
+        fn: Zero-argument callable to run
+        attempts: Maximum number of calls
+        base: Delay before the first retry, in seconds
+        cap: Maximum delay between two tries, in seconds
+        budget: Total time in seconds that retries may consume
+
+    Returns:
+        Whatever fn returns. The last exception is re-raised once attempts or budget run out.
+    """
+    start = time.monotonic()
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except PlaywrightError as e:
+            # Only browser errors (timeouts, network failures) are worth retrying; anything else is a bug
+            # Jitter keeps parallel workers from retrying in lockstep
+            delay = min(cap, base * 2 ** attempt) + random.uniform(0, 0.3)
+            if attempt == attempts - 1 or time.monotonic() - start + delay > budget:
+                raise
+            logger.warning(f"Attempt {attempt + 1}/{attempts} failed, retrying in {delay:.1f}s: {str(e)}")
+            time.sleep(delay)
+
+
+def _handle_job_search_404(page: "Page", job_url: str, response) -> bool:
     """
     Handle 404 errors when searching for jobs.
-    Returns True if able to recover from the error.
+
+    Args:
+        page: Page that received the error
+        job_url: URL that was requested
+        response: Response returned by page.goto for job_url
+
+    Returns:
+        True if able to recover from the error
     """
     try:
-        # Check if we're on a 404 page
-        if "404" in page.title() or "not found" in page.title().lower():
-            logger.warning(f"Encountered 404 page when navigating to: {job_url}")
+        logger.warning(f"Encountered {response.status} page when navigating to: {job_url}")
 
-            # Try to screenshot the 404 page
-            try:
-                page.screenshot(path="logs/404_error.png")
-            except:
-                pass
-
-            # If on French version of the site, try switching to English
-            if "/fr/" in page.url:
-                english_url = job_url.replace("/fr/", "/en/")
-                logger.info(f"Trying English version of URL: {english_url}")
-                page.goto(english_url, timeout=60000)
-                return True
+        # If on French version of the site, try switching to English
+        if "/fr/" in job_url:
+            english_url = job_url.replace("/fr/", "/en/")
+            logger.info(f"Trying English version of URL: {english_url}")
+            page.goto(english_url, timeout=60000, wait_until="domcontentloaded")
+            return True
 
-            # If on English version, try French version
-            elif "/en/" in page.url:
-                french_url = job_url.replace("/en/", "/fr/")
-                logger.info(f"Trying French version of URL: {french_url}")
-                page.goto(french_url, timeout=60000)
-                return True
+        # If on English version, try French version
+        elif "/en/" in job_url:
+            french_url = job_url.replace("/en/", "/fr/")
+            logger.info(f"Trying French version of URL: {french_url}")
+            page.goto(french_url, timeout=60000, wait_until="domcontentloaded")
+            return True
 
-            # Try to go to the homepage and search again
-            try:
-                logger.info("Navigating to homepage to restart search")
-                page.goto("https://www.welcometothejungle.com/en", timeout=30000)
-                return True
-            except:
-                return False
+        # Try to go to the homepage and search again
+        logger.info("Navigating to homepage to restart search")
+        page.goto("https://www.welcometothejungle.com/en", timeout=30000, wait_until="domcontentloaded")
+        return True
 
-    except Exception as e:
+    except PlaywrightError as e:
         logger.error(f"Error handling 404: {str(e)}")
 
     return False
 
 
-def _submit_application_worker(job, documents, config_dict, result_queue):
+class CircuitBreaker:
+    """
+    Circuit breaker around WTTJ navigation and login.
+    After too many consecutive failures the circuit opens and submissions fail fast
+    instead of each one burning a full login or navigation timeout. Once the open
+    period has passed a single attempt is let through (half-open); its outcome
+    either closes the circuit or reopens it for twice as long. Other attempts are
+    held back until the probe reports, or until it has taken too long to report.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, state=None, lock=None, failure_threshold: int = 5,
+                 base_open_seconds: float = 0.5, max_open_seconds: float = 60.0,
+                 probe_timeout_seconds: float = 120.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            state: Dict-like store for the breaker state, e.g. a Manager().dict() shared by all workers
+            lock: Lock guarding the state, e.g. a Manager().Lock()
+            failure_threshold: Consecutive failures before the circuit opens
+            base_open_seconds: How long the circuit stays open the first time
+            max_open_seconds: Upper bound for the open period
+            probe_timeout_seconds: How long a half-open probe may run before another one is let through
+        """
+        self.state = state if state is not None else {}
+        self.lock = lock if lock is not None else multiprocessing.RLock()
+        self.failure_threshold = failure_threshold
+        self.base_open_seconds = base_open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+
+        with self.lock:
+            self.state.setdefault("status", self.CLOSED)
+            self.state.setdefault("failures", 0)
+            self.state.setdefault("trips", 0)
+            self.state.setdefault("open_until", 0.0)
+
+    def allow(self) -> bool:
+        """Return True if a request may go through."""
+        with self.lock:
+            if self.state["status"] == self.CLOSED:
+                return True
+            # While open, and while half-open with a probe still running, open_until holds attempts back
+            if time.time() < self.state["open_until"]:
+                return False
+            # Open period is over (or the last probe never reported), let one probe through
+            self.state["status"] = self.HALF_OPEN
+            self.state["open_until"] = time.time() + self.probe_timeout_seconds
+            logger.info("Circuit breaker half-open, probing WTTJ")
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self.lock:
+            if self.state["status"] != self.CLOSED:
+                logger.info("Circuit breaker closed")
+            self.state["status"] = self.CLOSED
+            self.state["failures"] = 0
+            self.state["trips"] = 0
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit once the threshold is reached."""
+        with self.lock:
+            self.state["failures"] = self.state["failures"] + 1
+            if self.state["status"] != self.HALF_OPEN and self.state["failures"] < self.failure_threshold:
+                return
+
+            # Exponential backoff on the open period: 0.5s, 1s, 2s, ... up to the cap
+            open_seconds = min(self.max_open_seconds, self.base_open_seconds * 2 ** self.state["trips"])
+            self.state["trips"] = self.state["trips"] + 1
+            self.state["status"] = self.OPEN
+            self.state["open_until"] = time.time() + open_seconds
+            logger.warning(f"Circuit breaker open for {open_seconds:.1f}s after {self.state['failures']} failure(s)")
+
+
+# Browser context settings shared by every submission
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 800},
+    "user_agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# Number of browser contexts kept open per worker browser
+CONTEXTS_PER_BROWSER = 2
+
+# Playwright state owned by the current pool worker process (see _worker_init)
+_playwright = None
+_browser = None
+_context_pool = []
+
+# Circuit breaker for the current process; pool workers replace it with one backed by shared state
+_breaker = CircuitBreaker()
+
+# Logged-in cookies and local storage, reused by new contexts so they can skip the login flow
+STORAGE_STATE_PATH = "logs/wttj_storage.json"
+STORAGE_STATE_MAX_AGE = 7 * 24 * 3600
+# Set once this worker has logged in, so shutdown knows there is a session worth saving
+_session_active = False
+
+
+@lru_cache(maxsize=8)
+def _file_payload(path: str, size: int) -> Dict[str, Any]:
+    """
+    Read a document into the in-memory payload form accepted by set_input_files.
+
+    Payloads are cached per worker, so a document uploaded more than once (the same base CV
+    for several jobs, or a retried submission) is only read from disk once. The size is part
+    of the cache key so a file rewritten in place is read again.
+
+    Args:
+        path: Path to the document
+        size: Size of the document when the batch was dispatched (see _stat_documents)
+
+    Returns:
+        Dictionary with the file name, MIME type and contents
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return {
+        "name": os.path.basename(path),
+        "mimeType": mimetypes.guess_type(path)[0] or "application/octet-stream",
+        "buffer": data
+    }
+
+
+def _load_storage_state() -> Optional[Dict[str, Any]]:
+    """Return the saved storage state if it exists, is readable and is recent enough to reuse."""
+    try:
+        if time.time() - os.path.getmtime(STORAGE_STATE_PATH) >= STORAGE_STATE_MAX_AGE:
+            logger.info("Saved WTTJ session is too old, a fresh login will be needed")
+            return None
+        with open(STORAGE_STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except OSError:
+        return None
+    except ValueError as e:
+        # Treat a damaged file as no session rather than failing the worker's start-up
+        logger.warning(f"Ignoring unreadable WTTJ session file: {str(e)}")
+        return None
+
+
+def _write_storage_state(context: "BrowserContext") -> None:
+    """
+    Write the context's storage state to STORAGE_STATE_PATH.
+    Workers save their sessions independently, so the state goes to a temporary file first
+    and is swapped in with os.replace; readers never see a half-written file.
+    """
+    Path(STORAGE_STATE_PATH).parent.mkdir(parents=True, exist_ok=True)
+    temp_path = f"{STORAGE_STATE_PATH}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(context.storage_state(), f)
+    os.replace(temp_path, STORAGE_STATE_PATH)
+
+
+def _new_context():
+    """Create a browser context, restoring the saved WTTJ session when there is one."""
+    return _browser.new_context(storage_state=_load_storage_state(), **CONTEXT_OPTIONS)
+
+
+def _save_session(page: "Page") -> None:
+    """Persist the logged-in session and share its cookies with the worker's other contexts."""
+    global _session_active
+    try:
+        _write_storage_state(page.context)
+        cookies = page.context.cookies()
+        for context in _context_pool:
+            context.add_cookies(cookies)
+        _session_active = True
+        logger.info(f"Saved WTTJ session to {STORAGE_STATE_PATH}")
+    except (PlaywrightError, OSError) as e:
+        logger.warning(f"Could not save WTTJ session: {str(e)}")
+
+
+def _worker_init(headless: bool = True, breaker_state=None, breaker_lock=None) -> None:
+    """
+    Initializer for pool worker processes.
+    Starts Playwright and a browser once so every job handled by this worker reuses them.
+    """
+    global _playwright, _browser, _context_pool, _breaker
+    from playwright.sync_api import sync_playwright
+
+    if breaker_state is not None:
+        _breaker = CircuitBreaker(breaker_state, breaker_lock)
+    _playwright = sync_playwright().start()
+    _browser = _playwright.chromium.launch(headless=headless)
+    _context_pool = [_new_context() for _ in range(CONTEXTS_PER_BROWSER)]
+
+    # Pool workers leave through os._exit, which skips atexit hooks but runs multiprocessing finalizers
+    multiprocessing.util.Finalize(None, _worker_shutdown, exitpriority=10)
+    logger.info(f"Worker process {os.getpid()} started browser with {CONTEXTS_PER_BROWSER} contexts")
+
+
+def _worker_shutdown() -> None:
+    """Save the session, close the worker's browser and stop Playwright."""
+    global _playwright, _browser, _context_pool
+    try:
+        if _session_active and _context_pool:
+            _write_storage_state(_context_pool[0])
+        if _browser:
+            _browser.close()
+        if _playwright:
+            _playwright.stop()
+    except (PlaywrightError, OSError) as e:
+        logger.warning(f"Error shutting down worker browser: {str(e)}")
+    finally:
+        _playwright = None
+        _browser = None
+        _context_pool = []
+
+
+def _acquire_context(fresh: bool = False):
+    """
+    Take a browser context from the worker pool, starting the browser if needed.
+
+    Args:
+        fresh: Create a new context that is not part of the pool; the caller closes it
+    """
+    if _browser is None:
+        _worker_init()
+    if fresh:
+        return _new_context()
+    if not _context_pool:
+        _context_pool.append(_new_context())
+    # Take from the front and release to the back so jobs round-robin between contexts
+    return _context_pool.pop(0)
+
+
+def _release_context(context) -> None:
+    """Return a browser context to the worker pool."""
+    _context_pool.append(context)
+
+
+# Failed submission screenshots are stored under SCREENSHOT_ROOT/<YYYY-MM-DD>/<attempt>
+SCREENSHOT_ROOT = Path("logs/screenshots")
+
+
+def prune_screenshots(retention_days: int) -> int:
+    """
+    Delete screenshot day directories older than the retention period.
+
+    Args:
+        retention_days: Number of days of screenshots to keep
+
+    Returns:
+        Number of directories deleted
+    """
+    if not SCREENSHOT_ROOT.is_dir():
+        return 0
+
+    cutoff = time.time() - retention_days * 86400
+    removed = 0
+    for day_dir in SCREENSHOT_ROOT.iterdir():
+        try:
+            if day_dir.is_dir() and day_dir.stat().st_mtime < cutoff:
+                shutil.rmtree(day_dir)
+                removed += 1
+        except OSError as e:
+            logger.warning(f"Could not remove old screenshots in {day_dir}: {str(e)}")
+
+    if removed:
+        logger.info(f"Removed {removed} screenshot directories older than {retention_days} days")
+    return removed
+
+
+class WorkerPool:
+    """
+    Long-lived pool of worker processes used to submit applications.
+    Workers are created once and keep Playwright running between jobs, which
+    avoids paying the interpreter and Playwright start-up cost for every application.
+    """
+
+    def __init__(self, max_workers: int = 1, headless: bool = True, screenshot_retention_days: int = 7):
+        """
+        Initialize the worker pool.
+
+        Args:
+            max_workers: Number of worker processes to keep alive
+            headless: Whether worker browsers run headless
+            screenshot_retention_days: Screenshot day directories older than this are deleted
+        """
+        self.max_workers = max(1, max_workers)
+        # Never fork: by now the scraper's shared Playwright driver and browser are still running in
+        # this process, and forked workers would inherit its pipes and threads. The forkserver starts
+        # workers from a clean process; platforms without it use spawn.
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        mp_context = multiprocessing.get_context(start_method)
+        # Circuit breaker state lives in a manager process so every worker sees the same failures
+        self._manager = mp_context.Manager()
+        breaker_state = self._manager.dict()
+        breaker_lock = self._manager.Lock()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_worker_init,
+            initargs=(headless, breaker_state, breaker_lock)
+        )
+        logger.info(f"Started application worker pool with {self.max_workers} process(es) using '{start_method}'")
+
+        # Prune old screenshots in the background for as long as the pool is alive
+        self.screenshot_retention_days = screenshot_retention_days
+        self._stop_pruning = threading.Event()
+        self._pruner = threading.Thread(target=self._prune_screenshots_loop, daemon=True)
+        self._pruner.start()
+
+    def _prune_screenshots_loop(self) -> None:
+        """Delete expired screenshot day directories, then check again every hour."""
+        while True:
+            prune_screenshots(self.screenshot_retention_days)
+            if self._stop_pruning.wait(3600):
+                return
+
+    def submit(self, job: Dict[str, Any], documents: Dict[str, Any], config_dict: Dict[str, Any]) -> Future:
+        """Dispatch an application to the pool and return its Future."""
+        return self._executor.submit(_submit_application_worker, job, documents, config_dict)
+
+    def close(self, terminate: bool = False) -> None:
+        """Shut down the worker processes."""
+        if terminate:
+            # The executor has no public way to stop a stuck worker, so kill the processes directly
+            for process in list((self._executor._processes or {}).values()):
+                process.terminate()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=True)
+        self._manager.shutdown()
+        self._stop_pruning.set()
+        logger.info("Application worker pool shut down")
+
+
+class InlineWorkerPool:
+    """
+    Drop-in replacement for WorkerPool that runs submissions in the calling process.
+    The browser is started on first use and reused for every job, with no worker
+    processes and no pickling of jobs and results. Applications run one after
+    another and the per-batch timeout can't interrupt a stuck one, so this is
+    meant for single-browser runs outside of an asyncio event loop.
+    """
+
+    max_workers = 1
+
+    def __init__(self, headless: bool = True, screenshot_retention_days: int = 7):
+        """
+        Initialize the inline pool.
+
+        Args:
+            headless: Whether the browser runs headless
+            screenshot_retention_days: Screenshot day directories older than this are deleted
+        """
+        self.headless = headless
+        prune_screenshots(screenshot_retention_days)
+        logger.info("Running application submissions in-process")
+
+    def submit(self, job: Dict[str, Any], documents: Dict[str, Any], config_dict: Dict[str, Any]) -> Future:
+        """Run an application right away and return its already completed Future."""
+        future = Future()
+        try:
+            if _browser is None:
+                # Only one sync Playwright can run per thread, and the scraper's shared one is
+                # still up in this thread after the search; stop it before starting ours
+                from browser.wttj_scraper import close_shared_browsers
+                close_shared_browsers()
+                _worker_init(self.headless)
+            future.set_result(_submit_application_worker(job, documents, config_dict))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def close(self, terminate: bool = False) -> None:
+        """Close the browser; terminate is accepted for compatibility with WorkerPool."""
+        _worker_shutdown()
+        logger.info("In-process browser shut down")
+
+
+_worker_pool: Optional[Union[WorkerPool, InlineWorkerPool]] = None
+
+
+def _get_worker_pool(config: Settings) -> Union[WorkerPool, InlineWorkerPool]:
+    """Return the shared worker pool, creating it on first use."""
+    global _worker_pool
+    if _worker_pool is None and config.inline_submissions:
+        _worker_pool = InlineWorkerPool(
+            headless=not config.development_mode,
+            screenshot_retention_days=config.screenshot_retention_days
+        )
+    if _worker_pool is None:
+        # One browser per worker process; more small browsers scale better than one browser with many pages
+        max_workers = min(os.cpu_count() or 1, config.max_browsers)
+        _worker_pool = WorkerPool(
+            max_workers=max_workers,
+            headless=not config.development_mode,
+            screenshot_retention_days=config.screenshot_retention_days
+        )
+    return _worker_pool
+
+
+@atexit.register
+def shutdown_worker_pool(terminate: bool = False) -> None:
+    """Shut down the shared worker pool if it was started."""
+    global _worker_pool
+    if _worker_pool is not None:
+        _worker_pool.close(terminate=terminate)
+        _worker_pool = None
+
+
+def _submit_application_worker(job, documents, config_dict) -> Dict[str, Any]:
     """
-    Worker function to submit application in a separate process.
+    Worker function to submit application in a pool worker process.
     This avoids the "Playwright Sync API inside asyncio loop" error.
+    Returns a dict with the submission result and proof screenshots.
     """
+    config = None
     try:
         # Convert config_dict back to Settings object
         config = Settings(**config_dict)
@@ -78,115 +745,149 @@ def _submit_application_worker(job, documents, config_dict, result_queue):
         timestamp = int(time.time())
         attempt_id = f"{timestamp}_{job_id}"
 
-        # Create screenshots directory for this attempt
-        screenshot_dir = f"logs/screenshots/{attempt_id}"
-        os.makedirs(screenshot_dir, exist_ok=True)
+        # Screenshots are grouped by day so old days can be pruned as a whole (see WorkerPool);
+        # the attempt directory is only created if screenshots are flushed
+        screenshot_dir = SCREENSHOT_ROOT / time.strftime("%Y-%m-%d") / attempt_id
 
         logger.info(f"Worker process: Starting application submission for {job.get('title', '')} at {job.get('company', '')}")
         logger.info(f"Logging screenshots to {screenshot_dir}")
 
-        with sync_playwright() as playwright:
-            browser_type = playwright.chromium
+        # Fail fast while WTTJ is known to be failing
+        if not _breaker.allow():
+            logger.warning(f"Circuit breaker open, skipping application for {job.get('title', '')}")
+            return {"success": False, "reason": "circuit_open", "proof": []}
+
+        # Reuse the worker's browser; each job opens a fresh page, and a fresh context
+        # too when jobs must not share cookies or storage (the saved session is restored)
+        context = _acquire_context(fresh=config.context_per_job)
+        page = context.new_page()
+        recorder = ScreenshotRecorder(
+            page, screenshot_dir,
+            enabled=config.development_mode or config.evidence_level != "minimal"
+        )
 
-            # Launch browser
-            browser = browser_type.launch(headless=not config.development_mode)
-            context = browser.new_context(
-                viewport={"width": 1280, "height": 800},
-                user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
+        success = False
+        try:
+            success = _run_submission(page, job, documents, config, recorder)
+        finally:
+            # Failed attempts keep every screenshot, successful ones only the final proof
+            # unless full evidence was requested
+            if not success or config.evidence_level == "full":
+                proof = recorder.flush()
+            else:
+                proof = recorder.flush(last_only=True)
+            page.close()
+            if config.context_per_job:
+                context.close()
+            else:
+                _release_context(context)
+
+        return {"success": success, "proof": proof}
 
-            # Enable file uploads
-            page = context.new_page()
+    except Exception as e:
+        logger.error(f"Worker process error: {str(e)}")
+        _log_traceback(config)
+        return {"success": False, "proof": []}
 
-            logger.info("Browser started successfully for application submission")
 
-            # Handle login
-            login_success = _handle_login(page, config, screenshot_dir)
-            if not login_success and not config.development_mode:
-                logger.error("Login failed, cannot proceed with application")
-                browser.close()
-                result_queue.put({"success": False, "proof": []})
-                return
+def _run_submission(page: "Page", job: Dict[str, Any], documents: Dict[str, Any],
+                    config: Settings, recorder: ScreenshotRecorder) -> bool:
+    """Drive a single application on an already opened page. Returns True on success."""
+    logger.info("Page opened for application submission")
 
-            # Navigate to the job page
-            job_url = job.get("url", "")
-            if not job_url:
-                logger.error("No job URL provided")
-                browser.close()
-                result_queue.put({"success": False, "proof": []})
-                return
+    job_url = job.get("url", "")
+    if not job_url:
+        logger.error("No job URL provided")
+        return False
 
-            logger.info(f"Navigating to job page: {job_url}")
-            try:
-                page.goto(job_url, timeout=60000)
-
-                # Check for 404 error
-                if "404" in page.title() or "not found" in page.title().lower():
-                    logger.warning("Detected 404 page, attempting recovery")
-                    recovery_successful = _handle_job_search_404(page, job_url)
-                    if not recovery_successful and not config.development_mode:
-                        logger.error("Could not recover from 404 error")
-                        browser.close()
-                        result_queue.put({"success": False, "proof": []})
-                        return
-            except Exception as e:
-                logger.error(f"Error navigating to job page: {str(e)}")
-                if not config.development_mode:
-                    browser.close()
-                    result_queue.put({"success": False, "proof": []})
-                    return
-
-            # Take screenshot after page load
-            page.wait_for_load_state("networkidle", timeout=30000)
-            job_page_path = f"{screenshot_dir}/job_page.png"
-            page.screenshot(path=job_page_path)
-            logger.info(f"Job page screenshot saved: {job_page_path}")
-
-            # Find and click the apply button
-            apply_clicked = _click_apply_button(page, screenshot_dir)
-            if not apply_clicked and not config.development_mode:
-                logger.error("Could not find apply button")
-                browser.close()
-                result_queue.put({"success": False, "proof": []})
-                return
+    # Go straight to the job page; a restored session usually makes the login flow unnecessary
+    if not _navigate_to_job(page, job_url, config, recorder):
+        return False
 
-            # Wait for application form to load
-            page.wait_for_load_state("networkidle", timeout=30000)
+    if _verify_login_success(page, require_indicator=True):
+        logger.info("Reusing saved WTTJ session, skipping login")
+    else:
+        # Handle login
+        login_success = _handle_login(page, config, recorder)
+        if not login_success and not config.development_mode:
+            logger.error("Login failed, cannot proceed with application")
+            _breaker.record_failure()
+            return False
 
-            # Take screenshot of application form
-            application_form_path = f"{screenshot_dir}/application_form.png"
-            page.screenshot(path=application_form_path)
-            logger.info(f"Application form screenshot saved: {application_form_path}")
+        # Login leaves us elsewhere on the site, so come back to the job page
+        if not _navigate_to_job(page, job_url, config, recorder):
+            return False
 
-            # Start the actual form filling
-            proof_images = [job_page_path, application_form_path]
+    # Only a logged-in job page counts as success; resetting the breaker on navigation alone
+    # would clear the failure count before every login attempt and it could never trip on logins
+    _breaker.record_success()
 
-            # In development mode, simulate successful submission
-            if config.development_mode:
-                logger.info(f"[DEV MODE] Simulating successful application to {job.get('title', '')} at {job.get('company', '')}")
-                result_queue.put({"success": True, "proof": proof_images})
-                browser.close()
-                return
+    # Take screenshot once the apply button is rendered
+    _wait_for_page(page, wttj_selectors.APPLY_BUTTON_READY, timeout=PRIMARY_WAIT_MS)
+    recorder.capture("job_page")
 
-            # Handle the actual application submission
-            submission_success, more_proof = _fill_and_submit_application_form(page, job, documents, config, screenshot_dir)
-            proof_images.extend(more_proof)
+    # Find and click the apply button
+    apply_clicked = _click_apply_button(page, config, recorder)
+    if not apply_clicked and not config.development_mode:
+        logger.error("Could not find apply button")
+        return False
 
-            # Close the browser when done
-            browser.close()
-            logger.info("Browser closed after application attempt")
+    # Wait for application form to load
+    _wait_for_page(page, wttj_selectors.APPLICATION_FORM_READY)
 
-            # Return the result with proof
-            result_queue.put({"success": submission_success, "proof": proof_images})
+    # Take screenshot of application form
+    recorder.capture("application_form")
 
-    except Exception as e:
-        logger.error(f"Worker process error: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        result_queue.put({"success": False, "proof": []})
+    # In development mode, simulate successful submission
+    if config.development_mode:
+        logger.info(f"[DEV MODE] Simulating successful application to {job.get('title', '')} at {job.get('company', '')}")
+        return True
+
+    # Handle the actual application submission
+    return _fill_and_submit_application_form(page, job, documents, config, recorder)
+
+
+def _navigate_to_job(page: "Page", job_url: str, config: Settings, recorder: ScreenshotRecorder) -> bool:
+    """
+    Open the job page, recovering from 404s where possible.
+    Returns False when the application should be abandoned.
+    """
+    logger.info(f"Navigating to job page: {job_url}")
+    try:
+        # A 404 is returned as a response rather than raised, so it goes to the 404 handler without retries
+        response = with_retry(lambda: page.goto(job_url, timeout=60000, wait_until="domcontentloaded"))
+        status = response.status if response else 200
+
+        # Check for 404 error straight from the response, no extra round-trip needed
+        if status in (404, 410):
+            logger.warning("Detected 404 page, attempting recovery")
+            recovery_successful = _handle_job_search_404(page, job_url, response)
+            if not recovery_successful and not config.development_mode:
+                logger.error("Could not recover from 404 error")
+                _breaker.record_failure()
+                return False
+        elif status >= 500:
+            # Server errors are unexpected, so they are worth a screenshot
+            logger.error(f"WTTJ returned {status} for {job_url}")
+            recorder.capture("server_error")
+            _breaker.record_failure()
+            if not config.development_mode:
+                return False
+    except PwTimeout as e:
+        logger.error(f"Timed out navigating to job page: {str(e)}")
+        _breaker.record_failure()
+        if not config.development_mode:
+            return False
+    except PlaywrightError as e:
+        logger.error(f"Error navigating to job page: {str(e)}")
+        _breaker.record_failure()
+        if not config.development_mode:
+            return False
+
+    return True
 
 
-def _handle_login(page: Page, config: Settings, screenshot_dir: str) -> bool:
+def _handle_login(page: "Page", config: Settings, recorder: ScreenshotRecorder) -> bool:
     """Handle the login process with detailed error handling and visual proof."""
     try:
         if not config.user_email or not config.user_password:
@@ -198,225 +899,157 @@ def _handle_login(page: Page, config: Settings, screenshot_dir: str) -> bool:
         # Navigate to login page with extended timeout
         login_url = "https://www.welcometothejungle.com/en/login"
         try:
-            page.goto(login_url, timeout=60000)
-            page.wait_for_load_state("networkidle", timeout=15000)
-        except Exception as e:
+            page.goto(login_url, timeout=60000, wait_until="domcontentloaded")
+            page.wait_for_selector(wttj_selectors.LOGIN_FORM_READY, timeout=15000)
+        except PwTimeout as e:
             logger.warning(f"Timeout during login page navigation, but continuing: {str(e)}")
             # Even if timeout occurs, page might have loaded enough to continue
 
         # Take screenshot of login page
-        login_page_path = f"{screenshot_dir}/login_page.png"
-        page.screenshot(path=login_page_path)
-        logger.info(f"Login page screenshot saved: {login_page_path}")
+        recorder.capture("login_page")
 
         # Handle cookie consent if present - with shorter timeout
         try:
             _handle_cookie_consent(page)
-        except Exception as e:
+        except PlaywrightError as e:
             logger.warning(f"Error handling cookie consent: {str(e)}")
 
         # Check for "Stay on current website" popup related to location
         try:
-            _handle_location_popup(page)
-        except Exception as e:
+            _handle_location_popup(page, config, recorder)
+        except PlaywrightError as e:
             logger.warning(f"Error handling location popup: {str(e)}")
 
-        # Wait briefly after handling popups
-        page.wait_for_timeout(1000)
+        # Wait for the email field once the popups are out of the way
+        _wait_for_page(page, wttj_selectors.LOGIN_EMAIL_READY, timeout=PRIMARY_WAIT_MS)
 
-        # First, try to look for LinkedIn login option
-        try:
-            linkedin_login_attempted = _attempt_linkedin_login(page, config, screenshot_dir)
-            if linkedin_login_attempted:
-                # Wait for navigation after LinkedIn login with increased timeout
-                try:
-                    page.wait_for_load_state("networkidle", timeout=45000)
-                except Exception as e:
-                    logger.warning(f"Timeout waiting for page load after LinkedIn login: {str(e)}")
-
-                # Take screenshot after login attempt
-                after_linkedin_login_path = f"{screenshot_dir}/after_linkedin_login.png"
-                page.screenshot(path=after_linkedin_login_path)
-                logger.info(f"Post-LinkedIn-login screenshot saved: {after_linkedin_login_path}")
-
-                # Check for successful login
-                login_success = _verify_login_success(page)
-                if login_success:
-                    logger.info("LinkedIn login successful")
-                    return True
-                else:
-                    logger.warning("LinkedIn login failed - could not verify successful login")
-                    # Fall back to regular login if LinkedIn failed
-        except Exception as e:
-            logger.warning(f"Error during LinkedIn login attempt: {str(e)}")
+        # First, try the LinkedIn login option when the user opted into it
+        if config.auth_method == "linkedin":
+            try:
+                linkedin_login_attempted = _attempt_linkedin_login(page, config, recorder)
+                if linkedin_login_attempted:
+                    # Wait for the profile avatar after LinkedIn login
+                    _wait_for_page(page, wttj_selectors.LOGGED_IN_READY)
+
+                    # Take screenshot after login attempt
+                    recorder.capture("after_linkedin_login")
+
+                    # Check for successful login
+                    login_success = _verify_login_success(page)
+                    if login_success:
+                        logger.info("LinkedIn login successful")
+                        _save_session(page)
+                        return True
+                    else:
+                        logger.warning("LinkedIn login failed - could not verify successful login")
+                        # Fall back to regular login if LinkedIn failed
+            except PlaywrightError as e:
+                logger.warning(f"Error during LinkedIn login attempt: {str(e)}")
 
         # If LinkedIn login wasn't available or failed, proceed with regular login
 
         # Fill login form with multiple selector attempts and shorter timeouts
         login_form_elements = {
             'email': {
-                'selectors': [
-                    'input[type="email"]',
-                    'input[name="email"]',
-                    'input[placeholder*="email" i]'
-                ],
+                'selectors': wttj_selectors.LOGIN_EMAIL,
                 'value': config.user_email
             },
             'password': {
-                'selectors': [
-                    'input[type="password"]',
-                    'input[name="password"]',
-                    'input[placeholder*="password" i]'
-                ],
+                'selectors': wttj_selectors.LOGIN_PASSWORD,
                 'value': config.user_password
             }
         }
 
-        # Fill each form element
-        for field_name, field_data in login_form_elements.items():
-            field_filled = False
-            for selector in field_data['selectors']:
-                try:
-                    if page.is_visible(selector, timeout=5000):
-                        page.fill(selector, field_data['value'])
-                        logger.info(f"Filled {field_name} using selector: {selector}")
-                        field_filled = True
-                        break
-                except Exception as e:
-                    logger.warning(f"Error filling {field_name} with selector {selector}: {str(e)}")
-
-            if not field_filled:
-                logger.error(f"Could not find {field_name} field")
-                page.screenshot(path=f"{screenshot_dir}/{field_name}_field_not_found.png")
-                return False
+        # Fill every form element in one round-trip
+        missing_field = _fill_form(page, login_form_elements)
+        if missing_field:
+            logger.error(f"Could not find {missing_field} field")
+            recorder.capture(f"{missing_field}_field_not_found")
+            return False
 
         # Take a screenshot after filling the form
-        page.screenshot(path=f"{screenshot_dir}/form_filled.png")
+        recorder.capture("form_filled")
 
         # Click login button
-        submit_clicked = False
-        submit_selectors = [
-            'button[type="submit"]',
-            'button:has-text("Log in")',
-            'button:has-text("Sign in")',
-            'input[type="submit"]'
-        ]
-
-        for selector in submit_selectors:
-            try:
-                if page.is_visible(selector, timeout=5000):
-                    page.click(selector)
-                    logger.info(f"Clicked submit button: {selector}")
-                    submit_clicked = True
-                    break
-            except Exception as e:
-                logger.warning(f"Error clicking submit button {selector}: {str(e)}")
-
-        if not submit_clicked:
+        selector = _first_visible(page, wttj_selectors.LOGIN_SUBMIT)
+        if not selector:
             logger.error("Could not find login submit button")
-            page.screenshot(path=f"{screenshot_dir}/submit_not_found.png")
+            recorder.capture("submit_not_found")
             return False
 
-        # Wait for navigation after login with increased timeout
-        try:
-            page.wait_for_load_state("networkidle", timeout=45000)
-        except Exception as e:
-            logger.warning(f"Timeout waiting for page load after login: {str(e)}")
-            # Continue anyway, we'll check for login success
+        with_retry(lambda: page.click(selector))
+        logger.info(f"Clicked submit button: {selector}")
+
+        # Wait for the profile avatar after login
+        # Continue anyway on timeout, we'll check for login success
+        _wait_for_page(page, wttj_selectors.LOGGED_IN_READY)
 
         # Take screenshot after login attempt
-        after_login_path = f"{screenshot_dir}/after_login.png"
-        page.screenshot(path=after_login_path)
-        logger.info(f"Post-login screenshot saved: {after_login_path}")
+        recorder.capture("after_login")
 
         # Check for successful login multiple ways
         login_success = _verify_login_success(page)
 
         if login_success:
             logger.info("Login successful")
+            _save_session(page)
             return True
         else:
             logger.warning("Login failed - could not verify successful login")
             return False
 
-    except Exception as e:
+    except PlaywrightError as e:
         logger.error(f"Login error: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        page.screenshot(path=f"{screenshot_dir}/login_error.png")
+        _log_traceback(config)
+        recorder.capture("login_error")
         return False
 
 
-def _attempt_linkedin_login(page: Page, config: Settings, screenshot_dir: str) -> bool:
+def _attempt_linkedin_login(page: "Page", config: Settings, recorder: ScreenshotRecorder) -> bool:
     """Attempt to login using LinkedIn option if available."""
     try:
-        # Common selectors for LinkedIn login buttons
-        linkedin_selectors = [
-            "button:has-text('Continue with LinkedIn')",
-            "button:has-text('Sign in with LinkedIn')",
-            "button:has-text('Login with LinkedIn')",
-            "a:has-text('Continue with LinkedIn')",
-            "a:has-text('Sign in with LinkedIn')",
-            "a:has-text('Login with LinkedIn')",
-            "a[href*='linkedin']",
-            "button[data-testid='linkedin-button']",
-            "div.linkedin-login-button"
-        ]
-
         # Check for LinkedIn login option
-        linkedin_button_found = False
-        for selector in linkedin_selectors:
-            try:
-                if page.is_visible(selector):
-                    # Take screenshot before clicking LinkedIn button
-                    before_linkedin_path = f"{screenshot_dir}/before_linkedin_click.png"
-                    page.screenshot(path=before_linkedin_path)
-
-                    # Highlight the LinkedIn button
-                    page.evaluate(f"""(selector) => {{
-                        const el = document.querySelector(selector);
-                        if (el) {{
-                            el.style.border = '3px solid blue';
-                            el.style.backgroundColor = 'rgba(0, 0, 255, 0.1)';
-                        }}
-                    }}""", selector)
-
-                    # Take screenshot with highlighted LinkedIn button
-                    highlighted_linkedin_path = f"{screenshot_dir}/linkedin_button_highlighted.png"
-                    page.screenshot(path=highlighted_linkedin_path)
-
-                    # Click the LinkedIn button
-                    page.click(selector)
-                    logger.info(f"Clicked LinkedIn login button with selector: {selector}")
-                    linkedin_button_found = True
+        selector = _first_visible(page, wttj_selectors.LINKEDIN_LOGIN_BUTTONS)
+        if not selector:
+            logger.info("LinkedIn login option not found, will use regular login")
+            return False
 
-                    # Wait for LinkedIn login page to load
-                    page.wait_for_load_state("networkidle", timeout=20000)
+        # Take screenshot before clicking LinkedIn button
+        if config.development_mode:
+            recorder.capture("before_linkedin_click")
 
-                    # Take screenshot of LinkedIn login page
-                    linkedin_login_page_path = f"{screenshot_dir}/linkedin_login_page.png"
-                    page.screenshot(path=linkedin_login_page_path)
+        # Resolve the button once and reuse it for the highlight and the click
+        linkedin_button = page.locator(f"{selector} >> visible=true").first
 
-                    # Handle LinkedIn authentication
-                    linkedin_auth_success = _handle_linkedin_auth(page, config, screenshot_dir)
-                    return linkedin_auth_success
-            except Exception as e:
-                logger.warning(f"Error with LinkedIn selector {selector}: {str(e)}")
-                continue
+        # Highlight the LinkedIn button and take a screenshot of it
+        if _debug_visuals(config):
+            linkedin_button.evaluate("""el => {
+                el.style.border = '3px solid blue';
+                el.style.backgroundColor = 'rgba(0, 0, 255, 0.1)';
+            }""")
+            recorder.capture("linkedin_button_highlighted")
 
-        if not linkedin_button_found:
-            logger.info("LinkedIn login option not found, will use regular login")
-            return False
+        # Click the LinkedIn button
+        linkedin_button.click()
+        logger.info(f"Clicked LinkedIn login button with selector: {selector}")
 
-    except Exception as e:
+        # Wait for LinkedIn login form to load
+        _wait_for_page(page, wttj_selectors.LINKEDIN_FORM_READY)
+
+        # Take screenshot of LinkedIn login page
+        if config.development_mode:
+            recorder.capture("linkedin_login_page")
+
+        # Handle LinkedIn authentication
+        return _handle_linkedin_auth(page, config, recorder)
+
+    except PlaywrightError as e:
         logger.error(f"LinkedIn login attempt error: {str(e)}")
-        page.screenshot(path=f"{screenshot_dir}/linkedin_login_error.png")
+        recorder.capture("linkedin_login_error")
         return False
 
-    return False
-
 
-def _handle_linkedin_auth(page: Page, config: Settings, screenshot_dir: str) -> bool:
+def _handle_linkedin_auth(page: "Page", config: Settings, recorder: ScreenshotRecorder) -> bool:
     """Handle the LinkedIn authentication flow."""
     try:
         # Check if we're on a LinkedIn domain
@@ -427,84 +1060,42 @@ def _handle_linkedin_auth(page: Page, config: Settings, screenshot_dir: str) ->
 
         logger.info("On LinkedIn login page, proceeding with authentication")
 
-        # Common LinkedIn login form field selectors
-        linkedin_email_selectors = [
-            "input[id='username']",
-            "input[name='session_key']",
-            "input[type='email']"
-        ]
-
-        linkedin_password_selectors = [
-            "input[id='password']",
-            "input[name='session_password']",
-            "input[type='password']"
-        ]
-
-        # Try to fill email field
-        email_filled = False
-        for selector in linkedin_email_selectors:
-            try:
-                if page.is_visible(selector):
-                    page.fill(selector, config.user_email)
-                    logger.info(f"Filled LinkedIn email field using selector: {selector}")
-                    email_filled = True
-                    break
-            except Exception as e:
-                logger.warning(f"Error filling LinkedIn email field with selector {selector}: {str(e)}")
-
-        if not email_filled:
-            logger.error("Could not find LinkedIn email field")
-            page.screenshot(path=f"{screenshot_dir}/linkedin_email_not_found.png")
-            return False
-
-        # Try to fill password field
-        password_filled = False
-        for selector in linkedin_password_selectors:
-            try:
-                if page.is_visible(selector):
-                    page.fill(selector, config.user_password)
-                    logger.info(f"Filled LinkedIn password field using selector: {selector}")
-                    password_filled = True
-                    break
-            except Exception as e:
-                logger.warning(f"Error filling LinkedIn password field with selector {selector}: {str(e)}")
+        # Fill email and password fields in one round-trip
+        linkedin_form_elements = {
+            'email': {
+                'selectors': wttj_selectors.LINKEDIN_EMAIL,
+                'value': config.user_email
+            },
+            'password': {
+                'selectors': wttj_selectors.LINKEDIN_PASSWORD,
+                'value': config.user_password
+            }
+        }
 
-        if not password_filled:
-            logger.error("Could not find LinkedIn password field")
-            page.screenshot(path=f"{screenshot_dir}/linkedin_password_not_found.png")
+        missing_field = _fill_form(page, linkedin_form_elements)
+        if missing_field:
+            logger.error(f"Could not find LinkedIn {missing_field} field")
+            recorder.capture(f"linkedin_{missing_field}_not_found")
             return False
 
         # Take screenshot after filling LinkedIn form
-        page.screenshot(path=f"{screenshot_dir}/linkedin_form_filled.png")
+        recorder.capture("linkedin_form_filled")
 
         # Click LinkedIn login button
-        linkedin_submit_clicked = False
-        linkedin_submit_selectors = [
-            "button[type='submit']",
-            "button:has-text('Sign in')",
-            "input[type='submit']"
-        ]
-
-        for selector in linkedin_submit_selectors:
-            try:
-                if page.is_visible(selector):
-                    page.click(selector)
-                    logger.info(f"Clicked LinkedIn submit button with selector: {selector}")
-                    linkedin_submit_clicked = True
-                    break
-            except Exception as e:
-                logger.warning(f"Error clicking LinkedIn submit button with selector {selector}: {str(e)}")
-
-        if not linkedin_submit_clicked:
+        selector = _first_visible(page, wttj_selectors.LINKEDIN_SUBMIT)
+        if not selector:
             logger.error("Could not find LinkedIn submit button")
-            page.screenshot(path=f"{screenshot_dir}/linkedin_submit_not_found.png")
+            recorder.capture("linkedin_submit_not_found")
             return False
 
+        page.click(selector)
+        logger.info(f"Clicked LinkedIn submit button with selector: {selector}")
+
         # Wait for authorization to complete and redirect back to WTTJ
-        page.wait_for_load_state("networkidle", timeout=30000)
+        _wait_for_page(page, timeout=30000)
 
         # Take screenshot after LinkedIn authorization
-        page.screenshot(path=f"{screenshot_dir}/after_linkedin_auth.png")
+        recorder.capture("after_linkedin_auth")
 
         # Check if we're back on WTTJ
         current_url = page.url
@@ -513,165 +1104,145 @@ def _handle_linkedin_auth(page: Page, config: Settings, screenshot_dir: str) ->
             return True
         else:
             # We might need to handle "Allow" screens or other LinkedIn prompts
-            allow_button_selectors = [
-                "button:has-text('Allow')",
-                "button:has-text('Authorize')",
-                "button:has-text('Accept')",
-                "button[type='submit']"
-            ]
-
-            for selector in allow_button_selectors:
+            selector = _first_visible(page, wttj_selectors.LINKEDIN_ALLOW)
+            if selector:
                 try:
-                    if page.is_visible(selector):
-                        page.click(selector)
-                        logger.info(f"Clicked LinkedIn authorization button with selector: {selector}")
-                        page.wait_for_load_state("networkidle", timeout=20000)
-
-                        # Take screenshot after clicking allow
-                        page.screenshot(path=f"{screenshot_dir}/after_linkedin_allow.png")
-
-                        # Check URL again
-                        if "welcometothejungle.com" in page.url:
-                            logger.info("Successfully returned to WTTJ after LinkedIn authorization")
-                            return True
-                        break
-                except Exception as e:
+                    page.click(selector)
+                    logger.info(f"Clicked LinkedIn authorization button with selector: {selector}")
+                    _wait_for_page(page, timeout=20000)
+
+                    # Take screenshot after clicking allow
+                    recorder.capture("after_linkedin_allow")
+
+                    # Check URL again
+                    if "welcometothejungle.com" in page.url:
+                        logger.info("Successfully returned to WTTJ after LinkedIn authorization")
+                        return True
+                except PlaywrightError as e:
                     logger.warning(f"Error with LinkedIn allow button {selector}: {str(e)}")
 
             logger.warning(f"LinkedIn login process incomplete - current URL: {current_url}")
             return False
 
-    except Exception as e:
+    except PlaywrightError as e:
         logger.error(f"LinkedIn authentication error: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        page.screenshot(path=f"{screenshot_dir}/linkedin_auth_error.png")
+        _log_traceback(config)
+        recorder.capture("linkedin_auth_error")
         return False
 
 
-def _handle_cookie_consent(page: Page) -> None:
+# Popups already dismissed in each browser context. Their choice is stored in the
+# context's cookies, so they don't come back and there is no need to probe for them again.
+_context_flags: "WeakKeyDictionary[BrowserContext, Set[str]]" = WeakKeyDictionary()
+
+
+def _is_dismissed(page: "Page", flag: str) -> bool:
+    """Whether the popup named by flag was already dismissed in this page's context."""
+    return flag in _context_flags.get(page.context, ())
+
+
+def _mark_dismissed(page: "Page", flag: str) -> None:
+    """Remember that the popup named by flag was dismissed in this page's context."""
+    _context_flags.setdefault(page.context, set()).add(flag)
+
+
+def _handle_cookie_consent(page: "Page") -> None:
     """Handle cookie consent banners."""
-    cookie_buttons = [
-        "button:has-text('Accept all cookies')",
-        "button:has-text('OK for me')",
-        "button:has-text('Got it!')",
-        "button[data-testid='cookie-consent-button-accept']"
-    ]
-
-    for button in cookie_buttons:
+    if _is_dismissed(page, "cookie"):
+        return
+
+    button = _first_visible(page, wttj_selectors.COOKIE_BUTTONS)
+    if button:
         try:
-            if page.is_visible(button):
-                page.click(button)
-                logger.info(f"Clicked cookie consent button: {button}")
-                page.wait_for_timeout(1000)
-                break
-        except Exception as e:
+            page.click(button)
+            logger.info(f"Clicked cookie consent button: {button}")
+            _mark_dismissed(page, "cookie")
+            _wait_until_hidden(page, button)
+        except PlaywrightError as e:
             logger.warning(f"Error clicking cookie consent: {str(e)}")
 
 
-def _handle_location_popup(page: Page) -> None:
+def _handle_location_popup(page: "Page", config: Settings, recorder: ScreenshotRecorder) -> None:
     """Handle location popups that might appear."""
+    if _is_dismissed(page, "location"):
+        return
+
     # Check for the "Looks like you're in France?" popup first
     try:
-        france_popup_selectors = [
-            "button:has-text('Stay on the current website')",
-            "button:has-text('Stay on this website')",
-            ".modal button:has-text('Stay')",
-            "[role='dialog'] button:has-text('Stay')"
-        ]
-
         # Take screenshot before handling popup
-        try:
-            page.screenshot(path="logs/popup_before.png")
-        except:
-            pass
-
-        for selector in france_popup_selectors:
-            if page.is_visible(selector, timeout=5000):
-                # Highlight the button for screenshot
-                page.evaluate(f"""(selector) => {{
-                    const el = document.querySelector(selector);
-                    if (el) {{
-                        el.style.border = '3px solid red';
-                        el.style.backgroundColor = 'rgba(255, 0, 0, 0.2)';
-                    }}
-                }}""", selector)
-
-                try:
-                    page.screenshot(path="logs/popup_highlighted.png")
-                except:
-                    pass
-
-                # Click the button
-                page.click(selector)
-                logger.info(f"Clicked France location popup button: {selector}")
-                page.wait_for_timeout(2000)
-                return
-    except Exception as e:
+        if _debug_visuals(config):
+            recorder.capture("popup_before")
+
+        selector = _first_visible(page, wttj_selectors.FRANCE_POPUP_BUTTONS)
+        if selector:
+            # Resolve the button once and reuse it for the highlight and the click
+            popup_button = page.locator(f"{selector} >> visible=true").first
+
+            # Highlight the button for screenshot
+            if _debug_visuals(config):
+                popup_button.evaluate("""el => {
+                    el.style.border = '3px solid red';
+                    el.style.backgroundColor = 'rgba(255, 0, 0, 0.2)';
+                }""")
+                recorder.capture("popup_highlighted")
+
+            # Click the button
+            popup_button.click()
+            logger.info(f"Clicked France location popup button: {selector}")
+            _mark_dismissed(page, "location")
+            _wait_until_hidden(page, selector)
+            return
+    except PlaywrightError as e:
         logger.warning(f"Error handling France popup: {str(e)}")
 
     # Try clicking on the modal close button if visible
     try:
-        close_button_selectors = [
-            "button[data-testid='modal-close']",
-            "button.modal-close",
-            "button.close",
-            "button[aria-label='Close']",
-            "svg[data-testid='icon-times']"
-        ]
-
-        for selector in close_button_selectors:
-            if page.is_visible(selector, timeout=2000):
-                page.click(selector)
-                logger.info(f"Clicked popup close button: {selector}")
-                page.wait_for_timeout(1000)
-                return
-    except Exception as e:
+        selector = _first_visible(page, wttj_selectors.POPUP_CLOSE_BUTTONS)
+        if selector:
+            page.click(selector)
+            logger.info(f"Clicked popup close button: {selector}")
+            _mark_dismissed(page, "location")
+            _wait_until_hidden(page, selector)
+            return
+    except PlaywrightError as e:
         logger.warning(f"Error clicking close button: {str(e)}")
 
     # Generic approach for other popups
-    location_buttons = [
-        "button:has-text('Stay on the current website')",
-        "button:has-text('Stay on this website')",
-        "button:has-text('Continue')",
-        "button:has-text('Accept')",
-        "button:has-text('OK')",
-        "button:has-text('Got it')"
-    ]
-
-    for button in location_buttons:
+    button = _first_visible(page, wttj_selectors.LOCATION_POPUP_BUTTONS)
+    if button:
         try:
-            if page.is_visible(button):
-                page.click(button)
-                logger.info(f"Clicked location popup button: {button}")
-                page.wait_for_timeout(1000)
-                break
-        except Exception as e:
+            page.click(button)
+            logger.info(f"Clicked location popup button: {button}")
+            _mark_dismissed(page, "location")
+            _wait_until_hidden(page, button)
+        except PlaywrightError as e:
             logger.warning(f"Error clicking location popup: {str(e)}")
 
     # As a last resort, try clicking on the overlay/backdrop to dismiss modal
     try:
-        backdrop_selectors = [
-            ".modal-backdrop",
-            ".overlay",
-            "[data-testid='modal-backdrop']"
-        ]
-
-        for selector in backdrop_selectors:
-            if page.is_visible(selector):
-                # Click in the top-left corner of the backdrop to avoid clicking on the modal itself
-                box = page.query_selector(selector).bounding_box()
-                if box:
-                    page.click(selector, position={"x": 10, "y": 10})
-                    logger.info(f"Clicked backdrop to dismiss popup: {selector}")
-                    page.wait_for_timeout(1000)
-                    break
-    except Exception as e:
+        selector = _first_visible(page, wttj_selectors.POPUP_BACKDROPS)
+        if selector:
+            # Click in the top-left corner of the backdrop to avoid clicking on the modal itself
+            box = page.query_selector(selector).bounding_box()
+            if box:
+                page.click(selector, position={"x": 10, "y": 10})
+                logger.info(f"Clicked backdrop to dismiss popup: {selector}")
+                _mark_dismissed(page, "location")
+                _wait_until_hidden(page, selector)
+    except PlaywrightError as e:
         logger.warning(f"Error clicking backdrop: {str(e)}")
 
 
-def _verify_login_success(page: Page) -> bool:
-    """Verify if login was successful using multiple checks."""
+def _verify_login_success(page: "Page", require_indicator: bool = False) -> bool:
+    """
+    Verify if login was successful using multiple checks.
+
+    Args:
+        page: Page to inspect
+        require_indicator: Only report success when a logged-in element is visible,
+            instead of falling back to the URL check. Used to test a restored session
+            on pages other than the login page.
+    """
 
     # Check 1: URL check - we should no longer be on the login page
     current_url = page.url
@@ -679,52 +1250,27 @@ def _verify_login_success(page: Page) -> bool:
         logger.warning("Still on login page after submission - login likely failed")
         return False
 
-    # Check 2: Look for user avatar or profile elements
-    avatar_selectors = [
-        "a[href='/en/profile']",
-        "img[alt='User avatar']",
-        "a[href*='account']",
-        ".user-profile-icon"
-    ]
-
-    for selector in avatar_selectors:
-        try:
-            if page.is_visible(selector):
-                logger.info(f"Found profile element after login: {selector}")
-                return True
-        except:
-            continue
-
-    # Check 3: Look for elements that indicate we're logged in
-    logged_in_indicators = [
-        "a:has-text('Profile')",
-        "a:has-text('My Account')",
-        "a:has-text('Sign out')",
-        "a:has-text('Log out')"
-    ]
+    # The avatar is rendered client-side, so it is usually missing right after domcontentloaded.
+    # is_visible() doesn't wait, so wait for either a logged-in or a login failure element first.
+    logged_in = page.locator(wttj_selectors.LOGGED_IN_LOCATOR)
+    login_failure = page.locator(wttj_selectors.LOGIN_FAILURE_LOCATOR)
+    try:
+        logged_in.or_(login_failure).first.wait_for(state="visible", timeout=LOGIN_INDICATOR_WAIT_MS)
+    except PwTimeout:
+        pass
 
-    for selector in logged_in_indicators:
-        try:
-            if page.is_visible(selector):
-                logger.info(f"Found logged-in indicator: {selector}")
-                return True
-        except:
-            continue
+    # Check 2: Look for user avatar, profile or other logged-in elements in one query
+    if logged_in.first.is_visible():
+        logger.info("Found logged-in element after login")
+        return True
 
-    # Check 4: Look for elements that indicate we're still in the login process
-    login_failure_indicators = [
-        "div.error-message",
-        "p.error",
-        "input[type='password']"  # If we still see password field, login failed
-    ]
+    # Check 3: Look for elements that indicate we're still in the login process
+    if login_failure.first.is_visible():
+        logger.warning("Found login failure indicator")
+        return False
 
-    for selector in login_failure_indicators:
-        try:
-            if page.is_visible(selector):
-                logger.warning(f"Found login failure indicator: {selector}")
-                return False
-        except:
-            continue
+    if require_indicator:
+        return False
 
     # If we reach here without a clear indicator, assume success if we're not on login page
     if "/login" not in current_url and "/sign-in" not in current_url:
@@ -734,51 +1280,29 @@ def _verify_login_success(page: Page) -> bool:
     return False
 
 
-def _click_apply_button(page: Page, screenshot_dir: str) -> bool:
+def _click_apply_button(page: "Page", config: Settings, recorder: ScreenshotRecorder) -> bool:
     """Find and click the apply button with proof screenshots."""
-    apply_button_selectors = [
-        "a[data-testid='job-apply-button']",
-        "button[data-testid='job-apply-button']",
-        "a.ais-Highlight",
-        "a[href*='apply']",
-        "button:has-text('Apply')",
-        "div.wttj-sc-1c2f42q a",  # Common WTTJ button class
-        "[role='button']:has-text('Apply')"
-    ]
-
     # First, take a screenshot to show the page with the apply button
-    before_click_path = f"{screenshot_dir}/before_apply_click.png"
-    page.screenshot(path=before_click_path)
-    logger.info(f"Pre-apply button screenshot saved: {before_click_path}")
+    recorder.capture("before_apply_click")
 
-    # Try each selector
-    for selector in apply_button_selectors:
-        try:
-            if page.is_visible(selector):
-                # Highlight the button before clicking (for screenshot proof)
-                page.evaluate(f"""(selector) => {{
-                    const el = document.querySelector(selector);
-                    if (el) {{
-                        el.style.border = '3px solid red';
-                    }}
-                }}""", selector)
-
-                # Take screenshot with highlighted button
-                highlighted_button_path = f"{screenshot_dir}/apply_button_highlighted.png"
-                page.screenshot(path=highlighted_button_path)
-                logger.info(f"Apply button highlighted screenshot saved: {highlighted_button_path}")
-
-                # Click the button
-                page.click(selector)
-                logger.info(f"Clicked apply button with selector: {selector}")
-                return True
-        except Exception as e:
-            logger.warning(f"Error with apply button selector {selector}: {str(e)}")
+    # One locator over every apply button selector, resolved by the browser in a single query
+    apply_button = page.locator(wttj_selectors.APPLY_BUTTON_LOCATOR).first
+    try:
+        # Highlight the button before clicking (for screenshot proof)
+        if _debug_visuals(config):
+            apply_button.evaluate("el => el.style.border = '3px solid red'", timeout=2000)
+            recorder.capture("apply_button_highlighted")
+
+        # Click the button
+        apply_button.click(timeout=2000)
+        logger.info("Clicked apply button")
+        return True
+    except PlaywrightError as e:
+        logger.warning(f"Error with apply button: {str(e)}")
 
     # If we get here, we couldn't find any apply button
-    no_button_path = f"{screenshot_dir}/apply_button_not_found.png"
-    page.screenshot(path=no_button_path)
-    logger.error(f"Could not find apply button, screenshot saved: {no_button_path}")
+    recorder.capture("apply_button_not_found")
+    logger.error("Could not find apply button")
 
     # Check for alternative paths - sometimes the job details page IS the application form
     if _is_already_on_application_form(page):
@@ -788,308 +1312,249 @@ def _click_apply_button(page: Page, screenshot_dir: str) -> bool:
     return False
 
 
-def _is_already_on_application_form(page: Page) -> bool:
+def _is_already_on_application_form(page: "Page") -> bool:
     """Check if we're already on an application form without needing to click apply."""
-    form_indicators = [
-        "input[type='file']",
-        "textarea[name*='cover']",
-        "textarea[name*='motivation']",
-        "form[action*='apply']",
-        "input[name='resume']",
-        "[data-testid='application-form']",
-        "div:has-text('Upload your resume')",
-        "div:has-text('Upload your CV')"
-    ]
-
-    for indicator in form_indicators:
-        try:
-            if page.is_visible(indicator):
-                logger.info(f"Already on application form - found indicator: {indicator}")
-                return True
-        except:
-            continue
+    if _first_match(page, wttj_selectors.APPLICATION_FORM_LOCATOR) is not None:
+        logger.info("Already on application form - found a form indicator")
+        return True
 
     return False
 
 
-def _fill_and_submit_application_form(page: Page, job: Dict[str, Any],
+def _fill_and_submit_application_form(page: "Page", job: Dict[str, Any],
                                      documents: Dict[str, Any], config: Settings,
-                                     screenshot_dir: str) -> tuple:
+                                     recorder: ScreenshotRecorder) -> bool:
     """
     Fill out and submit the application form with CV and motivation letter.
-    Returns tuple of (success, list_of_proof_image_paths)
+    Returns True if the submission was verified as successful.
     """
-    proof_images = []
     try:
-        # Get document paths - ensure they exist
-        cv_path = documents.get("cv")
-        letter_path = documents.get("letter")
-
-        if not cv_path or not os.path.exists(cv_path):
-            logger.error(f"CV file not found: {cv_path}")
-            error_path = f"{screenshot_dir}/cv_missing.png"
-            page.screenshot(path=error_path)
-            proof_images.append(error_path)
-            return False, proof_images
-
-        if not letter_path or not os.path.exists(letter_path):
-            logger.warning(f"Motivation letter file not found: {letter_path}")
-            # We'll continue without the letter as some forms don't require it
+        # Documents were checked once when the batch was dispatched (see _stat_documents),
+        # so a missing entry means the file does not exist
+        cv = documents.get("cv")
+        letter = documents.get("letter")
+
+        if not cv:
+            logger.error("CV file not found")
+            recorder.capture("cv_missing")
+            return False
 
-        # Wait for the form to be ready
-        page.wait_for_timeout(2000)
+        if not letter:
+            logger.warning("Motivation letter file not found")
+            # We'll continue without the letter as some forms don't require it
 
-        # Look for all possible file upload fields
-        upload_filled = False
+        # Wait for the upload form to be ready. File inputs are usually hidden behind a styled
+        # button, so wait for them to be attached rather than visible
+        _wait_for_page(page, wttj_selectors.UPLOAD_FORM_READY, timeout=10000, state="attached")
 
-        # Common CV/resume upload field selectors
-        cv_upload_selectors = [
-            "input[type='file'][name*='resume']",
-            "input[type='file'][name*='cv']",
-            "input[type='file'][accept*='pdf']",
-            "input[type='file']"  # Fallback to any file input
-        ]
+        # Read every file input once and decide in Python which one takes which document
+        file_inputs = page.locator(wttj_selectors.FILE_INPUTS)
+        try:
+            inputs = file_inputs.evaluate_all("els => els.map(el => ({name: el.name || '', accept: el.accept || ''}))")
+        except PlaywrightError as e:
+            logger.warning(f"Could not list file inputs: {str(e)}")
+            inputs = []
+        cv_index, letter_index = _classify_file_inputs(inputs)
 
-        # Try to upload CV
-        for selector in cv_upload_selectors:
+        # Try to upload CV, from memory rather than from a path so Playwright doesn't re-read the file
+        upload_filled = False
+        if cv_index is not None:
             try:
-                if page.is_visible(selector) or page.query_selector(selector):
-                    # Some file inputs may be hidden, so we need to handle them specially
-                    upload_element = page.query_selector(selector)
-                    if upload_element:
-                        page.set_input_files(selector, cv_path)
-                        logger.info(f"Uploaded CV using selector: {selector}")
-                        upload_filled = True
-
-                        # Take screenshot after CV upload
-                        cv_uploaded_path = f"{screenshot_dir}/cv_uploaded.png"
-                        page.screenshot(path=cv_uploaded_path)
-                        proof_images.append(cv_uploaded_path)
-                        break
-            except Exception as e:
-                logger.warning(f"Error uploading CV with selector {selector}: {str(e)}")
+                file_inputs.nth(cv_index).set_input_files(_file_payload(cv["path"], cv["size"]))
+                logger.info(f"Uploaded CV to file input {cv_index} ({inputs[cv_index]['name'] or 'unnamed'})")
+                upload_filled = True
+
+                # Take screenshot after CV upload
+                recorder.capture("cv_uploaded")
+            except PlaywrightError as e:
+                logger.warning(f"Error uploading CV: {str(e)}")
 
         if not upload_filled:
             logger.warning("Could not find CV upload field - form might have different structure")
-            form_structure_path = f"{screenshot_dir}/form_structure.png"
-            page.screenshot(path=form_structure_path)
-            proof_images.append(form_structure_path)
+            recorder.capture("form_structure")
 
         # Try to upload motivation letter if we have it
-        if letter_path and os.path.exists(letter_path):
-            letter_upload_selectors = [
-                "input[type='file'][name*='letter']",
-                "input[type='file'][name*='motivation']",
-                "input[type='file'][name*='cover']",
-                "input[type='file']:nth-of-type(2)"  # Try second file input if there are multiple
-            ]
-
-            for selector in letter_upload_selectors:
-                try:
-                    if page.is_visible(selector) or page.query_selector(selector):
-                        page.set_input_files(selector, letter_path)
-                        logger.info(f"Uploaded motivation letter using selector: {selector}")
-
-                        # Take screenshot after letter upload
-                        letter_uploaded_path = f"{screenshot_dir}/letter_uploaded.png"
-                        page.screenshot(path=letter_uploaded_path)
-                        proof_images.append(letter_uploaded_path)
-                        break
-                except Exception as e:
-                    logger.warning(f"Error uploading letter with selector {selector}: {str(e)}")
+        if letter and letter_index is not None:
+            try:
+                file_inputs.nth(letter_index).set_input_files(_file_payload(letter["path"], letter["size"]))
+                logger.info(f"Uploaded motivation letter to file input {letter_index} ({inputs[letter_index]['name'] or 'unnamed'})")
+
+                # Take screenshot after letter upload
+                recorder.capture("letter_uploaded")
+            except PlaywrightError as e:
+                logger.warning(f"Error uploading letter: {str(e)}")
 
         # Fill in any required text fields
         _fill_common_text_fields(page, config)
 
         # Take screenshot of completed form
-        completed_form_path = f"{screenshot_dir}/completed_form.png"
-        page.screenshot(path=completed_form_path)
-        proof_images.append(completed_form_path)
+        recorder.capture("completed_form")
 
-        # Look for and click the submit button
+        # Look for and click the submit button. click() already waits for the button to be
+        # visible and actionable, so there is no separate existence check
         submit_clicked = False
-        submit_selectors = [
-            "button[type='submit']",
-            "button:has-text('Submit')",
-            "button:has-text('Apply')",
-            "button:has-text('Send')",
-            "button:has-text('Send application')",
-            "button:has-text('Submit application')",
-            "input[type='submit']"
-        ]
-
-        for selector in submit_selectors:
-            try:
-                if page.is_visible(selector):
-                    # Highlight the button before clicking (for screenshot proof)
-                    page.evaluate(f"""(selector) => {{
-                        const el = document.querySelector(selector);
-                        if (el) {{
-                            el.style.border = '3px solid green';
-                        }}
-                    }}""", selector)
-
-                    # Take screenshot with highlighted submit button
-                    submit_highlighted_path = f"{screenshot_dir}/submit_button_highlighted.png"
-                    page.screenshot(path=submit_highlighted_path)
-                    proof_images.append(submit_highlighted_path)
-
-                    # Click the submit button
-                    page.click(selector)
-                    logger.info(f"Clicked submit button with selector: {selector}")
-                    submit_clicked = True
-
-                    # Wait for submission processing
-                    page.wait_for_timeout(5000)
-                    page.wait_for_load_state("networkidle", timeout=30000)
-                    break
-            except Exception as e:
-                logger.warning(f"Error with submit button selector {selector}: {str(e)}")
+        submit_button = page.locator(wttj_selectors.APPLICATION_SUBMIT_LOCATOR).first
+        try:
+            # Highlight the button before clicking (for screenshot proof)
+            if _debug_visuals(config):
+                submit_button.evaluate("el => el.style.border = '3px solid green'", timeout=3000)
+                recorder.capture("submit_button_highlighted")
+
+            # Click the submit button
+            submit_button.click(timeout=3000)
+            logger.info("Clicked submit button")
+            submit_clicked = True
+
+            # Wait for submission processing to show a success or failure message
+            _wait_for_page(page, wttj_selectors.SUBMISSION_OUTCOME_READY, timeout=15000)
+        except PwTimeout:
+            logger.warning("No clickable submit button appeared")
+        except PlaywrightError as e:
+            logger.warning(f"Error with submit button: {str(e)}")
 
         if not submit_clicked:
             logger.error("Could not find submit button")
-            no_submit_path = f"{screenshot_dir}/submit_button_not_found.png"
-            page.screenshot(path=no_submit_path)
-            proof_images.append(no_submit_path)
-            return False, proof_images
-
-        # Take screenshot after submission
-        after_submit_path = f"{screenshot_dir}/after_submit.png"
-        page.screenshot(path=after_submit_path)
-        proof_images.append(after_submit_path)
+            recorder.capture("submit_button_not_found")
+            return False
 
-        # Check for success indicators
+        # Check for success indicators; the outcome screenshot below also shows the page after submission
         submission_successful = _verify_submission_success(page)
 
         if submission_successful:
             logger.info(f"Application successfully submitted for {job.get('title', '')} at {job.get('company', '')}")
-            success_path = f"{screenshot_dir}/submission_success.png"
-            page.screenshot(path=success_path)
-            proof_images.append(success_path)
-            return True, proof_images
+            recorder.capture("submission_success")
+            return True
         else:
             logger.warning(f"Submission verification failed for {job.get('title', '')}")
-            failure_path = f"{screenshot_dir}/submission_verification_failed.png"
-            page.screenshot(path=failure_path)
-            proof_images.append(failure_path)
-            return False, proof_images
+            recorder.capture("submission_verification_failed")
+            return False
 
-    except Exception as e:
+    except PlaywrightError as e:
         logger.error(f"Error filling application form: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        error_path = f"{screenshot_dir}/form_fill_error.png"
-        try:
-            page.screenshot(path=error_path)
-            proof_images.append(error_path)
-        except:
-            pass
-        return False, proof_images
+        _log_traceback(config)
+        recorder.capture("form_fill_error")
+        return False
 
 
-def _fill_common_text_fields(page: Page, config: Settings) -> None:
-    """Fill in common text fields found in application forms."""
-    # Common field mapping
-    field_mapping = {
-        # Name fields
-        "input[name*='name' i]": config.user_name,
-        "input[name*='full' i][name*='name' i]": config.user_name,
-        "input[placeholder*='name' i]": config.user_name,
-
-        # Email fields
-        "input[type='email']": config.user_email,
-        "input[name*='email' i]": config.user_email,
-        "input[placeholder*='email' i]": config.user_email,
-
-        # Phone fields
-        "input[type='tel']": config.user_phone or "+33600000000",
-        "input[name*='phone' i]": config.user_phone or "+33600000000",
-        "input[placeholder*='phone' i]": config.user_phone or "+33600000000",
-
-        # LinkedIn fields
-        "input[name*='linkedin' i]": config.user_linkedin or "https://linkedin.com/in/user",
-        "input[placeholder*='linkedin' i]": config.user_linkedin or "https://linkedin.com/in/user",
-
-        # Cover letter or message fields (if text input rather than file)
-        "textarea[name*='cover' i]": "Please refer to the attached motivation letter.",
-        "textarea[name*='motivation' i]": "Please refer to the attached motivation letter.",
-        "textarea[name*='message' i]": "Please refer to the attached motivation letter.",
-        "textarea[placeholder*='cover' i]": "Please refer to the attached motivation letter.",
-        "textarea[placeholder*='motivation' i]": "Please refer to the attached motivation letter."
-    }
+def _classify_file_inputs(inputs: List[Dict[str, str]]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Pick the file inputs to upload the CV and the motivation letter to.
 
-    # Try to fill each field
-    for selector, value in field_mapping.items():
-        try:
-            if value and (page.is_visible(selector) or page.query_selector(selector)):
-                page.fill(selector, value)
-                logger.info(f"Filled field using selector: {selector}")
-        except Exception as e:
-            logger.debug(f"Could not fill field with selector {selector}: {str(e)}")
-            # Continue with other fields
+    Args:
+        inputs: name and accept attributes of the page's file inputs, in document order
+
+    Returns:
+        (cv_index, letter_index); either is None if no suitable input was found
+    """
+    def named(index: int, names: Tuple[str, ...]) -> bool:
+        name = inputs[index]["name"].lower()
+        return any(part in name for part in names)
 
+    indexes = range(len(inputs))
+    letter_index = next((i for i in indexes if named(i, wttj_selectors.LETTER_UPLOAD_NAMES)), None)
 
-def _verify_submission_success(page: Page) -> bool:
+    # CV: named like a resume, else the first PDF input, else the first input at all,
+    # never taking the input that is clearly meant for the letter
+    others = [i for i in indexes if i != letter_index]
+    cv_index = next((i for i in others if named(i, wttj_selectors.CV_UPLOAD_NAMES)), None)
+    if cv_index is None:
+        cv_index = next((i for i in others if "pdf" in inputs[i]["accept"].lower()), None)
+    if cv_index is None and others:
+        cv_index = others[0]
+    if cv_index is None and letter_index is not None:
+        # The only input is named for the letter; the CV matters more
+        cv_index, letter_index = letter_index, None
+
+    # Letter fallback: the second file input if there are several
+    if letter_index is None and len(inputs) > 1:
+        letter_index = next(i for i in indexes if i != cv_index)
+
+    return cv_index, letter_index
+
+
+def _fill_common_text_fields(page: "Page", config: Settings) -> None:
+    """Fill in common text fields found in application forms."""
+    # Values for this call, substituted into the module-level field template
+    values = {
+        "name": config.name,
+        "email": config.user_email,
+        "phone": config.user_phone or "+33600000000",
+        "linkedin": config.user_linkedin or "https://linkedin.com/in/user",
+        "cover_note": "Please refer to the attached motivation letter."
+    }
+    field_mapping = [(selector, values[key]) for selector, key in wttj_selectors.TEXT_FIELDS if values[key]]
+
+    # Fill every field in a single round-trip
+    try:
+        filled = page.evaluate(FILL_TEXT_FIELDS_JS, field_mapping)
+    except PlaywrightError as e:
+        logger.warning(f"Could not fill text fields: {str(e)}")
+        return
+
+    for selector in filled:
+        logger.info(f"Filled field using selector: {selector}")
+
+
+# Collects everything _verify_submission_success needs in one round-trip: the URL and whether
+# success, failure and form elements are visible. :has-text() is emulated as in FIRST_VISIBLE_JS.
+SUBMISSION_STATE_JS = """(args) => {""" + wttj_selectors.SELECTOR_HELPERS_JS + """
+    const firstVisible = (selectors) => {
+        for (const selector of selectors) {
+            const el = matchSelector(selector).find(isVisible);
+            if (el) {
+                return el;
+            }
+        }
+        return null;
+    };
+    const successText = new RegExp(args.successPattern, 'i');
+    const failure = firstVisible(args.failure);
+    return {
+        url: location.href,
+        success: Array.from(document.querySelectorAll(args.successElements))
+            .some(el => successText.test(el.textContent) && isVisible(el)),
+        formGone: firstVisible(args.form) === null,
+        failureText: failure ? failure.innerText.slice(0, 200) : null
+    };
+}"""
+
+
+def _verify_submission_success(page: "Page") -> bool:
     """Verify if the application was successfully submitted."""
+    # Read the URL and every indicator in a single evaluate instead of one query per check
+    try:
+        state = page.evaluate(SUBMISSION_STATE_JS, {
+            "successElements": wttj_selectors.SUBMISSION_SUCCESS_ELEMENTS,
+            "successPattern": wttj_selectors.SUBMISSION_SUCCESS_PATTERN,
+            "form": wttj_selectors.SUBMISSION_FORM_ELEMENTS,
+            "failure": wttj_selectors.SUBMISSION_FAILURE_INDICATORS
+        })
+    except PlaywrightError as e:
+        # The page may be navigating after the submit click; judge by the URL alone
+        logger.warning(f"Could not inspect page after submission: {str(e)}")
+        state = {"url": page.url, "success": False, "formGone": False, "failureText": None}
+
     # Success indicators
-    success_indicators = [
-        "div:has-text('Application submitted')",
-        "div:has-text('Thank you for your application')",
-        "div:has-text('Application received')",
-        "div:has-text('Application sent')",
-        "div:has-text('Success')",
-        "h1:has-text('Thank you')",
-        "h2:has-text('Thank you')"
-    ]
-
-    for indicator in success_indicators:
-        try:
-            if page.is_visible(indicator):
-                logger.info(f"Found submission success indicator: {indicator}")
-                return True
-        except:
-            continue
+    if state["success"]:
+        logger.info("Found submission success indicator")
+        return True
 
     # URL-based success check: sometimes redirects to a confirmation page
-    current_url = page.url
+    current_url = state["url"]
     if "confirm" in current_url or "success" in current_url or "thank" in current_url:
         logger.info(f"URL suggests successful submission: {current_url}")
         return True
 
     # Check for absence of form elements as success indicator
     # If the form disappeared, it might have been submitted successfully
-    form_gone = True
-    form_elements = [
-        "input[type='file']",
-        "button[type='submit']",
-        "textarea[name*='cover']"
-    ]
-
-    for element in form_elements:
-        if page.is_visible(element):
-            form_gone = False
-            break
-
-    if form_gone:
+    if state["formGone"]:
         logger.info("Form elements no longer visible - likely successful submission")
         return True
 
     # Look for failure indicators
-    failure_indicators = [
-        "div.error",
-        "p.error",
-        "div:has-text('Error')",
-        "div:has-text('Failed')"
-    ]
-
-    for indicator in failure_indicators:
-        try:
-            if page.is_visible(indicator):
-                error_text = page.inner_text(indicator)
-                logger.warning(f"Found submission failure indicator: {indicator} with text: {error_text}")
-                return False
-        except:
-            continue
+    if state["failureText"] is not None:
+        logger.warning(f"Found submission failure indicator with text: {state['failureText']}")
+        return False
 
     # If we can't clearly determine success or failure, assume it worked
     # Unless we're still on the same page with the form
@@ -1101,6 +1566,34 @@ def _verify_submission_success(page: Page) -> bool:
     return True
 
 
+def _stat_documents(documents: Dict[str, Any], stat_cache: Dict[str, os.stat_result]) -> Dict[str, Dict[str, Any]]:
+    """
+    Check the application documents once, before they are sent to a worker.
+
+    Args:
+        documents: Dictionary with paths to documents (CV and motivation letter)
+        stat_cache: Stat results already looked up in this batch, keyed by path
+
+    Returns:
+        {"cv": {"path": ..., "size": ...}, ...} with an entry only for documents that exist
+    """
+    checked = {}
+    # Only the file paths; the cv_html / letter_html entries hold whole documents as text
+    for name in ("cv", "letter"):
+        path = documents.get(name)
+        if not path:
+            continue
+        path = os.fspath(path)
+        if path not in stat_cache:
+            try:
+                stat_cache[path] = os.stat(path)
+            except OSError as e:
+                logger.warning(f"Document {name} is not readable: {str(e)}")
+                continue
+        checked[name] = {"path": path, "size": stat_cache[path].st_size}
+    return checked
+
+
 def submit_application(job: Dict[str, Any], documents: Dict[str, Any], config: Optional[Settings] = None) -> bool:
     """
     Submit an application through Welcome to the Jungle.
@@ -1113,53 +1606,95 @@ def submit_application(job: Dict[str, Any], documents: Dict[str, Any], config: O
     Returns:
         True if application was submitted successfully, False otherwise
     """
+    return submit_applications([(job, documents)], config)[0]
+
+
+def submit_applications(applications: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                        config: Optional[Settings] = None) -> List[bool]:
+    """
+    Submit a batch of applications through Welcome to the Jungle.
+
+    Args:
+        applications: List of (job, documents) pairs
+        config: Application settings
+
+    Returns:
+        One success flag per application, in the same order
+    """
+    results = [False] * len(applications)
+    for index, success in iter_submissions(applications, config):
+        results[index] = success
+    return results
+
+
+def iter_submissions(applications: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                     config: Optional[Settings] = None) -> Iterator[Tuple[int, bool]]:
+    """
+    Submit a batch of applications and yield each result as soon as it is ready.
+    Every application is dispatched to the worker pool up front so the workers'
+    browsers process them in parallel while the caller handles finished ones.
+
+    Args:
+        applications: List of (job, documents) pairs
+        config: Application settings
+
+    Yields:
+        (index, success) pairs in completion order, one per application
+    """
     config = config or Settings()
 
-    # For development mode, just simulate a successful submission
+    # For development mode, just simulate successful submissions
     if config.development_mode:
-        logger.info(f"[DEV MODE] Simulating successful application to {job.get('title', '')} at {job.get('company', '')}")
-        return True
+        for index, (job, _) in enumerate(applications):
+            logger.info(f"[DEV MODE] Simulating successful application to {job.get('title', '')} at {job.get('company', '')}")
+            yield index, True
+        return
 
-    logger.info(f"Starting application submission for {job.get('title', '')} at {job.get('company', '')}")
+    if not applications:
+        return
 
+    futures = {}
     try:
-        # Create a multiprocessing queue to get the result from the worker process
-        result_queue = multiprocessing.Queue()
-
         # Convert config to dict for serialization
         config_dict = config.dict()
 
-        # Create a new process to run the submission
-        process = multiprocessing.Process(
-            target=_submit_application_worker,
-            args=(job, documents, config_dict, result_queue)
-        )
-
-        # Start the process
-        process.start()
-
-        # Wait for the process to complete or timeout
-        process.join(timeout=300)  # 5 minute timeout
+        # Dispatch every submission to the persistent worker pool before waiting on any of them
+        pool = _get_worker_pool(config)
+        stat_cache = {}
+        for index, (job, documents) in enumerate(applications):
+            documents = _stat_documents(documents, stat_cache)
+            if "cv" not in documents:
+                logger.error(f"No CV available for {job.get('title', '')}, skipping submission")
+                yield index, False
+                continue
 
-        # Check if process timed out
-        if process.is_alive():
-            logger.error("Application submission timed out")
-            process.terminate()
-            process.join()
-            return False
+            logger.info(f"Starting application submission for {job.get('title', '')} at {job.get('company', '')}")
+            futures[pool.submit(job, documents, config_dict)] = index
 
-        # Get the result from the worker
-        result = {"success": False, "proof": []}
-        if not result_queue.empty():
-            result = result_queue.get()
+        # 5 minutes per application, for each round of applications the workers get through
+        timeout = 300 * math.ceil(len(applications) / pool.max_workers)
+        for future in as_completed(futures, timeout=timeout):
+            index = futures.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Application submission failed: {str(e)}")
+                yield index, False
+                continue
 
-        if result["proof"]:
-            logger.info(f"Captured {len(result['proof'])} proof screenshots during submission")
+            if result["proof"]:
+                logger.info(f"Captured {len(result['proof'])} proof screenshots during submission")
 
-        return result["success"]
+            yield index, result["success"]
 
+    except FuturesTimeoutError:
+        logger.error("Application submission timed out")
+        # A worker is stuck, so tear the pool down; it is recreated on the next submission
+        shutdown_worker_pool(terminate=True)
     except Exception as e:
         logger.error(f"Error submitting application: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return False
\ No newline at end of file
+        _log_traceback(config)
+
+    # Submissions that never finished count as failed
+    for index in futures.values():
+        yield index, False
@@ -4,23 +4,397 @@ Welcome to the Jungle (WTTJ) scraper module.
 This module provides functionality to scrape job listings from Welcome to the Jungle.
 """
 import os
+import re
+import html
 import time
-import sys
 import math
+import shelve
+import random
+import atexit
+import copy
+from types import MappingProxyType
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin, quote
+from urllib.parse import urlencode, urlsplit, parse_qsl
 
 from loguru import logger
-from playwright.sync_api import sync_playwright
 
-# Add parent directory to path to allow absolute imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from config import Settings
+from browser import wttj_selectors
+
+# Playwright and browsers shared by every scraper in this process, keyed by headless mode.
+# Each scraper only opens its own context, so creating another scraper doesn't start Chromium again.
+_playwright = None
+_browsers: Dict[bool, Any] = {}
+
+# Chromium features the scraper never uses
+_BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--mute-audio",
+    "--disable-features=AudioServiceOutOfProcess"
+]
+
+
+def _get_playwright():
+    """Return the process-wide Playwright instance, starting it on first use."""
+    global _playwright
+    if _playwright is None:
+        # Imported here so importing this module doesn't load Playwright until a browser is needed
+        from playwright.sync_api import sync_playwright
+        _playwright = sync_playwright().start()
+    return _playwright
+
+
+def _get_shared_browser(headless: bool = True):
+    """Return the process-wide browser for the given mode, launching it on first use."""
+    if headless not in _browsers:
+        _browsers[headless] = _get_playwright().chromium.launch(headless=headless, args=_BROWSER_ARGS)
+    return _browsers[headless]
+
+
+@atexit.register
+def close_shared_browsers() -> None:
+    """Close the shared browsers and stop Playwright."""
+    global _playwright
+    for browser in _browsers.values():
+        try:
+            browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing shared browser: {str(e)}")
+    _browsers.clear()
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+
+# Development mode job descriptions, formatted once per job type
+_MOCK_DESCRIPTION_TEMPLATE = """
+            We are looking for an experienced {job_type} to join our team.
+
+            Requirements:
+            - 3+ years of experience in {job_type} role
+            - Strong problem-solving skills
+            - Team player with excellent communication
+
+            What we offer:
+            - Competitive salary
+            - Remote work options
+            - Professional development opportunities
+            """
+_MOCK_DESCRIPTIONS = {
+    job_type: _MOCK_DESCRIPTION_TEMPLATE.format(job_type=job_type)
+    for job_type in ("data scientist", "python developer")
+}
+
+
+def _build_test_job(company: str, title: str) -> Dict[str, Any]:
+    """Build one development mode test job."""
+    company_slug = company.lower().replace(" ", "-")
+    job_slug = title.lower().replace(" ", "-")
+    return {
+        "id": f"{company_slug}_{job_slug}",
+        "title": title,
+        "company": company,
+        "url": f"https://www.welcometothejungle.com/en/companies/{company_slug}/jobs/{job_slug}",
+        "company_slug": company_slug,
+        "job_slug": job_slug,
+        "description": f"This is a test job for {title} at {company}. We're looking for someone with Python, SQL, and cloud experience.",
+        "requirements": "- 3+ years Python experience\n- SQL knowledge\n- Experience with cloud services\n- Good communication skills",
+        "allows_internal_application": True,
+        "is_premium": False,
+        "location": "Paris, France",
+        "skills": ["Python", "SQL", "AWS", "Git"]
+    }
+
+
+# Test jobs returned in development mode when no internal jobs are found; callers get copies
+_TEST_JOBS = [
+    _build_test_job(company, title)
+    for company, title in zip(
+        ["TechCorp", "DataSystems", "AILabs", "CloudServices", "DevOps Solutions"],
+        ["Python Developer", "Backend Engineer", "Data Scientist", "ML Engineer", "DevOps Engineer"]
+    )
+]
 
 
 class WTTJScraper:
     """Scrapes jobs from Welcome to the Jungle."""
 
+    # Requests the scraper never needs, aborted before they leave the browser. Stylesheets are
+    # kept because the visibility checks depend on the page layout
+    BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+    BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick", "segment.io", "segment.com", "hotjar", "datadoghq", "facebook.net")
+
+    # Logged-in cookies and local storage, shared with the application submission workers
+    STORAGE_STATE_PATH = "logs/wttj_storage.json"
+    STORAGE_STATE_MAX_AGE = 7 * 24 * 3600
+
+    # Job details from earlier runs, keyed by the job's URL slug, reused for a day before refetching
+    JOB_DETAILS_CACHE_PATH = "logs/job_details.cache"
+    JOB_DETAILS_MAX_AGE = 24 * 3600
+    # Captured job API responses kept for pages that haven't been parsed yet; the oldest go first
+    JOB_API_DATA_MAX = 64
+
+    # Cookie consent and region choice set before any page script runs, so the cookie banner and
+    # the "Looks like you're in France" modal don't render. The click handlers remain as a fallback
+    CONSENT_COOKIES = [
+        {"name": "wttj-cookie-consent", "value": "accepted", "domain": ".welcometothejungle.com", "path": "/"}
+    ]
+    # Set once the popups have been dismissed, so restored sessions and persistent profiles skip them
+    POPUPS_HANDLED_COOKIE = "wttj_scraper_popups_handled"
+    CONSENT_INIT_SCRIPT = """
+        try {
+            localStorage.setItem('wttj_cookie_consent', JSON.stringify({analytics: true, all: true}));
+            localStorage.setItem('wttj_preferred_region', 'international');
+        } catch (e) {}
+    """
+
+    # Login selectors from wttj_selectors, shared with the application submitter, each joined into
+    # one union so Playwright resolves the first visible match in a single query (see _visible_union)
+    COOKIE_BUTTONS = ", ".join(wttj_selectors.COOKIE_BUTTONS) + " >> visible=true"
+    EMAIL_INPUTS = ", ".join(wttj_selectors.LOGIN_EMAIL) + " >> visible=true"
+    PASSWORD_INPUTS = ", ".join(wttj_selectors.LOGIN_PASSWORD) + " >> visible=true"
+    LOGIN_SUBMIT_BUTTONS = ", ".join(wttj_selectors.LOGIN_SUBMIT) + " >> visible=true"
+    LINKEDIN_LOGIN_BUTTONS = ", ".join(wttj_selectors.LINKEDIN_LOGIN_BUTTONS) + " >> visible=true"
+    LINKEDIN_EMAIL_INPUTS = ", ".join(wttj_selectors.LINKEDIN_EMAIL) + " >> visible=true"
+    LINKEDIN_PASSWORD_INPUTS = ", ".join(wttj_selectors.LINKEDIN_PASSWORD) + " >> visible=true"
+    LINKEDIN_SUBMIT_BUTTONS = ", ".join(wttj_selectors.LINKEDIN_SUBMIT) + " >> visible=true"
+    LINKEDIN_ALLOW_BUTTONS = ", ".join(wttj_selectors.LINKEDIN_ALLOW) + " >> visible=true"
+
+    # Login state checks, evaluated together in the page by LOGIN_STATE_JS, in order of precedence
+    LOGIN_STATE_SELECTORS = [
+        ("avatar", wttj_selectors.AVATAR),
+        ("logged_in", wttj_selectors.LOGGED_IN_INDICATORS),
+        ("login_form", wttj_selectors.LOGIN_FORM_INDICATORS)
+    ]
+
+    # Signs that retrying the login form won't help: a CAPTCHA challenge or a rejected password
+    LOGIN_CAPTCHA = ", ".join([
+        "iframe[src*='captcha']",
+        "iframe[title*='challenge']",
+        "[class*='captcha']"
+    ])
+    # The text check uses the :text-matches() pseudo-class, since a text= engine selector can't be part of a CSS list
+    LOGIN_REJECTED = ", ".join([
+        "div.error-message",
+        ':text-matches("(invalid|incorrect|wrong).{0,30}(password|email|credentials)", "i")'
+    ])
+
+    # Returns the name of the first LOGIN_STATE_SELECTORS group with a visible match, or null.
+    # :has-text() is emulated by the shared selector helpers (see wttj_selectors.SELECTOR_HELPERS_JS).
+    LOGIN_STATE_JS = """(groups) => {""" + wttj_selectors.SELECTOR_HELPERS_JS + """
+        for (const [name, selectors] of groups) {
+            if (selectors.some(selector => matchSelector(selector).some(isVisible))) {
+                return name;
+            }
+        }
+        return null;
+    }"""
+
+    # Returns the selector, text and href of the first element matching one of the selectors, in
+    # list order, or null; with onlyVisible, hidden matches are skipped. :has-text() is emulated
+    # the same way as in LOGIN_STATE_JS.
+    FIRST_MATCH_JS = """({selectors, onlyVisible}) => {""" + wttj_selectors.SELECTOR_HELPERS_JS + """
+        for (const selector of selectors) {
+            const el = matchSelector(selector).find(el => !onlyVisible || isVisible(el));
+            if (el) {
+                return {selector, text: el.innerText.trim(), href: el.getAttribute('href')};
+            }
+        }
+        return null;
+    }"""
+
+    # Looks for internal application evidence in one round trip: the first matching indicator
+    # selector, or else the first keyword match in the main content's text, found with a single
+    # case-insensitive regex pass. Returns {indicator, keyword}
+    INTERNAL_APPLY_JS = """({selectors, keywordPattern}) => {
+        const indicator = (""" + FIRST_MATCH_JS + """)({selectors, onlyVisible: false});
+        if (indicator) {
+            return {indicator: indicator.selector, keyword: null};
+        }
+        const text = (document.querySelector('main') || document.body).innerText;
+        const match = new RegExp(keywordPattern, 'i').exec(text);
+        return {indicator: null, keyword: match ? match[0].toLowerCase() : null};
+    }"""
+
+    # Returns the text of the first match of each field's selectors (plain CSS), or '' per field.
+    # textContent is read instead of innerText, which would force a layout of the whole job page
+    JOB_FIELDS_JS = """(fields) => {
+        const pick = (selectors) => {
+            for (const selector of selectors) {
+                const el = document.querySelector(selector);
+                if (el) {
+                    return el.textContent.trim();
+                }
+            }
+            return '';
+        };
+        return Object.fromEntries(
+            Object.entries(fields).map(([field, selectors]) => [field, pick(selectors)])
+        );
+    }"""
+
+    # Reads every job card of a result page in one round trip and returns finished job dictionaries.
+    # Links whose path doesn't contain "<job>-at-<company>" after /jobs/ are skipped. Cards showing
+    # an external-apply badge or outbound link are flagged likely_external.
+    JOB_CARDS_JS = """({container, baseUrl}) => {
+        // Job slug up to the first "-at-", then the company slug up to the next path, query or fragment
+        const jobHref = /\\/jobs\\/(.+?)-at-([^/?#]+)/;
+        const jobs = [];
+        for (const link of document.querySelectorAll(container + " a[href*='/jobs/']:not([href*='@'])")) {
+            let href = link.getAttribute('href');
+            const match = jobHref.exec(href);
+            if (!match) {
+                continue;
+            }
+            const [, jobSlug, companySlug] = match;
+            const title = link.querySelector('h3, h4, .job-title');
+            const company = link.querySelector(".company-name, [data-testid='job-card-company']");
+            const card = link.closest('li, article') || link;
+            const likelyExternal = Boolean(
+                card.querySelector("[data-testid*='external'], a[target='_blank'][rel*='noopener']")
+            ) || /apply on company website/i.test(card.innerText);
+            // Build full URL if it's a relative URL
+            if (href.startsWith('/')) {
+                href = baseUrl + href;
+            }
+            jobs.push({
+                id: `${companySlug}_${jobSlug}`,
+                title: title ? title.innerText : 'Unknown Title',
+                company: company ? company.innerText : 'Unknown Company',
+                url: href,
+                job_slug: jobSlug,
+                company_slug: companySlug,
+                likely_external: likelyExternal
+            });
+        }
+        return jobs;
+    }"""
+
+    # Search result containers tried when the job list doesn't show up
+    ALT_JOB_CONTAINERS = (
+        "section.sc-bXCLTC",  # Common WTTJ class for job results
+        "div.ais-Hits",
+        "div[data-testid='search-results']"
+    )
+
+    # Job detail page selectors, each group tried in order by _first_match
+    TITLE_SELECTORS = (
+        "h1",
+        "h1.ais-Highlight",
+        "h2.ais-Highlight",
+        "h1[data-testid='job-title']"
+    )
+    COMPANY_SELECTORS = (
+        "a[data-testid='company-name']",
+        ".sc-bXCLTC",
+        "div[data-testid='company-name']"
+    )
+    DESCRIPTION_SELECTORS = (
+        "div[data-testid='job-description']",
+        ".sc-bXCLTC",
+        "section[data-testid='job-section-description']"
+    )
+    APPLY_BUTTON_SELECTORS = tuple(wttj_selectors.APPLY_BUTTONS)
+
+    # Elements and page text showing a job can be applied to on WTTJ itself. Generic elements such as
+    # submit buttons or dialogs are left out: search, newsletter and cookie UI put them on every page.
+    INTERNAL_INDICATORS = (
+        # Form elements or upload indicators
+        "input[type='file']",
+        "textarea[name*='cover']",
+        "textarea[name*='motivation']",
+        "form[action*='apply']",
+
+        # WTTJ-specific patterns
+        "h2:has-text('My information')",
+        "h2:has-text('Apply')",
+        "[data-testid='application-form']",
+
+        # Elements visible before clicking that indicate internal application
+        "[data-testid='job-apply-container']",
+        "div.job-application-container",
+        "button[data-testid='form-submit-button']",
+        "form[action*='welcometothejungle.com'] [data-testid='job-apply-button']",
+
+        # Text indicators
+        "div:has-text('Upload your resume')",
+        "div:has-text('Upload your CV')",
+        "div:has-text('Already have an account')"
+    )
+    INTERNAL_KEYWORDS = (
+        "upload your cv",
+        "upload your resume",
+        "fill in the form",
+        "cover letter",
+        "motivation letter",
+        "application form",
+        "sign in to apply",
+        "login to apply"
+    )
+    # All keywords as one regex alternation for INTERNAL_APPLY_JS
+    INTERNAL_KEYWORDS_PATTERN = "|".join(re.escape(keyword) for keyword in INTERNAL_KEYWORDS)
+
+    # Cookie consent buttons, then generic banners whose last button is clicked
+    COOKIE_ACCEPT_SELECTORS = tuple(wttj_selectors.COOKIE_BUTTONS)
+    COOKIE_BANNER_SELECTORS = (
+        "#cookie-banner",
+        ".cookie-banner",
+        ".cookie-consent",
+        ".cookie-notice",
+        "[data-testid*='cookie']",
+        ".wttj-sc-1c2f42q"  # Common WTTJ class for banners
+    )
+
+    # Location popup shown on the login page, and its stay and close buttons
+    LOGIN_POPUP_TEXT = "text=/looks like you.re in france|stay on the current website/i"
+    LOGIN_POPUP_STAY_BUTTONS = (
+        "button:has-text('Stay on the current website')",
+        "button:has-text('Stay on this website')",
+        "button:has-text('Stay')",
+        ".modal-footer button:nth-child(2)"  # Usually the second button is "Stay"
+    )
+    LOGIN_POPUP_CLOSE_BUTTONS = (
+        "button[aria-label='Close']",
+        "button.close",
+        "[data-testid='modal-close']"
+    )
+
+    # Region popup, and the buttons that keep the current website or close it
+    REGION_POPUP_SELECTORS = (
+        "[role='dialog']",
+        ".modal-content",
+        "div:has-text('Looks like you')"
+    )
+    REGION_STAY_BUTTONS = (
+        "button:has-text('Stay on the current website')",
+        "button:has-text('Stay')",
+        ".modal-footer button:nth-child(2)",  # Usually the second button is "Stay"
+        "[role='dialog'] button:nth-child(2)"
+    )
+    REGION_CLOSE_BUTTONS = (
+        "button[aria-label='Close']",
+        "button.close",
+        "[data-testid='modal-close']",
+        ".modal-header button"
+    )
+
+    # Coordinates of common locations, used instead of a geocoding service
+    LOCATION_COORDINATES = MappingProxyType({
+        "paris": "48.856614,2.3522219",
+        "lyon": "45.764043,4.835659",
+        "marseille": "43.296482,5.36978",
+        "lille": "50.62925,3.057256",
+        "bordeaux": "44.837789,-0.57918",
+        "toulouse": "43.604652,1.444209",
+        "nice": "43.7101728,7.2619532",
+        "nantes": "47.218371,-1.553621"
+    })
+    # Used when a location isn't in the table
+    DEFAULT_COORDINATES = LOCATION_COORDINATES["paris"]
+
     def __init__(self, settings: Optional[Settings] = None):
         """
         Initialize WTTJ scraper.
@@ -31,11 +405,26 @@ class WTTJScraper:
         self.settings = settings or Settings()
         self.base_url = "https://www.welcometothejungle.com"
         self.jobs_url = f"{self.base_url}/en/jobs"
+        self.search_urls = {locale: f"{self.base_url}/{locale}/jobs?" for locale in ("en", "fr")}
         self.page = None
         self.browser = None
         self.context = None
         self.logged_in = False
+        # Pages of the shared context loaded at the same time, for search results and job details
+        self.max_concurrent_pages = max(1, self.settings.scraper_max_pages)
+        # Cookie banner and region popup only need handling once per browser context
+        self.popups_handled = False
         self.logger = logger  # Use the imported logger
+        # Algolia credentials, index and search parameters seen in the search page's own requests,
+        # and the pooled HTTP client used to query that index directly once they are known
+        self.search_api = None
+        self.http_client = None
+        # Job JSON returned by WTTJ's own API while job pages load, keyed by job slug
+        self.job_api_data = {}
+        # Persistent job details cache, open while the browser is running
+        self.details_cache = None
+        # Screenshots and page sources of pages that loaded fine are only saved when debugging
+        self.debug = self.settings.development_mode or self.settings.capture_debug_visuals
 
         # Create logs directory if it doesn't exist
         os.makedirs("logs", exist_ok=True)
@@ -52,36 +441,250 @@ class WTTJScraper:
     def start_browser(self, headless: bool = True):
         """Start the browser session."""
         try:
-            playwright = sync_playwright().start()
-            browser_type = playwright.chromium
-            self.browser = browser_type.launch(headless=headless)
-            self.page = self.browser.new_page()
-            self.page.set_viewport_size({"width": 1280, "height": 800})
-            self.page.set_extra_http_headers({
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            })
+            context_options = {
+                "viewport": {"width": 1280, "height": 800},
+                "extra_http_headers": {
+                    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                }
+            }
+            profile_dir = self.settings.browser_profile_dir
+            if profile_dir:
+                # A persistent profile keeps the cookies and the HTTP cache between runs. It needs
+                # its own browser, and requests aren't routed since routing disables the cache
+                self.browser = None
+                self.context = _get_playwright().chromium.launch_persistent_context(
+                    user_data_dir=str(profile_dir),
+                    headless=headless,
+                    args=_BROWSER_ARGS,
+                    **context_options
+                )
+            else:
+                self.browser = _get_shared_browser(headless)
+                # One context for every page, so extra pages share the login cookies.
+                # A recent saved session is restored so login() can skip the login form.
+                self.context = self.browser.new_context(storage_state=self._load_storage_state(), **context_options)
+                self.context.route("**/*", self._route_request)
+            self.context.add_cookies(self.CONSENT_COOKIES)
+            self.context.add_init_script(self.CONSENT_INIT_SCRIPT)
+            self.context.on("request", self._capture_search_api)
+            self.context.on("response", self._capture_job_api_response)
+            self.popups_handled = any(
+                cookie["name"] == self.POPUPS_HANDLED_COOKIE for cookie in self.context.cookies(self.base_url)
+            )
+            # A persistent context opens with a blank page already
+            self.page = self.context.pages[0] if self.context.pages else self.context.new_page()
+            if self.details_cache is None:
+                self.details_cache = self._open_details_cache()
             self.logger.info("Browser started successfully")
             return True
         except Exception as e:
             self.logger.error(f"Failed to start browser: {str(e)}")
             return False
 
+    def _open_details_cache(self):
+        """
+        Open the on-disk job details cache.
+        Another scraper in this process may hold the dbm lock, so fall back to an
+        in-memory cache for this session rather than failing to start the browser.
+        """
+        try:
+            return shelve.open(self.JOB_DETAILS_CACHE_PATH)
+        except Exception as e:
+            self.logger.warning(f"Job details cache unavailable, using an in-memory cache: {str(e)}")
+            return {}
+
+    def _route_request(self, route) -> None:
+        """Abort images, media, fonts and tracker requests; let everything else through."""
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or any(host in request.url for host in self.BLOCKED_HOSTS):
+            route.abort()
+        else:
+            route.continue_()
+
+    def _capture_search_api(self, request) -> None:
+        """Remember the Algolia app id, API key, index and search parameters the WTTJ search page queries."""
+        if self.search_api is not None or "algolia" not in request.url:
+            return
+        try:
+            # The JS client sends the credentials either as headers or as query parameters
+            params = dict(parse_qsl(urlsplit(request.url).query))
+            headers = request.headers
+            app_id = headers.get("x-algolia-application-id") or params.get("x-algolia-application-id")
+            api_key = headers.get("x-algolia-api-key") or params.get("x-algolia-api-key")
+
+            # Multi-query requests name the index in the body, single queries in the path
+            index = None
+            search_params = None
+            body = request.post_data_json
+            if isinstance(body, dict) and body.get("requests"):
+                # Skip the facet-only queries (no hits requested) sent alongside the result query
+                for search_request in body["requests"]:
+                    raw_params = search_request.get("params") or ""
+                    params_dict = dict(parse_qsl(raw_params)) if isinstance(raw_params, str) else dict(raw_params)
+                    if str(params_dict.get("hitsPerPage")) != "0":
+                        index = search_request.get("indexName")
+                        search_params = params_dict
+                        break
+            elif isinstance(body, dict) and "/1/indexes/" in request.url:
+                index = urlsplit(request.url).path.split("/1/indexes/")[1].split("/")[0]
+                raw_params = body.get("params") or ""
+                search_params = dict(parse_qsl(raw_params)) if isinstance(raw_params, str) else dict(raw_params)
+
+            if app_id and api_key and index and index != "*" and search_params:
+                self.search_api = {
+                    "app_id": app_id,
+                    "api_key": api_key,
+                    "index": index,
+                    # Page size, filters and facets exactly as the site sends them, so pages
+                    # fetched from the API line up with the rendered ones
+                    "params": search_params,
+                    # Search page that sent the request, to tell which search the parameters belong to
+                    "search_key": self._search_key(request.frame.url)
+                }
+                self.logger.info(f"Captured search API index {index}")
+        except Exception as e:
+            self.logger.debug(f"Could not read search API request: {str(e)}")
+
+    def _capture_job_api_response(self, response) -> None:
+        """Keep the job JSON WTTJ's frontend fetches for a job page, so the page's DOM needn't be read."""
+        url = response.url
+        if "api.welcometothejungle.com" not in url or "/jobs/" not in url or not response.ok:
+            return
+        try:
+            data = response.json()
+            job = data.get("job") if isinstance(data, dict) else None
+            if isinstance(job, dict) and job.get("slug"):
+                self.job_api_data[job["slug"]] = job
+                # Responses for jobs that are never parsed (or come from the details cache) aren't
+                # popped, so drop the oldest ones to keep long runs from growing the dict forever
+                while len(self.job_api_data) > self.JOB_API_DATA_MAX:
+                    self.job_api_data.pop(next(iter(self.job_api_data)))
+        except Exception as e:
+            self.logger.debug(f"Could not read job API response {url}: {str(e)}")
+
+    def _job_fields_from_api(self, job_url: str) -> Optional[Dict[str, str]]:
+        """Return title, company and description from a captured job API response, if one arrived."""
+        job = self.job_api_data.pop(self._job_cache_key(job_url), None)
+        if not job or not job.get("name"):
+            return None
+        # The description is HTML; keep its text with one line per block
+        description = re.sub(r"<br\s*/?>|</(p|li|h\d|div)>", "\n", job.get("description") or "")
+        description = html.unescape(re.sub(r"<[^>]+>", "", description))
+        return {
+            "title": job["name"].strip(),
+            "company": (job.get("organization") or {}).get("name", "").strip(),
+            "description": re.sub(r"\n\s*\n+", "\n", description).strip()
+        }
+
+    def _search_api_page(self, query: str, location: Optional[str], radius: int, page_num: int) -> Optional[list]:
+        """
+        Fetch one result page straight from WTTJ's Algolia index, without rendering it.
+
+        Args:
+            query: Job search query
+            location: Location, or None for no location filter
+            radius: Search radius in km
+            page_num: Page number, starting from 1 like the website
+
+        Returns:
+            List of job dictionaries, or None if the API call failed and the browser should be used
+        """
+        # httpx is only needed once a search API key has been captured
+        import httpx
+
+        api = self.search_api
+        if api["search_key"] != self._search_key(self._build_search_url(query, location, radius, page_num)):
+            # Parameters belong to another search: render this one so its own get captured
+            self.search_api = None
+            return None
+        # Reuse the site's own parameters and only move to the requested page (Algolia pages start at 0)
+        params = dict(api["params"], page=page_num - 1)
+
+        if self.http_client is None:
+            # Keep-alive connections are reused for every page of the search
+            self.http_client = httpx.Client(
+                timeout=15.0,
+                limits=httpx.Limits(max_keepalive_connections=self.max_concurrent_pages),
+                headers={"Origin": self.base_url, "Referer": f"{self.base_url}/"}
+            )
+
+        try:
+            response = self.http_client.post(
+                f"https://{api['app_id']}-dsn.algolia.net/1/indexes/{api['index']}/query",
+                headers={"X-Algolia-Application-Id": api["app_id"], "X-Algolia-API-Key": api["api_key"]},
+                json={"params": urlencode(params)}
+            )
+            response.raise_for_status()
+            hits = response.json().get("hits", [])
+        except (httpx.HTTPError, ValueError) as e:
+            # Expired or restricted key: forget it and let the browser take over
+            self.logger.warning(f"Search API request failed, falling back to the browser: {str(e)}")
+            self.search_api = None
+            return None
+
+        locale = "fr" if "/fr/" in (self.page.url if self.page else "") else "en"
+        jobs = []
+        for hit in hits:
+            job_slug = hit.get("slug")
+            company = hit.get("organization") or {}
+            company_slug = company.get("slug")
+            if not job_slug or not company_slug:
+                continue
+            jobs.append({
+                "id": f"{company_slug}_{job_slug}",
+                "title": hit.get("name", ""),
+                "company": company.get("name", ""),
+                "url": f"{self.base_url}/{locale}/companies/{company_slug}/jobs/{job_slug}",
+                "job_slug": job_slug,
+                "company_slug": company_slug
+            })
+
+        self.logger.info(f"Found {len(jobs)} jobs on page {page_num} via the search API")
+        return jobs
+
     def close_browser(self):
-        """Close the browser session."""
-        if self.browser:
+        """Close the browser session; the shared browser itself stays up for other scrapers."""
+        if self.http_client:
+            self.http_client.close()
+            self.http_client = None
+        if isinstance(self.details_cache, shelve.Shelf):
+            self.details_cache.close()
+        self.details_cache = None
+        if self.context:
             try:
-                self.browser.close()
+                self.context.close()
                 self.logger.info("Browser closed successfully")
             except Exception as e:
                 self.logger.error(f"Error closing browser: {str(e)}")
             finally:
                 self.browser = None
+                self.context = None
                 self.page = None
 
-    def save_page_source(self, filepath="logs/page_source.html"):
-        """Save the current page source to a file for debugging."""
+    def _debug_capture(self, name: str, page=None, source: bool = False, force: bool = False) -> None:
+        """
+        Screenshot a page to logs/<name>.png when debugging, so pages that loaded fine cost nothing.
+
+        Args:
+            name: File name without extension
+            page: Page to capture, the main page by default
+            source: Also save the page source to logs/<name>.html
+            force: Capture even when not debugging, e.g. while retrying after a failure
+        """
+        if not (self.debug or force):
+            return
+        page = page or self.page
+        try:
+            page.screenshot(path=f"logs/{name}.png")
+        except Exception as e:
+            self.logger.warning(f"Could not take screenshot {name}: {str(e)}")
+        if source:
+            self.save_page_source(f"logs/{name}.html", page=page)
+
+    def save_page_source(self, filepath="logs/page_source.html", page=None):
+        """Save the source of the given page (the main page by default) to a file for debugging."""
         try:
-            content = self.page.content()
+            content = (page or self.page).content()
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(content)
             self.logger.info(f"Page source saved to {filepath}")
@@ -90,9 +693,89 @@ class WTTJScraper:
             self.logger.error(f"Failed to save page source: {str(e)}")
             return False
 
+    def _load_storage_state(self) -> Optional[str]:
+        """Return the saved storage state path if it exists and is recent enough to reuse."""
+        try:
+            if time.time() - os.path.getmtime(self.STORAGE_STATE_PATH) < self.STORAGE_STATE_MAX_AGE:
+                self.logger.info(f"Reusing saved session from {self.STORAGE_STATE_PATH}")
+                return self.STORAGE_STATE_PATH
+        except OSError:
+            pass
+        return None
+
+    def _save_session(self) -> None:
+        """Save the logged-in cookies and local storage so later runs can skip the login."""
+        try:
+            self.context.storage_state(path=self.STORAGE_STATE_PATH)
+            self.logger.info(f"Saved session to {self.STORAGE_STATE_PATH}")
+        except Exception as e:
+            self.logger.warning(f"Could not save session: {str(e)}")
+
+    def _cached_job_details(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """Return the job details saved by an earlier run if they are recent enough, unless refreshing."""
+        if self.details_cache is None or self.settings.refresh_job_details:
+            return None
+        entry = self.details_cache.get(self._job_cache_key(job_url))
+        if entry and time.time() - entry["fetched"] < self.JOB_DETAILS_MAX_AGE:
+            return entry["details"]
+        return None
+
+    @staticmethod
+    def _job_cache_key(job_url: str) -> str:
+        """Key job details by the last path segment of the job URL, without query parameters."""
+        return job_url.split("?")[0].rstrip("/").rsplit("/", 1)[-1]
+
+    def _visible_union(self, union: str):
+        """Locator for the first visible element matching a selector union, resolved in one query."""
+        return self.page.locator(union).first
+
+    def _wait_for_any(self, union: str, timeout: float = 5000):
+        """
+        Wait once for any of the selectors in a union to become visible.
+
+        Args:
+            union: One of the class-level selector unions, e.g. EMAIL_INPUTS
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            Locator for the first visible match, or None if nothing showed up in time
+        """
+        locator = self._visible_union(union)
+        try:
+            locator.wait_for(state="visible", timeout=timeout)
+            return locator
+        except Exception:
+            return None
+
     def login(self, username: str, password: str) -> bool:
         """
-        Log in to Welcome to the Jungle with improved reliability.
+        Log in to Welcome to the Jungle, reusing a saved session when it is still valid.
+
+        Args:
+            username: WTTJ username (email)
+            password: WTTJ password
+
+        Returns:
+            True if login was successful, False otherwise
+        """
+        # A restored session only counts if a logged-in element is actually shown
+        try:
+            self.page.goto(self.jobs_url, wait_until="domcontentloaded", timeout=30000)
+            if self._verify_login_success(require_indicator=True):
+                self.logger.info("Already logged in with the saved session")
+                self.logged_in = True
+                return True
+        except Exception as e:
+            self.logger.warning(f"Could not check saved session: {str(e)}")
+
+        self.logged_in = self._login_with_credentials(username, password)
+        if self.logged_in:
+            self._save_session()
+        return self.logged_in
+
+    def _login_with_credentials(self, username: str, password: str) -> bool:
+        """
+        Log in to Welcome to the Jungle through the login form, with retries.
 
         Args:
             username: WTTJ username (email)
@@ -105,8 +788,8 @@ class WTTJScraper:
             self.logger.warning("No login credentials provided")
             return False
 
-        # Number of retry attempts
-        max_retries = 2
+        # Number of retry attempts, spaced by _login_backoff
+        max_retries = 3
         retry_count = 0
 
         while retry_count <= max_retries:
@@ -124,10 +807,10 @@ class WTTJScraper:
                     self.logger.info("Clearing cookies and cache before retry")
                     self.page.context.clear_cookies()
 
-                # Navigate to login page with increased timeout
+                # Navigate to login page; the DOM is enough, analytics requests keep the network busy
                 try:
                     self.logger.info(f"Navigating to {login_url}")
-                    self.page.goto(login_url, timeout=60000)
+                    self.page.goto(login_url, wait_until="domcontentloaded", timeout=30000)
                 except Exception as e:
                     self.logger.warning(f"Navigation timeout, but continuing: {str(e)}")
                     # Even if timeout occurs, page might have loaded enough to continue
@@ -138,60 +821,46 @@ class WTTJScraper:
                     retry_count += 1
                     continue
 
-                # Wait for page to stabilize
+                # Wait for the login options we're about to use instead of waiting for network idle
                 try:
-                    self.page.wait_for_load_state("networkidle", timeout=15000)
+                    self.page.wait_for_selector('input[type="email"], a[href*="linkedin"]', timeout=10000)
                 except Exception as e:
-                    self.logger.warning(f"Wait for load state timed out, but continuing: {str(e)}")
+                    self.logger.warning(f"Login form did not appear, but continuing: {str(e)}")
 
-                # Take a screenshot before login
-                self.page.screenshot(path=f"logs/login_page_before_{retry_count}.png")
-                self.save_page_source(f"logs/login_page_before_{retry_count}.html")
+                # Take a screenshot before login when debugging or retrying after a failure
+                self._debug_capture(f"login_page_before_{retry_count}", source=True, force=retry_count > 0)
 
-                # Check for WTTJ maintenance page
-                if "maintenance" in self.page.content().lower():
+                # Check for WTTJ maintenance page with a text query rather than serializing the whole page
+                if self.page.locator("text=/maintenance/i").count() > 0:
                     self.logger.error("WTTJ site is in maintenance mode")
+                    self.save_page_source(f"logs/login_maintenance_{retry_count}.html")
                     return False
 
                 # Check if we're already logged in
-                sign_in_button = self.page.query_selector("text=Sign in")
-
-                if not sign_in_button:
+                if self.page.locator("text=Sign in").count() == 0:
                     self.logger.info("Already logged in or login page has different structure")
 
-                    # Check for user avatar which indicates logged-in state
-                    user_avatar = self.page.query_selector("a[href='/en/profile']") or self.page.query_selector("img[alt='User avatar']")
-                    if user_avatar:
+                    # Check for user avatar which indicates logged-in state, both selectors in one query
+                    if self.page.locator("a[href='/en/profile'], img[alt='User avatar']").count() > 0:
                         self.logger.info("Already logged in (detected user avatar)")
                         return True
 
                 # Handle cookie banner if present (with shorter timeout)
-                cookie_selectors = [
-                    "button:has-text('Accept all cookies')",
-                    "button:has-text('OK for me')",
-                    "button:has-text('Got it!')"
-                ]
-
-                for selector in cookie_selectors:
-                    try:
-                        if self.page.is_visible(selector, timeout=5000):
-                            self.page.click(selector)
-                            self.logger.info(f"Clicked cookie consent: {selector}")
-                            self.page.wait_for_timeout(1000)  # Wait a moment after clicking
-                            break
-                    except Exception as e:
-                        self.logger.warning(f"Error clicking cookie consent: {str(e)}")
+                try:
+                    cookie_button = self._visible_union(self.COOKIE_BUTTONS)
+                    if cookie_button.is_visible():
+                        cookie_button.click()
+                        self.logger.info("Clicked cookie consent")
+                except Exception as e:
+                    self.logger.warning(f"Error clicking cookie consent: {str(e)}")
 
                 # Handle location popup if present
                 location_popup_handled = self._handle_location_popup_during_login()
                 if location_popup_handled:
                     self.logger.info("Location popup handled during login")
 
-                # Wait briefly after handling popups
-                self.page.wait_for_timeout(1000)
-
                 # Take another screenshot after popups
-                self.page.screenshot(path=f"logs/login_after_popups_{retry_count}.png")
+                self._debug_capture(f"login_after_popups_{retry_count}", force=retry_count > 0)
 
                 # Try LinkedIn login first if available
                 linkedin_login = self._try_linkedin_login(username, password)
@@ -200,23 +869,15 @@ class WTTJScraper:
                     return True
 
                 # Find and fill email field - try multiple selectors for robustness
-                email_selectors = [
-                    'input[type="email"]',
-                    'input[name="email"]',
-                    'input[placeholder*="email" i]',
-                    'input[placeholder*="Email" i]'
-                ]
-
                 email_filled = False
-                for selector in email_selectors:
+                email_input = self._wait_for_any(self.EMAIL_INPUTS)
+                if email_input is not None:
                     try:
-                        if self.page.is_visible(selector, timeout=5000):
-                            self.page.fill(selector, username)
-                            self.logger.info(f"Filled email using selector: {selector}")
-                            email_filled = True
-                            break
+                        email_input.fill(username)
+                        self.logger.info("Filled email")
+                        email_filled = True
                     except Exception as e:
-                        self.logger.warning(f"Error filling email with selector {selector}: {str(e)}")
+                        self.logger.warning(f"Error filling email: {str(e)}")
 
                 if not email_filled:
                     self.logger.error("Could not find email field")
@@ -225,23 +886,15 @@ class WTTJScraper:
                     continue
 
                 # Find and fill password field
-                password_selectors = [
-                    'input[type="password"]',
-                    'input[name="password"]',
-                    'input[placeholder*="password" i]',
-                    'input[placeholder*="Password" i]'
-                ]
-
                 password_filled = False
-                for selector in password_selectors:
+                password_input = self._wait_for_any(self.PASSWORD_INPUTS)
+                if password_input is not None:
                     try:
-                        if self.page.is_visible(selector, timeout=5000):
-                            self.page.fill(selector, password)
-                            self.logger.info(f"Filled password using selector: {selector}")
-                            password_filled = True
-                            break
+                        password_input.fill(password)
+                        self.logger.info("Filled password")
+                        password_filled = True
                     except Exception as e:
-                        self.logger.warning(f"Error filling password with selector {selector}: {str(e)}")
+                        self.logger.warning(f"Error filling password: {str(e)}")
 
                 if not password_filled:
                     self.logger.error("Could not find password field")
@@ -250,27 +903,19 @@ class WTTJScraper:
                     continue
 
                 # Find and click submit button
-                submit_selectors = [
-                    'button[type="submit"]',
-                    'button:has-text("Log in")',
-                    'button:has-text("Sign in")',
-                    'input[type="submit"]'
-                ]
-
                 submit_clicked = False
-                for selector in submit_selectors:
+                submit_button = self._wait_for_any(self.LOGIN_SUBMIT_BUTTONS)
+                if submit_button is not None:
                     try:
-                        if self.page.is_visible(selector, timeout=5000):
-                            # Take a screenshot before clicking
-                            self.page.screenshot(path=f"logs/login_before_submit_{retry_count}.png")
-
-                            # Click the button
-                            self.page.click(selector)
-                            self.logger.info(f"Clicked submit button: {selector}")
-                            submit_clicked = True
-                            break
+                        # Take a screenshot before clicking
+                        self._debug_capture(f"login_before_submit_{retry_count}", force=retry_count > 0)
+
+                        # Click the button
+                        submit_button.click()
+                        self.logger.info("Clicked submit button")
+                        submit_clicked = True
                     except Exception as e:
-                        self.logger.warning(f"Error clicking submit with selector {selector}: {str(e)}")
+                        self.logger.warning(f"Error clicking submit: {str(e)}")
 
                 if not submit_clicked:
                     self.logger.error("Could not find login submit button")
@@ -278,15 +923,14 @@ class WTTJScraper:
                     retry_count += 1
                     continue
 
-                # Wait for navigation after login with more generous timeout
+                # Wait until we leave the login page, or for a logged-in or error element to show up
                 try:
-                    self.page.wait_for_load_state("networkidle", timeout=30000)
-                except Exception as e:
-                    self.logger.warning(f"Timeout waiting after login submit, but continuing: {str(e)}")
-
-                # Take a screenshot after login attempt
-                self.page.screenshot(path=f"logs/login_after_submit_{retry_count}.png")
-                self.save_page_source(f"logs/login_after_submit_{retry_count}.html")
+                    self.page.wait_for_url(lambda url: "/login" not in url and "/sign-in" not in url, timeout=15000)
+                except Exception:
+                    try:
+                        self.page.wait_for_selector("a[href='/en/profile'], div.error-message", timeout=15000)
+                    except Exception as e:
+                        self.logger.warning(f"Timeout waiting after login submit, but continuing: {str(e)}")
 
                 # Multiple checks to verify login success
                 login_success = self._verify_login_success()
@@ -294,228 +938,187 @@ class WTTJScraper:
                     self.logger.info("Login successful! Verification completed.")
                     return True
 
+                # Keep a screenshot and the page source of failed attempts for troubleshooting
+                self.page.screenshot(path=f"logs/login_after_submit_{retry_count}.png")
+                self.save_page_source(f"logs/login_after_submit_{retry_count}.html")
+
+                # Another attempt would hit the same CAPTCHA or rejected credentials
+                failure = self._classify_login_failure()
+                if failure != "transient":
+                    self.logger.error(f"Login failed ({failure}), not retrying")
+                    return False
+
                 # If we get here, login failed - try again
                 self.logger.warning(f"Login attempt {retry_count + 1} failed")
                 retry_count += 1
-
-                # Wait before next retry
-                self.page.wait_for_timeout(5000)
+                self._login_backoff(retry_count, max_retries)
 
             except Exception as e:
-                self.logger.error(f"Error during login attempt {retry_count + 1}: {str(e)}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.exception(f"Error during login attempt {retry_count + 1}: {str(e)}")
                 self.page.screenshot(path=f"logs/login_error_{retry_count}.png")
                 retry_count += 1
-
-                # Wait before next retry
-                self.page.wait_for_timeout(5000)
+                self._login_backoff(retry_count, max_retries)
 
         # If we get here, all retries failed
         self.logger.error(f"Login failed after {max_retries + 1} attempts")
         return False
 
 
+    def _classify_login_failure(self) -> str:
+        """
+        Tell failures worth retrying from those that would fail the same way again.
+
+        Returns:
+            "captcha", "bad_credentials" or "transient"
+        """
+        try:
+            if self.page.locator(self.LOGIN_CAPTCHA).count() > 0:
+                return "captcha"
+            if self.page.locator(self.LOGIN_REJECTED).count() > 0:
+                return "bad_credentials"
+        except Exception as e:
+            self.logger.warning(f"Error classifying login failure: {str(e)}")
+        return "transient"
+
+    def _login_backoff(self, retry_count: int, max_retries: int) -> None:
+        """Wait before the next login attempt: about 1s, 2s, then 4s with jitter; not at all after the last one."""
+        if retry_count <= max_retries:
+            delay = min(1000 * 2 ** (retry_count - 1), 4000)
+            # Jitter so parallel runs don't retry in lockstep
+            self.page.wait_for_timeout(int(delay * (0.5 + random.random())))
+
     def _handle_location_popup_during_login(self) -> bool:
         """Handle location popups specifically during login process."""
         try:
-            # Check for the "Looks like you're in France?" popup
-            france_popup_texts = [
-                "Looks like you're in France",
-                "It looks like you're in France",
-                "Stay on the current website"
-            ]
-
-            # Look for any text containing these phrases
-            for text in france_popup_texts:
-                try:
-                    text_element = self.page.query_selector(f"text={text}")
-                    if text_element:
-                        self.logger.info(f"Found location popup with text: {text}")
-
-                        # Look for "Stay" buttons
-                        stay_buttons = [
-                            "button:has-text('Stay on the current website')",
-                            "button:has-text('Stay on this website')",
-                            "button:has-text('Stay')",
-                            ".modal-footer button:nth-child(2)",  # Usually the second button is "Stay"
-                        ]
-
-                        for button in stay_buttons:
-                            try:
-                                if self.page.is_visible(button, timeout=3000):
-                                    self.page.click(button)
-                                    self.logger.info(f"Clicked 'Stay' button: {button} during login")
-                                    self.page.wait_for_timeout(1000)
-                                    return True
-                            except Exception as e:
-                                self.logger.warning(f"Error clicking stay button {button}: {str(e)}")
-
-                        # If we couldn't find a specific button, try clicking close button
-                        close_buttons = [
-                            "button[aria-label='Close']",
-                            "button.close",
-                            "[data-testid='modal-close']"
-                        ]
-
-                        for button in close_buttons:
-                            try:
-                                if self.page.is_visible(button, timeout=2000):
-                                    self.page.click(button)
-                                    self.logger.info(f"Clicked close button: {button} during login")
-                                    self.page.wait_for_timeout(1000)
-                                    return True
-                            except Exception as e:
-                                self.logger.warning(f"Error clicking close button {button}: {str(e)}")
-                except Exception as e:
-                    self.logger.warning(f"Error checking for text '{text}': {str(e)}")
+            # Check for the "Looks like you're in France?" popup with one text query
+            if self.page.locator(self.LOGIN_POPUP_TEXT).count() == 0:
+                return False
+            self.logger.info("Found location popup during login")
+
+            # Look for "Stay" buttons; if we couldn't find one, try clicking close button
+            for label, buttons in (("'Stay'", self.LOGIN_POPUP_STAY_BUTTONS), ("close", self.LOGIN_POPUP_CLOSE_BUTTONS)):
+                button = self._first_match(self.page, buttons, only_visible=True)
+                if button:
+                    self.page.locator(f"{button['selector']} >> visible=true").first.click()
+                    self.logger.info(f"Clicked {label} button: {button['selector']} during login")
+                    return True
 
             return False
         except Exception as e:
             self.logger.warning(f"Error in _handle_location_popup_during_login: {str(e)}")
             return False
 
+    def _wait_until_hidden(self, selector: str, timeout: int = 2000) -> None:
+        """Wait for a dismissed popup or banner to disappear instead of sleeping a fixed time."""
+        try:
+            self.page.wait_for_function(
+                f"(args) => !({self.FIRST_MATCH_JS})(args)",
+                arg={"selectors": [selector], "onlyVisible": True},
+                timeout=timeout
+            )
+        except Exception as e:
+            self.logger.debug(f"{selector} still visible after dismissing it: {str(e)}")
 
     def _try_linkedin_login(self, username: str, password: str) -> bool:
         """Try to login via LinkedIn if the option is available."""
         try:
-            linkedin_selectors = [
-                "a[href*='linkedin']",
-                "a:has-text('Continue with LinkedIn')",
-                "button:has-text('Continue with LinkedIn')",
-                "button:has-text('Sign in with LinkedIn')",
-                "a:has-text('Sign in with LinkedIn')"
-            ]
-
-            for selector in linkedin_selectors:
-                try:
-                    if self.page.is_visible(selector, timeout=3000):
-                        self.page.screenshot(path="logs/before_linkedin_click.png")
-                        self.logger.info(f"Found LinkedIn login option: {selector}")
+            # The login page has already rendered, so check for the option without waiting
+            linkedin_button = self._visible_union(self.LINKEDIN_LOGIN_BUTTONS)
+            if not linkedin_button.is_visible():
+                self.logger.info("No LinkedIn login option found")
+                return False
 
-                        # Click the LinkedIn button
-                        self.page.click(selector)
-                        self.logger.info("Clicked LinkedIn login button")
+            self._debug_capture("before_linkedin_click")
+            self.logger.info("Found LinkedIn login option")
 
-                        # Wait for LinkedIn page to load
-                        try:
-                            self.page.wait_for_load_state("networkidle", timeout=20000)
-                        except Exception as e:
-                            self.logger.warning(f"Timeout waiting for LinkedIn page to load: {str(e)}")
-
-                        self.page.screenshot(path="logs/linkedin_login_page.png")
-
-                        # Check if we're on LinkedIn domain
-                        if "linkedin.com" in self.page.url:
-                            self.logger.info("Successfully navigated to LinkedIn login")
-
-                            # Fill LinkedIn email field
-                            email_filled = False
-                            for email_selector in ["input#username", "input[name='session_key']", "input[type='email']"]:
-                                try:
-                                    if self.page.is_visible(email_selector, timeout=5000):
-                                        self.page.fill(email_selector, username)
-                                        self.logger.info(f"Filled LinkedIn email using selector: {email_selector}")
-                                        email_filled = True
-                                        break
-                                except Exception as e:
-                                    self.logger.warning(f"Error filling LinkedIn email: {str(e)}")
-
-                            if not email_filled:
-                                self.logger.error("Could not find LinkedIn email field")
-                                self.page.screenshot(path="logs/linkedin_email_not_found.png")
-                                return False
-
-                            # Fill LinkedIn password field
-                            password_filled = False
-                            for password_selector in ["input#password", "input[name='session_password']", "input[type='password']"]:
-                                try:
-                                    if self.page.is_visible(password_selector, timeout=5000):
-                                        self.page.fill(password_selector, password)
-                                        self.logger.info(f"Filled LinkedIn password using selector: {password_selector}")
-                                        password_filled = True
-                                        break
-                                except Exception as e:
-                                    self.logger.warning(f"Error filling LinkedIn password: {str(e)}")
-
-                            if not password_filled:
-                                self.logger.error("Could not find LinkedIn password field")
-                                self.page.screenshot(path="logs/linkedin_password_not_found.png")
-                                return False
-
-                            # Click LinkedIn sign in button
-                            sign_in_clicked = False
-                            for sign_in_selector in ["button[type='submit']", "button:has-text('Sign in')"]:
-                                try:
-                                    if self.page.is_visible(sign_in_selector, timeout=5000):
-                                        self.page.click(sign_in_selector)
-                                        self.logger.info(f"Clicked LinkedIn sign in button: {sign_in_selector}")
-                                        sign_in_clicked = True
-                                        break
-                                except Exception as e:
-                                    self.logger.warning(f"Error clicking LinkedIn sign in: {str(e)}")
-
-                            if not sign_in_clicked:
-                                self.logger.error("Could not find LinkedIn sign in button")
-                                self.page.screenshot(path="logs/linkedin_sign_in_not_found.png")
-                                return False
-
-                            # Wait for redirect back to WTTJ
-                            try:
-                                self.page.wait_for_load_state("networkidle", timeout=30000)
-                            except Exception as e:
-                                self.logger.warning(f"Timeout waiting for redirect after LinkedIn login: {str(e)}")
-
-                            self.page.screenshot(path="logs/after_linkedin_login.png")
-
-                            # Check for LinkedIn authorization screen
-                            authorize_clicked = False
-                            for authorize_selector in ["button:has-text('Allow')", "button:has-text('Authorize')", "button:has-text('Continue')"]:
-                                try:
-                                    if self.page.is_visible(authorize_selector, timeout=5000):
-                                        self.page.click(authorize_selector)
-                                        self.logger.info(f"Clicked LinkedIn authorization button: {authorize_selector}")
-                                        authorize_clicked = True
-                                        break
-                                except Exception as e:
-                                    self.logger.warning(f"Error with LinkedIn authorization: {str(e)}")
-
-                            if authorize_clicked:
-                                # Wait again for final redirect
-                                try:
-                                    self.page.wait_for_load_state("networkidle", timeout=30000)
-                                except Exception as e:
-                                    self.logger.warning(f"Timeout waiting after LinkedIn authorization: {str(e)}")
-
-                                self.page.screenshot(path="logs/after_linkedin_authorization.png")
-
-                                # Check if we're back on WTTJ and logged in
-                                if "welcometothejungle.com" in self.page.url:
-                                    login_success = self._verify_login_success()
-                                    if login_success:
-                                        self.logger.info("LinkedIn login successful!")
-                                        return True
-
-                                self.logger.warning("LinkedIn login process completed but login verification failed")
-                                return False
-                            else:
-                                self.logger.warning("Clicked LinkedIn login but didn't navigate to LinkedIn domain")
-                                return False
-                except Exception as e:
-                    self.logger.warning(f"Error with LinkedIn selector {selector}: {str(e)}")
+            # Click the LinkedIn button
+            linkedin_button.click()
+            self.logger.info("Clicked LinkedIn login button")
 
-            self.logger.info("No LinkedIn login option found")
+            # Wait for the redirect to LinkedIn; the email field wait below covers the rendering
+            try:
+                self.page.wait_for_url(lambda url: "linkedin.com" in url, timeout=20000)
+            except Exception as e:
+                self.logger.warning(f"Timeout waiting for LinkedIn page to load: {str(e)}")
+
+            self._debug_capture("linkedin_login_page")
+
+            # Check if we're on LinkedIn domain
+            if "linkedin.com" not in self.page.url:
+                self.logger.warning("Clicked LinkedIn login but didn't navigate to LinkedIn domain")
+                return False
+            self.logger.info("Successfully navigated to LinkedIn login")
+
+            # Fill LinkedIn email field
+            email_input = self._wait_for_any(self.LINKEDIN_EMAIL_INPUTS)
+            if email_input is None:
+                self.logger.error("Could not find LinkedIn email field")
+                self.page.screenshot(path="logs/linkedin_email_not_found.png")
+                return False
+            email_input.fill(username)
+            self.logger.info("Filled LinkedIn email")
+
+            # Fill LinkedIn password field
+            password_input = self._wait_for_any(self.LINKEDIN_PASSWORD_INPUTS)
+            if password_input is None:
+                self.logger.error("Could not find LinkedIn password field")
+                self.page.screenshot(path="logs/linkedin_password_not_found.png")
+                return False
+            password_input.fill(password)
+            self.logger.info("Filled LinkedIn password")
+
+            # Click LinkedIn sign in button
+            sign_in_button = self._wait_for_any(self.LINKEDIN_SUBMIT_BUTTONS)
+            if sign_in_button is None:
+                self.logger.error("Could not find LinkedIn sign in button")
+                self.page.screenshot(path="logs/linkedin_sign_in_not_found.png")
+                return False
+            sign_in_button.click()
+            self.logger.info("Clicked LinkedIn sign in button")
+
+            # Check for LinkedIn authorization screen, which is the next page to load after signing in
+            authorize_button = self._wait_for_any(self.LINKEDIN_ALLOW_BUTTONS, timeout=30000)
+
+            self._debug_capture("after_linkedin_login")
+
+            if authorize_button is None:
+                self.logger.warning("No LinkedIn authorization screen after signing in")
+                return False
+            authorize_button.click()
+            self.logger.info("Clicked LinkedIn authorization button")
+
+            # Wait for the final redirect back to WTTJ
+            try:
+                self.page.wait_for_url(lambda url: "welcometothejungle.com" in url, timeout=30000)
+            except Exception as e:
+                self.logger.warning(f"Timeout waiting after LinkedIn authorization: {str(e)}")
+
+            self._debug_capture("after_linkedin_authorization")
+
+            # Check if we're back on WTTJ and logged in
+            if "welcometothejungle.com" in self.page.url:
+                login_success = self._verify_login_success()
+                if login_success:
+                    self.logger.info("LinkedIn login successful!")
+                    return True
+
+            self.logger.warning("LinkedIn login process completed but login verification failed")
             return False
 
+
         except Exception as e:
-            self.logger.error(f"Error in LinkedIn login attempt: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Error in LinkedIn login attempt: {str(e)}")
             return False
 
 
-    def _verify_login_success(self) -> bool:
-        """Verify if login was successful using multiple checks."""
+    def _verify_login_success(self, require_indicator: bool = False) -> bool:
+        """
+        Verify if login was successful using multiple checks.
+
+        Args:
+            require_indicator: Only report success when a profile or logged-in element is found,
+                not merely because the page isn't a login page
+        """
 
         # Check 1: URL check - we should no longer be on the login page
         current_url = self.page.url
@@ -524,63 +1127,38 @@ class WTTJScraper:
 
             # Check for error messages
             try:
-                error_elements = self.page.query_selector_all("div.error-message, p.error, .error-text")
-                if error_elements:
-                    for error in error_elements:
-                        error_text = error.inner_text()
-                        if error_text:
-                            self.logger.error(f"Login error message: {error_text}")
+                error_texts = self.page.eval_on_selector_all(
+                    "div.error-message, p.error, .error-text", "els => els.map(el => el.innerText).filter(Boolean)"
+                )
+                for error_text in error_texts:
+                    self.logger.error(f"Login error message: {error_text}")
             except Exception as e:
                 self.logger.warning(f"Error checking for error messages: {str(e)}")
 
             return False
 
-        # Check 2: Look for user avatar or profile elements
-        avatar_selectors = [
-            "a[href='/en/profile']",
-            "img[alt='User avatar']",
-            "a[href*='account']",
-            ".user-profile-icon"
-        ]
-
-        for selector in avatar_selectors:
-            try:
-                if self.page.is_visible(selector, timeout=3000):
-                    self.logger.info(f"Found profile element after login: {selector}")
-                    return True
-            except Exception as e:
-                continue
-
-        # Check 3: Look for elements that indicate we're logged in
-        logged_in_indicators = [
-            "a:has-text('Profile')",
-            "a:has-text('My Account')",
-            "a:has-text('Sign out')",
-            "a:has-text('Log out')"
-        ]
+        # Checks 2-4: profile elements, logged-in indicators, or a login form still showing.
+        # The page evaluates every selector itself and is polled for up to 3s until one matches.
+        login_state = None
+        try:
+            handle = self.page.wait_for_function(self.LOGIN_STATE_JS, arg=self.LOGIN_STATE_SELECTORS, timeout=3000)
+            login_state = handle.json_value()
+        except Exception:
+            pass
 
-        for selector in logged_in_indicators:
-            try:
-                if self.page.is_visible(selector, timeout=3000):
-                    self.logger.info(f"Found logged-in indicator: {selector}")
-                    return True
-            except Exception as e:
-                continue
+        if login_state == "avatar":
+            self.logger.info("Found profile element after login")
+            return True
+        if login_state == "logged_in":
+            self.logger.info("Found logged-in indicator")
+            return True
 
-        # Check 4: Look for elements that indicate we're still in the login process
-        login_elements = [
-            "input[type='password']",
-            "button:has-text('Log in')",
-            "button:has-text('Sign in')"
-        ]
+        if require_indicator:
+            return False
 
-        for selector in login_elements:
-            try:
-                if self.page.is_visible(selector, timeout=3000):
-                    self.logger.warning(f"Still seeing login element: {selector} - login failed")
-                    return False
-            except Exception as e:
-                continue
+        if login_state == "login_form":
+            self.logger.warning("Still seeing login elements - login failed")
+            return False
 
         # If we've reached here without a clear indicator, check if we're still on the login page
         if "/login" not in current_url and "/sign-in" not in current_url:
@@ -607,182 +1185,242 @@ class WTTJScraper:
         jobs = []
         try:
             # Handle language/region settings
-            self._accept_cookies()
-            self._check_and_handle_region_popup()
-
-            # Determine if we should use English or French version
-            current_url = self.page.url
-            locale = "en"
-            if "/fr/" in current_url:
-                locale = "fr"
-                self.logger.info("Using French locale for search")
-
-            # Default Paris coordinates if no location specified
-            paris_coordinates = "48.856614,2.3522219"
-
-            # Build search URL with parameters
-            params = {
-                "query": query,
-                "page": page_num,
-                "aroundRadius": radius * 1000  # Convert to meters
-            }
+            self._handle_popups_once()
 
-            # Add location parameters if specified
-            if location:
-                # Try to get coordinates for the location
-                coordinates = self._get_coordinates_for_location(location) or paris_coordinates
-                params["aroundLatLng"] = coordinates
+            # Query the search index directly once an earlier page load revealed it
+            if self.search_api is not None:
+                api_jobs = self._search_api_page(query, location, radius, page_num)
+                if api_jobs is not None:
+                    return api_jobs
 
-                # Add country filter (default to France if not specified)
-                params["refinementList[offices.country_code][]"] = "FR"
+            search_url = self._build_search_url(query, location, radius, page_num)
+            self.logger.info(f"Searching jobs with URL: {search_url}")
+            self.page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
 
-            # Construct final search URL
-            search_params = "&".join([f"{k}={v}" for k, v in params.items()])
-            search_url = f"https://www.welcometothejungle.com/{locale}/jobs?{search_params}"
+            jobs = self._parse_job_listings(self.page, page_num)
 
-            self.logger.info(f"Searching jobs with URL: {search_url}")
-            self.page.goto(search_url, timeout=60000)
-            self.page.wait_for_load_state("networkidle", timeout=30000)
+        except Exception as e:
+            self.logger.exception(f"Error getting job listings: {str(e)}")
+
+        return jobs
+
+    def get_job_listings_range(self, query: str, location: str = None, radius: int = 20, pages: int = 1) -> List[list]:
+        """
+        Get job listings for the first few search result pages at once.
 
-            # Save page source for debugging
-            self.save_page_source(f"search_page_{page_num}.html")
-            self.page.screenshot(path=f"logs/search_page_{page_num}.png")
+        Playwright's sync API can't drive pages from several threads, so the concurrency
+        comes from the browser instead: up to max_concurrent_pages extra pages of the
+        shared context start loading before any of them is parsed.
+        Once a rendered page has revealed WTTJ's Algolia index, the other pages are
+        queried from it directly, falling back to the browser if the API call fails.
 
-            # Wait for the jobs container to load
-            job_container_selector = "[data-testid='job-list']"
+        Args:
+            query: Job search query (e.g., "Python Developer")
+            location: Location (e.g., "Paris")
+            radius: Search radius in km (default: 20)
+            pages: Number of result pages to fetch, starting from page 1
+
+        Returns:
+            List with the job dictionaries of each page, in page order
+        """
+        results = [[] for _ in range(pages)]
+        try:
+            # Cookies and region choice are stored in the context, so handle them once on the main page
+            self._handle_popups_once()
+        except Exception as e:
+            self.logger.warning(f"Error handling popups before search: {str(e)}")
+
+        page_nums = list(range(1, pages + 1))
+        # The first rendered page reveals the search API credentials, the others then come from the API
+        if self.search_api is None and page_nums:
+            results[0] = self._render_job_listings(query, location, radius, [1])[0]
+            page_nums = page_nums[1:]
+        if self.search_api is not None:
+            for position, page_num in enumerate(page_nums):
+                api_jobs = self._search_api_page(query, location, radius, page_num)
+                if api_jobs is None:
+                    # Render this page and the remaining ones instead
+                    page_nums = page_nums[position:]
+                    break
+                results[page_num - 1] = api_jobs
+            else:
+                page_nums = []
+
+        for page_num, jobs in zip(page_nums, self._render_job_listings(query, location, radius, page_nums)):
+            results[page_num - 1] = jobs
+
+        return results
+
+    def _render_job_listings(self, query: str, location: Optional[str], radius: int, page_nums: List[int]) -> List[list]:
+        """Load the given result pages in batches of browser tabs and parse them, in page order."""
+        results = [[] for _ in page_nums]
+        for first in range(0, len(page_nums), self.max_concurrent_pages):
+            batch = page_nums[first:first + self.max_concurrent_pages]
+            search_urls = [self._build_search_url(query, location, radius, page_num) for page_num in batch]
+            for search_url in search_urls:
+                self.logger.info(f"Searching jobs with URL: {search_url}")
+
+            tabs = self._open_pages(search_urls)
             try:
-                self.page.wait_for_selector(job_container_selector, timeout=10000)
-            except Exception as e:
-                self.logger.warning(f"Could not find job container: {str(e)}")
-                # Check for alternative job containers
-                alt_job_containers = [
-                    "section.sc-bXCLTC",  # Common WTTJ class for job results
-                    "div.ais-Hits",
-                    "div[data-testid='search-results']"
-                ]
-                for container in alt_job_containers:
+                for position, (page_num, tab) in enumerate(zip(batch, tabs), start=first):
                     try:
-                        if self.page.is_visible(container):
-                            job_container_selector = container
-                            self.logger.info(f"Found alternative job container: {container}")
-                            break
-                    except:
-                        continue
+                        results[position] = self._parse_job_listings(tab, page_num)
+                    except Exception as e:
+                        self.logger.warning(f"Error getting job listings for page {page_num}: {str(e)}")
+            finally:
+                for tab in tabs:
+                    tab.close()
 
-            # Parse job listings from the page
-            job_link_selector = f"{job_container_selector} a[href*='/jobs/']:not([href*='@'])"
-            job_elements = self.page.query_selector_all(job_link_selector)
+        return results
 
-            self.logger.info(f"Found {len(job_elements)} job elements on page {page_num}")
+    def _open_pages(self, urls: List[str]) -> list:
+        """
+        Open a new page of the shared context for each URL, without waiting for them to load.
 
-            for element in job_elements:
-                try:
-                    # Get job details
-                    href = element.get_attribute("href")
-
-                    # Extract job ID and slugs from URL
-                    job_parts = href.split("/jobs/")[1].split("-at-")
-                    if len(job_parts) >= 2:
-                        job_slug = job_parts[0].strip()
-                        company_slug = job_parts[1].split("/")[0].strip()
-
-                        # Get job title
-                        title_element = element.query_selector("h3, h4, .job-title")
-                        title = title_element.inner_text() if title_element else "Unknown Title"
-
-                        # Get company name
-                        company_element = element.query_selector(".company-name, [data-testid='job-card-company']")
-                        company = company_element.inner_text() if company_element else "Unknown Company"
-
-                        # Build full URL if it's a relative URL
-                        if href.startswith("/"):
-                            base_url = "https://www.welcometothejungle.com"
-                            href = f"{base_url}{href}"
-
-                        job = {
-                            "id": f"{company_slug}_{job_slug}",
-                            "title": title,
-                            "company": company,
-                            "url": href,
-                            "job_slug": job_slug,
-                            "company_slug": company_slug
-                        }
-                        jobs.append(job)
-                except Exception as e:
-                    self.logger.warning(f"Error parsing job element: {str(e)}")
-                    continue
+        Only the navigation commit is awaited, so the browser keeps loading every page in
+        parallel while the caller works through them. The caller closes the pages.
+
+        Args:
+            urls: URLs to open, at most max_concurrent_pages of them
+
+        Returns:
+            List of pages in the same order as the URLs
+        """
+        tabs = []
+        for url in urls:
+            tab = self.context.new_page()
+            tabs.append(tab)
+            try:
+                tab.goto(url, wait_until="commit", timeout=60000)
+            except Exception as e:
+                self.logger.warning(f"Error loading {url}: {str(e)}")
+        return tabs
+
+    def _handle_popups_once(self) -> None:
+        """Dismiss the cookie banner and region popup, unless already done in this context."""
+        if self.popups_handled:
+            return
+        accepted_cookies = self._accept_cookies()
+        dismissed_region = self._check_and_handle_region_popup()
+        # Nothing dismissed (e.g. no WTTJ page loaded yet): check again next time instead of
+        # remembering popups that are still to come
+        if not (accepted_cookies or dismissed_region):
+            return
+        self.popups_handled = True
+        try:
+            self.context.add_cookies([{
+                "name": self.POPUPS_HANDLED_COOKIE,
+                "value": "1",
+                "url": self.base_url,
+                "expires": time.time() + self.STORAGE_STATE_MAX_AGE
+            }])
+        except Exception as e:
+            self.logger.warning(f"Could not remember popup handling: {str(e)}")
+
+    @staticmethod
+    def _search_key(url: str) -> str:
+        """Identify a search by its URL without the page number, so every page of it shares the key."""
+        parts = urlsplit(url)
+        params = sorted((key, value) for key, value in parse_qsl(parts.query) if key != "page")
+        return f"{parts.path}?{urlencode(params)}"
+
+    def _build_search_url(self, query: str, location: Optional[str], radius: int, page_num: int) -> str:
+        """Build the job search URL for a result page, in the locale the main page is using."""
+        # Determine if we should use English or French version
+        current_url = self.page.url
+        locale = "en"
+        if "/fr/" in current_url:
+            locale = "fr"
+            self.logger.info("Using French locale for search")
+
+        # Build search URL with parameters
+        params = {
+            "query": query,
+            "page": page_num,
+            "aroundRadius": radius * 1000  # Convert to meters
+        }
+
+        # Add location parameters if specified
+        if location:
+            # Try to get coordinates for the location, defaulting to Paris
+            params["aroundLatLng"] = self._get_coordinates_for_location(location) or self.DEFAULT_COORDINATES
+
+            # Add country filter (default to France if not specified)
+            params["refinementList[offices.country_code][]"] = "FR"
+
+        # Construct final search URL, encoding spaces and accented city names
+        return self.search_urls[locale] + urlencode(params, doseq=True)
+
+    def _parse_job_listings(self, page, page_num: int) -> list:
+        """
+        Parse the job cards of a loaded search result page.
+
+        Args:
+            page: Page showing the search results
+            page_num: Result page number, used for logging and debug files
 
-            # Check if there are more pages
-            next_page_selector = "a[aria-label='Next']"
-            has_next_page = self.page.is_visible(next_page_selector)
+        Returns:
+            List of job dictionaries from the page
+        """
+        jobs = []
+
+        # Wait for the jobs container to load rather than for network idle
+        job_container_selector = "[data-testid='job-list']"
+        try:
+            page.wait_for_selector(job_container_selector, timeout=15000)
+        except Exception as e:
+            self.logger.warning(f"Could not find job container: {str(e)}")
+            # Check for alternative job containers, all in one evaluation
+            try:
+                container = self._first_match(page, self.ALT_JOB_CONTAINERS, only_visible=True)
+                if container:
+                    job_container_selector = container["selector"]
+                    self.logger.info(f"Found alternative job container: {job_container_selector}")
+            except Exception as e:
+                self.logger.warning(f"Error looking for alternative job containers: {str(e)}")
 
-            self.logger.info(f"Found {len(jobs)} jobs on page {page_num}, has_next_page: {has_next_page}")
+        # Save page source and screenshot for debugging
+        self._debug_capture(f"search_page_{page_num}", page=page, source=True)
 
+        # Parse all job cards in the page at once rather than querying each card from Python
+        try:
+            jobs.extend(page.evaluate(self.JOB_CARDS_JS, {"container": job_container_selector, "baseUrl": self.base_url}))
         except Exception as e:
-            self.logger.error(f"Error getting job listings: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.warning(f"Error parsing job elements: {str(e)}")
 
+        self.logger.info(f"Found {len(jobs)} jobs on page {page_num}")
         return jobs
 
-    def _check_and_handle_region_popup(self) -> None:
-        """Handle region popups that appear on WTTJ site"""
+    def _check_and_handle_region_popup(self) -> bool:
+        """Handle region popups that appear on WTTJ site. Returns True if a popup was dismissed."""
         try:
             # Look for "Looks like you're in France?" popup
-            selectors = [
-                "[role='dialog']",
-                ".modal-content",
-                "div:has-text('Looks like you')"
-            ]
-
-            for selector in selectors:
-                if self.page.is_visible(selector, timeout=3000):
-                    self.logger.info(f"Found region popup: {selector}")
-                    self.page.screenshot(path=f"logs/region_popup.png")
-
-                    # Look for the stay button
-                    stay_buttons = [
-                        "button:has-text('Stay on the current website')",
-                        "button:has-text('Stay')",
-                        ".modal-footer button:nth-child(2)",  # Usually the second button is "Stay"
-                        "[role='dialog'] button:nth-child(2)"
-                    ]
-
-                    for button in stay_buttons:
-                        try:
-                            if self.page.is_visible(button):
-                                self.page.click(button)
-                                self.logger.info(f"Clicked 'Stay' button: {button}")
-                                self.page.wait_for_timeout(2000)
-                                return
-                        except Exception as e:
-                            self.logger.warning(f"Error clicking stay button {button}: {str(e)}")
-
-                    # If we couldn't find a specific button, try clicking close button
-                    close_buttons = [
-                        "button[aria-label='Close']",
-                        "button.close",
-                        "[data-testid='modal-close']",
-                        ".modal-header button"
-                    ]
-
-                    for button in close_buttons:
-                        try:
-                            if self.page.is_visible(button):
-                                self.page.click(button)
-                                self.logger.info(f"Clicked close button: {button}")
-                                self.page.wait_for_timeout(2000)
-                                return
-                        except Exception as e:
-                            self.logger.warning(f"Error clicking close button {button}: {str(e)}")
+            popup = self._first_match(self.page, self.REGION_POPUP_SELECTORS, only_visible=True)
+            if not popup:
+                return False
+            self.logger.info(f"Found region popup: {popup['selector']}")
+            self._debug_capture("region_popup")
+
+            # Look for the stay button; if we couldn't find one, try clicking close button
+            for label, buttons in (("'Stay'", self.REGION_STAY_BUTTONS), ("close", self.REGION_CLOSE_BUTTONS)):
+                button = self._first_match(self.page, buttons, only_visible=True)
+                if button:
+                    self.page.locator(f"{button['selector']} >> visible=true").first.click()
+                    self.logger.info(f"Clicked {label} button: {button['selector']}")
+                    self._wait_until_hidden(popup["selector"])
+                    return True
 
         except Exception as e:
             self.logger.warning(f"Error handling region popup: {str(e)}")
+        return False
 
-    def _get_coordinates_for_location(self, location: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_coordinates_for_location(location: str) -> str:
         """
         Get coordinates for a location.
         This is a simple implementation that returns hardcoded coordinates for common locations.
+        Results are cached, so repeated searches for the same location skip the normalization.
 
         Args:
             location: Location name
@@ -790,33 +1428,31 @@ class WTTJScraper:
         Returns:
             String with latitude,longitude or None if not found
         """
-        location_map = {
-            "paris": "48.856614,2.3522219",
-            "lyon": "45.764043,4.835659",
-            "marseille": "43.296482,5.36978",
-            "lille": "50.62925,3.057256",
-            "bordeaux": "44.837789,-0.57918",
-            "toulouse": "43.604652,1.444209",
-            "nice": "43.7101728,7.2619532",
-            "nantes": "47.218371,-1.553621"
-        }
+        # Normalize location name; None if not found - we'll use default coordinates
+        return WTTJScraper.LOCATION_COORDINATES.get(location.lower().strip())
 
-        # Normalize location name
-        normalized_location = location.lower().strip()
+    def _first_match(self, page, selectors: List[str], only_visible: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find the first element matching one of the selectors with a single page evaluation.
 
-        # Check if we have coordinates for this location
-        if normalized_location in location_map:
-            return location_map[normalized_location]
+        Args:
+            page: Page to search
+            selectors: Selectors tried in order; :has-text() is supported
+            only_visible: Skip elements that aren't visible
 
-        # Return None if not found - we'll use default coordinates
-        return None
+        Returns:
+            Dictionary with the matching selector and the element's text and href, or None
+        """
+        return page.evaluate(self.FIRST_MATCH_JS, {"selectors": list(selectors), "onlyVisible": only_visible})
 
-    def get_job_details(self, job_url: str) -> Dict[str, Any]:
+    def get_job_details(self, job_url: str, preloaded_page=None) -> Dict[str, Any]:
         """
         Extract job details from a job page.
 
         Args:
             job_url: URL of the job posting
+            preloaded_page: Page already navigating to job_url (see _open_pages);
+                by default the main page is navigated to it
 
         Returns:
             Dictionary with job details
@@ -825,6 +1461,12 @@ class WTTJScraper:
         if self.settings.development_mode and "company-example" in job_url:
             return self._get_mock_job_details(job_url)
 
+        # Reuse details fetched by an earlier run
+        cached = self._cached_job_details(job_url)
+        if cached is not None:
+            self.logger.info(f"Using cached job details for {job_url}")
+            return cached
+
         details = {
             "title": "",
             "company": "",
@@ -836,213 +1478,66 @@ class WTTJScraper:
 
         try:
             # Navigate to the job page
-            self.page.goto(job_url, timeout=15000)
-            self.page.wait_for_load_state("networkidle", timeout=10000)
+            page = preloaded_page or self.page
+            if preloaded_page is None:
+                page.goto(job_url, wait_until="domcontentloaded", timeout=15000)
+
+            # Wait for the job title or apply button rather than for network idle, which
+            # WTTJ's analytics requests can delay for the whole timeout
+            try:
+                page.wait_for_selector("h1, [data-testid='job-apply-button']", state="attached", timeout=5000)
+            except Exception as e:
+                self.logger.warning(f"Job page content did not appear, but continuing: {str(e)}")
 
             # Save page for debugging
             job_id_safe = details['id'].split('?')[0]  # Remove query params for filename
-            self.save_page_source(f"logs/job_page_{job_id_safe}.html")
-            self.page.screenshot(path=f"logs/job_page_{job_id_safe}.png")
-
-            # Extract job title
-            title_selectors = [
-                "h1",
-                "h1.ais-Highlight",
-                "h2.ais-Highlight",
-                "h1[data-testid='job-title']"
-            ]
-            for selector in title_selectors:
-                title_element = self.page.query_selector(selector)
-                if title_element:
-                    details["title"] = title_element.inner_text().strip()
-                    break
+            self._debug_capture(f"job_page_{job_id_safe}", page=page, source=True)
 
-            # Extract company name
-            company_selectors = [
-                "a[data-testid='company-name']",
-                ".sc-bXCLTC",
-                "div[data-testid='company-name']"
-            ]
-            for selector in company_selectors:
-                company_element = self.page.query_selector(selector)
-                if company_element:
-                    details["company"] = company_element.inner_text().strip()
-                    break
-
-            # Extract job description
-            description_selectors = [
-                "div[data-testid='job-description']",
-                ".sc-bXCLTC",
-                "section[data-testid='job-section-description']"
-            ]
-            for selector in description_selectors:
-                description_element = self.page.query_selector(selector)
-                if description_element:
-                    details["description"] = description_element.inner_text().strip()
-                    break
+            # Use the job JSON the page itself fetched when it arrived; otherwise extract job title,
+            # company name and description from the DOM in one evaluation
+            api_fields = self._job_fields_from_api(job_url)
+            if api_fields:
+                details.update(api_fields)
+            else:
+                details.update(page.evaluate(self.JOB_FIELDS_JS, {
+                    "title": list(self.TITLE_SELECTORS),
+                    "company": list(self.COMPANY_SELECTORS),
+                    "description": list(self.DESCRIPTION_SELECTORS)
+                }))
 
             # More robust way to check if this allows internal application - no clicking needed
 
             # 1. Check if the apply button exists and what kind it is
-            apply_button_selectors = [
-                "a[data-testid='job-apply-button']",
-                "button[data-testid='job-apply-button']",
-                "a.ais-Highlight",
-                "a[href*='apply']",
-                "button:has-text('Apply')"
-            ]
-
             # First, try to determine if we have an external link
-            for selector in apply_button_selectors:
-                apply_button = self.page.query_selector(selector)
-                if apply_button and apply_button.is_visible():
-                    # Check if it's an external link
-                    href = apply_button.get_attribute("href")
-                    if href:
-                        # If link goes to external site, it's not an internal application
-                        if (href.startswith("http://") or href.startswith("https://")) and self.base_url not in href:
-                            self.logger.info(f"Apply button leads to external URL: {href}")
-                            details["allow_internal_apply"] = False
-                            break
-
+            apply_button = self._first_match(page, self.APPLY_BUTTON_SELECTORS, only_visible=True)
+            if apply_button:
+                # Check if it's an external link
+                href = apply_button["href"]
+                if href and (href.startswith("http://") or href.startswith("https://")) and self.base_url not in href:
+                    # If link goes to external site, it's not an internal application
+                    self.logger.info(f"Apply button leads to external URL: {href}")
+                    details["allow_internal_apply"] = False
+                else:
                     # Check button text for clues
-                    button_text = apply_button.inner_text().lower()
+                    button_text = apply_button["text"].lower()
                     if "apply on company website" in button_text or "external" in button_text:
                         details["allow_internal_apply"] = False
-                        break
 
-                    # If we made it here, it's likely an internal button
-                    # But let's do more checks to be sure
-
-            # 2. Check for direct evidence of internal application capability
-            internal_indicators = [
-                # Form elements or upload indicators
-                "input[type='file']",
-                "textarea[name*='cover']",
-                "textarea[name*='motivation']",
-                "form[action*='apply']",
-                "button[type='submit']",
-
-                # WTTJ-specific patterns
-                "div[role='dialog']",
-                "h2:has-text('My information')",
-                "h2:has-text('Apply')",
-                "[data-testid='application-form']",
-
-                # Elements visible before clicking that indicate internal application
-                "[data-testid='job-apply-container']",
-                "div.job-application-container",
-                "button[data-testid='form-submit-button']",
-
-                # Text indicators
-                "div:has-text('Upload your resume')",
-                "div:has-text('Upload your CV')",
-                "div:has-text('Already have an account')"
-            ]
-
-            for indicator in internal_indicators:
-                if self.page.query_selector(indicator):
-                    self.logger.info(f"Found internal application indicator: {indicator}")
-                    details["allow_internal_apply"] = True
-                    break
+                # If we made it here, it's likely an internal button
+                # But let's do more checks to be sure
 
-            # 3. Check page source for key patterns if we still don't know
-            if not details["allow_internal_apply"]:
-                page_content = self.page.content().lower()
-                internal_keywords = [
-                    "upload your cv",
-                    "upload your resume",
-                    "fill in the form",
-                    "cover letter",
-                    "motivation letter",
-                    "application form",
-                    "sign in to apply",
-                    "login to apply"
-                ]
-
-                for keyword in internal_keywords:
-                    if keyword in page_content:
-                        self.logger.info(f"Found internal application keyword in page content: {keyword}")
-                        details["allow_internal_apply"] = True
-                        break
-
-            # 4. Final check - if there's an apply button, but we haven't determined it's external,
-            # and we don't have clear signs of an internal application, we'll try a simulated click
-            # just to see if a dialog or form appears without actually processing it
-            if not details["allow_internal_apply"]:
-                for selector in apply_button_selectors:
-                    apply_button = self.page.query_selector(selector)
-                    if apply_button and apply_button.is_visible():
-                        try:
-                            self.logger.info("Performing safe click check on apply button")
-
-                            # Create a MutationObserver to detect if a dialog or form appears
-                            dialog_check_script = """
-                            () => {
-                                return new Promise((resolve) => {
-                                    // Flag to track if we found anything
-                                    let foundDialog = false;
-
-                                    // Set up mutation observer
-                                    const observer = new MutationObserver((mutations) => {
-                                        for (const mutation of mutations) {
-                                            if (mutation.addedNodes.length) {
-                                                // Check if any added nodes look like dialogs or forms
-                                                for (const node of mutation.addedNodes) {
-                                                    if (node.nodeType === 1) { // Element node
-                                                        const element = node;
-                                                        if (
-                                                            element.tagName === 'FORM' ||
-                                                            element.tagName === 'DIALOG' ||
-                                                            element.getAttribute('role') === 'dialog' ||
-                                                            element.classList.contains('modal') ||
-                                                            element.querySelector('form') ||
-                                                            element.querySelector('input[type="file"]') ||
-                                                            element.querySelector('textarea')
-                                                        ) {
-                                                            foundDialog = true;
-                                                            observer.disconnect();
-                                                            resolve(true);
-                                                            return;
-                                                        }
-                                                    }
-                                                }
-                                            }
-                                        }
-                                    });
-
-                                    // Start observing
-                                    observer.observe(document.body, {
-                                        childList: true,
-                                        subtree: true
-                                    });
-
-                                    // Click the button
-                                    const button = document.querySelector('""" + selector + """');
-                                    if (button) {
-                                        button.click();
-                                    }
-
-                                    // Set timeout to resolve if nothing happens
-                                    setTimeout(() => {
-                                        observer.disconnect();
-                                        resolve(foundDialog);
-                                    }, 5000);
-                                });
-                            }
-                            """
-
-                            # Run the dialog check script
-                            found_dialog = self.page.evaluate(dialog_check_script)
-
-                            if found_dialog:
-                                self.logger.info("Dialog or form detected after click - this is likely an internal application")
-                                details["allow_internal_apply"] = True
-                                break
-
-                        except Exception as e:
-                            self.logger.error(f"Error during safe click check: {str(e)}")
-                            # Error doesn't change our result, just continue with what we know
+            # 2. Check for direct evidence of internal application capability, and
+            # 3. check the page text for key patterns if we still don't know, in one evaluation
+            evidence = page.evaluate(self.INTERNAL_APPLY_JS, {
+                "selectors": list(self.INTERNAL_INDICATORS),
+                "keywordPattern": self.INTERNAL_KEYWORDS_PATTERN
+            })
+            if evidence["indicator"]:
+                self.logger.info(f"Found internal application indicator: {evidence['indicator']}")
+                details["allow_internal_apply"] = True
+            elif evidence["keyword"]:
+                self.logger.info(f"Found internal application keyword in page content: {evidence['keyword']}")
+                details["allow_internal_apply"] = True
 
             # Report the determination
             if details["allow_internal_apply"]:
@@ -1050,10 +1545,12 @@ class WTTJScraper:
             else:
                 self.logger.info(f"Job does NOT allow internal application: {details['title']} at {details['company']}")
 
+            # Only keep pages that actually rendered a job
+            if details["title"] and self.details_cache is not None:
+                self.details_cache[self._job_cache_key(job_url)] = {"fetched": time.time(), "details": details}
+
         except Exception as e:
-            self.logger.error(f"Error extracting job details: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Error extracting job details: {str(e)}")
 
         return details
 
@@ -1073,19 +1570,7 @@ class WTTJScraper:
         return {
             "title": f"Senior {job_type.title()}",
             "company": "Example Company",
-            "description": f"""
-            We are looking for an experienced {job_type} to join our team.
-
-            Requirements:
-            - 3+ years of experience in {job_type} role
-            - Strong problem-solving skills
-            - Team player with excellent communication
-
-            What we offer:
-            - Competitive salary
-            - Remote work options
-            - Professional development opportunities
-            """,
+            "description": _MOCK_DESCRIPTIONS[job_type],
             "url": job_url,
             "id": job_id,
             "allow_internal_apply": True  # Always allow internal apply for mock jobs
@@ -1114,53 +1599,65 @@ class WTTJScraper:
             est_pages = max(1, math.ceil(max_jobs / 15))
             self.logger.info(f"Collecting up to {max_jobs} internal jobs, checking ~{est_pages} pages")
 
-            # Iterate through pages
-            page_num = 1
+            # Fetch the listing pages concurrently, then go through them in order
+            listing_pages = self.get_job_listings_range(query=query, location=location, radius=radius, pages=est_pages)
             total_found = 0
 
-            while page_num <= est_pages and total_found < max_jobs:
-                self.logger.info(f"Fetching jobs from page {page_num}")
-
-                # Get job listings for this page
-                page_jobs = self.get_job_listings(query=query, location=location, radius=radius, page_num=page_num)
+            for page_num, page_jobs in enumerate(listing_pages, start=1):
+                if total_found >= max_jobs:
+                    break
 
                 if not page_jobs:
                     self.logger.info(f"No jobs found on page {page_num}, stopping search")
                     break
 
-                # Check each job URL for internal application option
-                for job in page_jobs:
+                # Check each job URL for internal application option. Up to max_concurrent_pages
+                # job pages keep loading in parallel: each checked page is replaced by the next URL
+                # Jobs whose listing card already shows an external application are skipped
+                pending_urls = [job.get("url") for job in page_jobs if job.get("url") and not job.get("likely_external")]
+                # Cached jobs don't need a page at all
+                cached_urls = [job_url for job_url in pending_urls if self._cached_job_details(job_url) is not None]
+                pending_urls = [job_url for job_url in pending_urls if job_url not in cached_urls]
+                for job_url in cached_urls:
                     if total_found >= max_jobs:
                         break
+                    detailed_job = self.get_job_details(job_url)
+                    if detailed_job.get("allow_internal_apply", False):
+                        internal_jobs.append(detailed_job)
+                        total_found += 1
 
-                    job_url = job.get("url")
-                    if not job_url:
-                        continue
-
-                    # Get detailed job info
-                    try:
-                        detailed_job = self.get_job_details(job_url)
-
-                        # Check multiple possible field names for internal application permission
-                        allows_internal = (
-                            detailed_job.get("allows_internal_application", False) or
-                            detailed_job.get("allow_internal_apply", False) or
-                            detailed_job.get("internal_application", False)
-                        )
-
-                        if allows_internal:
-                            self.logger.info(f"Found job that allows internal application: {detailed_job.get('title')} at {detailed_job.get('company')}")
-                            internal_jobs.append(detailed_job)
-                            total_found += 1
-
-                            # Add short delay to avoid rate limiting
-                            time.sleep(1)
-                    except Exception as e:
-                        self.logger.warning(f"Error checking job {job_url}: {str(e)}")
-
-                # Move to next page
-                page_num += 1
-                time.sleep(2)  # Small delay between pages
+                open_tabs = []
+                try:
+                    while (pending_urls or open_tabs) and total_found < max_jobs:
+                        free_slots = self.max_concurrent_pages - len(open_tabs)
+                        if pending_urls and free_slots > 0:
+                            new_urls = pending_urls[:free_slots]
+                            del pending_urls[:free_slots]
+                            open_tabs.extend(zip(new_urls, self._open_pages(new_urls)))
+
+                        job_url, tab = open_tabs.pop(0)
+                        # Get detailed job info
+                        try:
+                            detailed_job = self.get_job_details(job_url, preloaded_page=tab)
+
+                            # Check multiple possible field names for internal application permission
+                            allows_internal = (
+                                detailed_job.get("allows_internal_application", False) or
+                                detailed_job.get("allow_internal_apply", False) or
+                                detailed_job.get("internal_application", False)
+                            )
+
+                            if allows_internal:
+                                self.logger.info(f"Found job that allows internal application: {detailed_job.get('title')} at {detailed_job.get('company')}")
+                                internal_jobs.append(detailed_job)
+                                total_found += 1
+                        except Exception as e:
+                            self.logger.warning(f"Error checking job {job_url}: {str(e)}")
+                        finally:
+                            tab.close()
+                finally:
+                    for _, tab in open_tabs:
+                        tab.close()
 
             self.logger.info(f"Found {len(internal_jobs)} jobs that allow internal applications")
 
@@ -1172,9 +1669,7 @@ class WTTJScraper:
             return internal_jobs
 
         except Exception as e:
-            self.logger.error(f"Error getting internal jobs: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Error getting internal jobs: {str(e)}")
 
             # If in development mode, return test job data
             if self.settings.development_mode:
@@ -1185,85 +1680,41 @@ class WTTJScraper:
 
     def _generate_test_jobs(self, max_jobs: int = 5) -> List[Dict[str, Any]]:
         """Generate test job data for development mode"""
-        test_jobs = []
-        companies = ["TechCorp", "DataSystems", "AILabs", "CloudServices", "DevOps Solutions"]
-        job_titles = ["Python Developer", "Backend Engineer", "Data Scientist", "ML Engineer", "DevOps Engineer"]
-
-        for i in range(min(max_jobs, 5)):
-            company = companies[i]
-            title = job_titles[i]
-            company_slug = company.lower().replace(" ", "-")
-            job_slug = title.lower().replace(" ", "-")
-
-            job = {
-                "id": f"{company_slug}_{job_slug}",
-                "title": title,
-                "company": company,
-                "url": f"https://www.welcometothejungle.com/en/companies/{company_slug}/jobs/{job_slug}",
-                "company_slug": company_slug,
-                "job_slug": job_slug,
-                "description": f"This is a test job for {title} at {company}. We're looking for someone with Python, SQL, and cloud experience.",
-                "requirements": "- 3+ years Python experience\n- SQL knowledge\n- Experience with cloud services\n- Good communication skills",
-                "allows_internal_application": True,
-                "is_premium": False,
-                "location": "Paris, France",
-                "skills": ["Python", "SQL", "AWS", "Git"]
-            }
-            test_jobs.append(job)
+        test_jobs = copy.deepcopy(_TEST_JOBS[:max_jobs])
 
         self.logger.info(f"Generated {len(test_jobs)} test jobs for development mode")
         return test_jobs
 
-    def _accept_cookies(self) -> None:
-        """Handle cookie consent banners"""
+    def _accept_cookies(self) -> bool:
+        """Handle cookie consent banners. Returns True if a consent button was clicked."""
         try:
-            cookie_accept_selectors = [
-                "button:has-text('OK for me')",
-                "button:has-text('Accept all cookies')",
-                "button:has-text('I choose')",
-                "button:has-text('Got it!')",
-                "button[data-testid='cookie-consent-button-accept']"
-            ]
-
-            for selector in cookie_accept_selectors:
-                try:
-                    if self.page.is_visible(selector, timeout=3000):
-                        self.page.click(selector)
-                        self.logger.info(f"Clicked cookie consent button: {selector}")
-                        self.page.wait_for_timeout(1000)
-                        return
-                except Exception as e:
-                    self.logger.warning(f"Error clicking cookie consent button {selector}: {str(e)}")
-
+            button = self._first_match(self.page, self.COOKIE_ACCEPT_SELECTORS, only_visible=True)
+            if button:
+                self.page.locator(f"{button['selector']} >> visible=true").first.click()
+                self.logger.info(f"Clicked cookie consent button: {button['selector']}")
+                self._wait_until_hidden(button["selector"])
+                return True
         except Exception as e:
             self.logger.warning(f"Error handling cookie consent: {str(e)}")
 
         # If we failed to find specific buttons, try a more generic approach
         try:
             # Look for elements that look like cookie banners
-            banner_selectors = [
-                "#cookie-banner",
-                ".cookie-banner",
-                ".cookie-consent",
-                ".cookie-notice",
-                "[data-testid*='cookie']",
-                ".wttj-sc-1c2f42q"  # Common WTTJ class for banners
-            ]
-
-            for selector in banner_selectors:
-                if self.page.is_visible(selector):
-                    # Try to find any button in the banner
-                    buttons = self.page.query_selector_all(f"{selector} button")
-                    if buttons:
-                        # Usually the accept button is the last one
-                        buttons[-1].click()
-                        self.logger.info(f"Clicked button in cookie banner: {selector}")
-                        self.page.wait_for_timeout(1000)
-                        return
+            banner = self._first_match(self.page, self.COOKIE_BANNER_SELECTORS, only_visible=True)
+            if banner:
+                # Try to find any button in the banner
+                buttons = self.page.query_selector_all(f"{banner['selector']} button")
+                if buttons:
+                    # Usually the accept button is the last one
+                    buttons[-1].click()
+                    self.logger.info(f"Clicked button in cookie banner: {banner['selector']}")
+                    self._wait_until_hidden(banner["selector"])
+                    return True
         except Exception as e:
             self.logger.warning(f"Error with generic cookie banner approach: {str(e)}")
 
         self.logger.info("No cookie consent banner found or couldn't interact with it")
+        return False
 
 
 def get_internal_jobs_standalone(query: str = "", location: str = None, radius: int = 20,
@@ -1313,7 +1764,5 @@ def get_internal_jobs_standalone(query: str = "", location: str = None, radius:
         return jobs
 
     except Exception as e:
-        scraper.logger.error(f"Error in get_internal_jobs_standalone: {str(e)}")
-        import traceback
-        scraper.logger.error(traceback.format_exc())
+        scraper.logger.exception(f"Error in get_internal_jobs_standalone: {str(e)}")
         return []
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""
+CSS selectors used to drive the Welcome to the Jungle website.
+
+Selectors are kept here rather than inline so they can be updated, or reloaded
+with importlib.reload, when WTTJ changes its markup.
+"""
+
+# Login form
+LOGIN_EMAIL = [
+    'input[type="email"]',
+    'input[name="email"]',
+    'input[placeholder*="email" i]'
+]
+
+LOGIN_PASSWORD = [
+    'input[type="password"]',
+    'input[name="password"]',
+    'input[placeholder*="password" i]'
+]
+
+LOGIN_SUBMIT = [
+    'button[type="submit"]',
+    'button:has-text("Log in")',
+    'button:has-text("Sign in")',
+    'input[type="submit"]'
+]
+
+# LinkedIn login
+LINKEDIN_LOGIN_BUTTONS = [
+    "button:has-text('Continue with LinkedIn')",
+    "button:has-text('Sign in with LinkedIn')",
+    "button:has-text('Login with LinkedIn')",
+    "a:has-text('Continue with LinkedIn')",
+    "a:has-text('Sign in with LinkedIn')",
+    "a:has-text('Login with LinkedIn')",
+    "a[href*='linkedin']",
+    "button[data-testid='linkedin-button']",
+    "div.linkedin-login-button"
+]
+
+LINKEDIN_EMAIL = [
+    "input[id='username']",
+    "input[name='session_key']",
+    "input[type='email']"
+]
+
+LINKEDIN_PASSWORD = [
+    "input[id='password']",
+    "input[name='session_password']",
+    "input[type='password']"
+]
+
+LINKEDIN_SUBMIT = [
+    "button[type='submit']",
+    "button:has-text('Sign in')",
+    "input[type='submit']"
+]
+
+# Authorization prompts shown by LinkedIn before redirecting back
+LINKEDIN_ALLOW = [
+    "button:has-text('Allow')",
+    "button:has-text('Authorize')",
+    "button:has-text('Accept')",
+    "button:has-text('Continue')",
+    "button[type='submit']"
+]
+
+# Cookie consent banner
+COOKIE_BUTTONS = [
+    "button:has-text('Accept all cookies')",
+    "button:has-text('OK for me')",
+    "button:has-text('Got it!')",
+    "button[data-testid='cookie-consent-button-accept']"
+]
+
+# "Looks like you're in France?" popup
+FRANCE_POPUP_BUTTONS = [
+    "button:has-text('Stay on the current website')",
+    "button:has-text('Stay on this website')",
+    ".modal button:has-text('Stay')",
+    "[role='dialog'] button:has-text('Stay')"
+]
+
+# Generic popups
+POPUP_CLOSE_BUTTONS = [
+    "button[data-testid='modal-close']",
+    "button.modal-close",
+    "button.close",
+    "button[aria-label='Close']",
+    "svg[data-testid='icon-times']"
+]
+
+LOCATION_POPUP_BUTTONS = [
+    "button:has-text('Stay on the current website')",
+    "button:has-text('Stay on this website')",
+    "button:has-text('Continue')",
+    "button:has-text('Accept')",
+    "button:has-text('OK')",
+    "button:has-text('Got it')"
+]
+
+POPUP_BACKDROPS = [
+    ".modal-backdrop",
+    ".overlay",
+    "[data-testid='modal-backdrop']"
+]
+
+# Login verification
+AVATAR = [
+    "a[href='/en/profile']",
+    "img[alt='User avatar']",
+    "a[href*='account']",
+    ".user-profile-icon"
+]
+
+LOGGED_IN_INDICATORS = [
+    "a:has-text('Profile')",
+    "a:has-text('My Account')",
+    "a:has-text('Sign out')",
+    "a:has-text('Log out')"
+]
+
+# Login form still showing, i.e. not logged in
+LOGIN_FORM_INDICATORS = [
+    "input[type='password']",
+    "button:has-text('Log in')",
+    "button:has-text('Sign in')"
+]
+
+LOGIN_FAILURE_INDICATORS = [
+    "div.error-message",
+    "p.error",
+    "input[type='password']"  # If we still see password field, login failed
+]
+
+# Job page
+APPLY_BUTTONS = [
+    "a[data-testid='job-apply-button']",
+    "button[data-testid='job-apply-button']",
+    "a.ais-Highlight",
+    "a[href*='apply']",
+    "button:has-text('Apply')",
+    "div.wttj-sc-1c2f42q a",  # Common WTTJ button class
+    "[role='button']:has-text('Apply')"
+]
+
+# Application form
+APPLICATION_FORM_INDICATORS = [
+    "input[type='file']",
+    "textarea[name*='cover']",
+    "textarea[name*='motivation']",
+    "form[action*='apply']",
+    "input[name='resume']",
+    "[data-testid='application-form']",
+    "div:has-text('Upload your resume')",
+    "div:has-text('Upload your CV')"
+]
+
+# File inputs are read once and classified by their name attribute (see _classify_file_inputs)
+FILE_INPUTS = "input[type='file']"
+CV_UPLOAD_NAMES = ("resume", "cv")
+LETTER_UPLOAD_NAMES = ("letter", "motivation", "cover")
+
+APPLICATION_SUBMIT = [
+    "button[type='submit']",
+    "button:has-text('Submit')",
+    "button:has-text('Apply')",
+    "button:has-text('Send')",
+    "button:has-text('Send application')",
+    "button:has-text('Submit application')",
+    "input[type='submit']"
+]
+
+# Common application form text fields, as (selector, value key) pairs.
+# The keys are resolved against the user's settings in _fill_common_text_fields.
+TEXT_FIELDS = (
+    # Name fields
+    ("input[name*='name' i]", "name"),
+    ("input[name*='full' i][name*='name' i]", "name"),
+    ("input[placeholder*='name' i]", "name"),
+
+    # Email fields
+    ("input[type='email']", "email"),
+    ("input[name*='email' i]", "email"),
+    ("input[placeholder*='email' i]", "email"),
+
+    # Phone fields
+    ("input[type='tel']", "phone"),
+    ("input[name*='phone' i]", "phone"),
+    ("input[placeholder*='phone' i]", "phone"),
+
+    # LinkedIn fields
+    ("input[name*='linkedin' i]", "linkedin"),
+    ("input[placeholder*='linkedin' i]", "linkedin"),
+
+    # Cover letter or message fields (if text input rather than file)
+    ("textarea[name*='cover' i]", "cover_note"),
+    ("textarea[name*='motivation' i]", "cover_note"),
+    ("textarea[name*='message' i]", "cover_note"),
+    ("textarea[placeholder*='cover' i]", "cover_note"),
+    ("textarea[placeholder*='motivation' i]", "cover_note"),
+)
+
+# Submission verification
+# All success messages in one regex, so the selector engine walks the page once
+# instead of once per message variant. Only headings and message elements are checked:
+# a wrapper div's text includes the whole page, e.g. a "Customer Success" job title.
+SUBMISSION_SUCCESS_ELEMENTS = "h1, h2, h3, [role='alert'], [role='status']"
+SUBMISSION_SUCCESS_PATTERN = "application (submitted|received|sent)|thank you"
+SUBMISSION_SUCCESS = f":is({SUBMISSION_SUCCESS_ELEMENTS}):text-matches('{SUBMISSION_SUCCESS_PATTERN}', 'i')"
+
+SUBMISSION_FORM_ELEMENTS = [
+    "input[type='file']",
+    "button[type='submit']",
+    "textarea[name*='cover']"
+]
+
+SUBMISSION_FAILURE_INDICATORS = [
+    "div.error",
+    "p.error",
+    "div:has-text('Error')",
+    "div:has-text('Failed')"
+]
+
+# Elements that signal a page is ready, used instead of waiting for network idle
+APPLY_BUTTON_READY = "a[data-testid='job-apply-button'], button[data-testid='job-apply-button']"
+APPLICATION_FORM_READY = "form, input[type='file']"
+LOGIN_FORM_READY = "button[type='submit'], input[type='submit']"
+LOGIN_EMAIL_READY = ", ".join(LOGIN_EMAIL)
+LINKEDIN_FORM_READY = "input[id='username'], input[name='session_key']"
+LOGGED_IN_READY = ", ".join(AVATAR)
+UPLOAD_FORM_READY = "input[type='file'], form[action*='apply']"
+SUBMISSION_OUTCOME_READY = ", ".join([SUBMISSION_SUCCESS] + SUBMISSION_FAILURE_INDICATORS)
+
+# Comma-joined unions resolved by the browser in one query. The visible=true filter
+# makes .first pick the first visible match instead of the first match in the DOM.
+LOGGED_IN_LOCATOR = ", ".join(AVATAR + LOGGED_IN_INDICATORS) + " >> visible=true"
+LOGIN_FAILURE_LOCATOR = ", ".join(LOGIN_FAILURE_INDICATORS) + " >> visible=true"
+APPLY_BUTTON_LOCATOR = ", ".join(APPLY_BUTTONS) + " >> visible=true"
+APPLICATION_FORM_LOCATOR = ", ".join(APPLICATION_FORM_INDICATORS) + " >> visible=true"
+APPLICATION_SUBMIT_LOCATOR = ", ".join(APPLICATION_SUBMIT) + " >> visible=true"
+
+# In-page helpers prepended to the scripts that resolve these selectors inside the page
+# (the *_JS constants of wttj_scraper and submit_application). Playwright's :has-text()
+# isn't valid CSS, so matchSelector emulates it with a case-insensitive textContent check;
+# a selector the browser rejects matches nothing.
+SELECTOR_HELPERS_JS = """
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const matchSelector = (selector) => {
+        const match = selector.match(/^(.*):has-text\\((['"])(.*)\\2\\)$/);
+        try {
+            if (!match) {
+                return Array.from(document.querySelectorAll(selector));
+            }
+            const text = match[3].toLowerCase();
+            return Array.from(document.querySelectorAll(match[1] || '*'))
+                .filter(el => el.textContent.toLowerCase().includes(text));
+        } catch (e) {
+            return [];
+        }
+    };
+"""
@@ -30,10 +30,14 @@ class Settings(BaseSettings):
     name: str = Field(default="", env="NAME")
     user_email: Optional[str] = Field(default=None, env="USER_EMAIL")
     user_password: Optional[str] = Field(default=None, env="USER_PASSWORD")
+    user_phone: Optional[str] = Field(default=None, env="USER_PHONE")
+    user_linkedin: Optional[str] = Field(default=None, env="USER_LINKEDIN")
 
     # WTTJ credentials
     wttj_username: Optional[str] = Field(default=None, env="WTTJ_USERNAME")
     wttj_password: Optional[str] = Field(default=None, env="WTTJ_PASSWORD")
+    # email: WTTJ login form only, linkedin: try "Continue with LinkedIn" first
+    auth_method: Literal["email", "linkedin"] = Field(default="email", env="AUTH_METHOD")
 
     # LLM settings
     llm_provider: Literal["openai", "anthropic", "google", "local"] = Field(default="google", env="LLM_PROVIDER")
@@ -45,6 +49,28 @@ class Settings(BaseSettings):
     max_jobs_per_run: int = Field(default=5, env="MAX_JOBS_PER_RUN")
     max_applications_per_day: int = Field(default=10, env="MAX_APPLICATIONS_PER_DAY")
     playwright_headless: bool = Field(default=True, env="PLAYWRIGHT_HEADLESS")
+    # Number of worker processes, each running its own browser (capped at the CPU count)
+    max_browsers: int = Field(default=1, env="MAX_BROWSERS")
+    # Run applications in this process with a single browser instead of in worker processes.
+    # Saves the process start-up and pickling, but a stuck application can't be timed out
+    inline_submissions: bool = Field(default=False, env="INLINE_SUBMISSIONS")
+    # Scraper pages loaded in parallel; kept low so WTTJ doesn't see a burst of requests
+    scraper_max_pages: int = Field(default=4, env="SCRAPER_MAX_PAGES")
+    # Browser profile directory for the scraper; when set, cookies and the HTTP cache persist between runs
+    browser_profile_dir: Optional[Path] = Field(default=None, env="BROWSER_PROFILE_DIR")
+    # Ignore job details cached by earlier runs and fetch every job page again
+    refresh_job_details: bool = Field(default=False, env="REFRESH_JOB_DETAILS")
+    # Open a new browser context for every application instead of reusing the worker's pooled ones
+    context_per_job: bool = Field(default=False, env="CONTEXT_PER_JOB")
+    # minimal: no screenshots, failure: all of them for failed submissions and only the final one
+    # for successful submissions, full: keep them all. Screenshots are off by default because every
+    # capture is a full PNG encode in the browser, even if it is never written to disk
+    evidence_level: Literal["minimal", "failure", "full"] = Field(default="minimal", env="EVIDENCE_LEVEL")
+    # Highlight buttons and screenshot them before clicking (always on in development mode)
+    capture_debug_visuals: bool = Field(default=False, env="CAPTURE_DEBUG_VISUALS")
+    screenshot_retention_days: int = Field(default=7, env="SCREENSHOT_RETENTION_DAYS")
+    # Tracebacks are only logged when set to DEBUG
+    log_level: str = Field(default="INFO", env="LOG_LEVEL")
 
     # Paths
     output_dir: Path = Field(default=Path("./output"), env="OUTPUT_DIR")
@@ -395,9 +395,7 @@ class DocumentGenerator:
 
             return output_path
         except Exception as e:
-            logger.error(f"Error generating PDF: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error generating PDF: {str(e)}")
 
             # In development mode, still return the path even if generation failed
             if settings.development_mode:
@@ -472,9 +470,7 @@ def generate_documents_for_job(job: Dict[str, Any], llm_provider: Optional[str]
     try:
         return generator.generate_documents(job)
     except Exception as e:
-        logger.error(f"Error generating documents: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error generating documents: {str(e)}")
 
         if settings.development_mode:
             # In development mode, return mock document paths
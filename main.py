@@ -11,8 +11,7 @@ import json
 import uuid
 from datetime import datetime, date
 import sqlite3
-from typing import Dict, Any
-import time
+from typing import Dict, Any, Optional
 
 import typer
 from loguru import logger
@@ -120,7 +119,11 @@ def has_applied_to_job(db_path: str, job_id: str) -> bool:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    cursor.execute("SELECT COUNT(*) FROM applications WHERE job_id = ?", (job_id,))
+    # Only successful submissions count; failed or unfinished ones are tried again on the next run
+    cursor.execute(
+        "SELECT COUNT(*) FROM applications WHERE job_id = ? AND status IN ('applied', 'success')",
+        (job_id,)
+    )
     count = cursor.fetchone()[0]
 
     conn.close()
@@ -218,13 +221,25 @@ def run(
         jobs_to_process = min(len(jobs), remaining)
         logger.info(f"Processing {jobs_to_process} jobs")
 
+        # Generate documents for every job first, then submit them as one batch
+        # so the worker pool can run several browsers in parallel
+        prepared = []
         for job in jobs[:jobs_to_process]:
-            process_job(job, config)
+            documents = prepare_job(job, config)
+            if documents is not None:
+                prepared.append((job, documents))
+
+        if not prepared:
+            return
+
+        # Record each result as soon as its submission finishes
+        from browser.submit_application import iter_submissions
+        for index, success in iter_submissions(prepared, config):
+            job, _ = prepared[index]
+            record_submission_result(job, success, config)
 
     except Exception as e:
-        logger.error(f"Error in run command: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error in run command: {str(e)}")
 
 
 @app.command()
@@ -327,9 +342,32 @@ def create_profile():
 
 def process_job(job: Dict[str, Any], config: Settings):
     """Process a job listing and submit an application if applicable."""
+    documents = prepare_job(job, config)
+    if documents is None:
+        return False
+
+    # Submit the application
+    from browser.submit_application import submit_application
+    success = submit_application(job, documents, config)
+
+    return record_submission_result(job, success, config)
+
+
+def prepare_job(job: Dict[str, Any], config: Settings) -> Optional[Dict[str, Any]]:
+    """
+    Record a pending application and generate its tailored documents.
+
+    Args:
+        job: Job details dictionary
+        config: Application settings
+
+    Returns:
+        Dictionary with paths to the generated documents, or None if the job should be skipped
+    """
     try:
-        # Extract job details
-        job_id = job.get("job_id", f"job_{int(time.time())}")
+        # Extract job details; the id is stored on the job so the final status update finds the same record.
+        # It comes from the scraped job rather than the clock, since the whole batch is prepared within seconds.
+        job_id = job.setdefault("job_id", job.get("id") or job.get("url") or f"job_{uuid.uuid4().hex}")
         job_title = job.get("title", "Unknown position")
         company = job.get("company", "Unknown company")
         job_url = job.get("url", "")
@@ -339,7 +377,7 @@ def process_job(job: Dict[str, Any], config: Settings):
         # Check if we've already applied
         if has_applied_to_job(config.log_db_path, job_id):
             logger.info(f"Already applied to {job_title} at {company}, skipping")
-            return False
+            return None
 
         # Create application record with safely stringified values
         application = {
@@ -356,10 +394,8 @@ def process_job(job: Dict[str, Any], config: Settings):
             add_application(config.log_db_path, **application)
             logger.info(f"Added application record for {job_title}")
         except Exception as e:
-            logger.error(f"Error adding application to database: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return False
+            logger.exception(f"Error adding application to database: {str(e)}")
+            return None
 
         # Generate tailored documents
         from llm.generate_documents import generate_documents_for_job
@@ -376,38 +412,36 @@ def process_job(job: Dict[str, Any], config: Settings):
             update_application(config.log_db_path, job_id, application_update)
             logger.info(f"Updated application with document paths")
         except Exception as e:
-            logger.error(f"Error updating application with document paths: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error updating application with document paths: {str(e)}")
             # Continue anyway
 
-        # Submit the application
-        from browser.submit_application import submit_application
-        success = submit_application(job, documents, config)
+        return documents
 
-        try:
-            # Final status update
-            if success:
-                logger.info(f"Successfully applied to {job_title} at {company}")
-                status_update = {"status": "applied"}
-            else:
-                logger.warning(f"Failed to submit application to {job_title} at {company}")
-                status_update = {"status": "failed"}
+    except Exception as e:
+        logger.exception(f"Error processing job: {str(e)}")
+        return None
 
-            update_application(config.log_db_path, job_id, status_update)
-        except Exception as e:
-            logger.error(f"Error updating final application status: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-            # Continue anyway
 
-        return success
+def record_submission_result(job: Dict[str, Any], success: bool, config: Settings) -> bool:
+    """Store the final status of a submitted application. Returns the success flag."""
+    job_title = job.get("title", "Unknown position")
+    company = job.get("company", "Unknown company")
+
+    try:
+        # Final status update
+        if success:
+            logger.info(f"Successfully applied to {job_title} at {company}")
+            status_update = {"status": "applied"}
+        else:
+            logger.warning(f"Failed to submit application to {job_title} at {company}")
+            status_update = {"status": "failed"}
 
+        update_application(config.log_db_path, job["job_id"], status_update)
     except Exception as e:
-        logger.error(f"Error processing job: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return False
+        logger.exception(f"Error updating final application status: {str(e)}")
+        # Continue anyway
+
+    return success
 
 
 if __name__ == "__main__":
@@ -4,12 +4,13 @@ Handles logging in, navigating to job pages, and submitting applications with ge
 """
 
 import os
+import re
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from loguru import logger
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 # Get settings
 import sys
@@ -90,16 +91,17 @@ class ApplicationSubmitter:
     def navigate_to_job(self, job_url: str) -> bool:
         """Navigate to the job page."""
         try:
-            self.page.goto(job_url)
-            self.page.wait_for_load_state("networkidle")
+            # Wait for the job title rather than for network idle, which trackers can hold off
+            self.page.goto(job_url, wait_until="domcontentloaded")
+            self.page.wait_for_selector("h1", timeout=10000)
 
-            # Verify we're on the job page
-            title_element = self.page.query_selector("h1")
-            if not title_element:
+            # Verify we're on the job page, finding and reading the title in one call
+            title = self.page.eval_on_selector_all("h1", "els => els.length ? els[0].innerText.trim() : null")
+            if title is None:
                 logger.error(f"Could not find job title on page {job_url}")
                 return False
 
-            logger.info(f"Successfully navigated to job page: {title_element.inner_text().strip()}")
+            logger.info(f"Successfully navigated to job page: {title}")
             return True
 
         except Exception as e:
@@ -290,9 +292,9 @@ class ApplicationSubmitter:
                 # Try to find associated label
                 id_attr = field.get_attribute("id")
                 if id_attr:
-                    label = self.page.query_selector(f"label[for='{id_attr}']")
-                    if label:
-                        label_text = label.inner_text().lower()
+                    label_text = self.page.eval_on_selector_all(
+                        f"label[for='{id_attr}']", "els => els.length ? els[0].innerText.toLowerCase() : ''"
+                    )
 
                 # Fill with appropriate value
                 if any(term in (placeholder + name + label_text).lower() for term in ["linkedin", "github", "website"]):
@@ -333,21 +335,30 @@ class ApplicationSubmitter:
             logger.info("Submitting application...")
             submit_button.click()
 
-            # Wait for submission to complete
-            self.page.wait_for_load_state("networkidle", timeout=20000)
-
-            # Check for success indicators
+            # Success indicators, joined into one XPath union so they are checked in a single query
             success_indicators = [
                 "//h1[contains(text(), 'Thank you')]",
                 "//p[contains(text(), 'application has been submitted')]",
                 "//div[contains(text(), 'successfully')]",
                 "//div[contains(@class, 'success')]"
             ]
+            success_selector = "xpath=" + " | ".join(success_indicators)
+
+            # Wait for submission to complete. Waiting for network idle usually runs into its
+            # timeout because of analytics requests, so wait for a confirmation URL first and
+            # then for a success message
+            try:
+                self.page.wait_for_url(re.compile(r"confirm|success|thank"), timeout=10000)
+            except PlaywrightTimeoutError:
+                try:
+                    self.page.wait_for_selector(success_selector, timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
 
-            for xpath in success_indicators:
-                if self.page.query_selector(f"xpath={xpath}"):
-                    logger.info("Application successfully submitted!")
-                    return True
+            # Check for success indicators
+            if self.page.query_selector(success_selector):
+                logger.info("Application successfully submitted!")
+                return True
 
             # If we didn't find success indicators but also didn't get errors,
             # consider it a tentative success
@@ -141,8 +141,9 @@ def has_applied_to_job(job_id: str) -> bool:
     conn = sqlite3.connect(settings.log_db_path)
     cursor = conn.cursor()
 
+    # Only successful submissions count; failed or unfinished ones are tried again on the next run
     cursor.execute('''
-    SELECT COUNT(*) FROM applications WHERE job_id = ?
+    SELECT COUNT(*) FROM applications WHERE job_id = ? AND status IN ('applied', 'success')
     ''', (job_id,))
 
     count = cursor.fetchone()[0]